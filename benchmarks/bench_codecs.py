@@ -0,0 +1,104 @@
+# benchmarks/bench_codecs.py
+"""
+JSON codec 백엔드 비교 마이크로 벤치마크 (utils/codec.py)
+- stand-in 서버 데이터(FakeStore 응답과 같은 크기)와 DataFactory로 늘린 대용량 목록으로
+  백엔드별 디코딩 / 인코딩 시간 비교
+- 테스트처럼 json()을 여러 번 호출할 때 requests.Response.json()과 JSONResponse(메모이즈) 비교
+
+    python -m benchmarks.bench_codecs --repeat 200
+"""
+
+import argparse
+import statistics
+import time
+
+import requests
+
+from utils.codec import CODECS, JSONResponse, decode
+from utils.data_factory import DataFactory
+from utils.fake_store_server import FakeStore
+
+
+def _best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        func()
+        timings.append(time.perf_counter_ns() - started)
+    return min(timings), statistics.median(timings)
+
+
+def _repeat(repeat, content):
+    # 대용량 목록은 한 번에 수십 ms가 걸리므로 측정 횟수를 줄임
+    return repeat if len(content) < 100_000 else max(3, repeat // 20)
+
+
+def _payloads(large_items):
+    store = FakeStore()
+    factory = DataFactory(seed=7)
+    return {
+        "product": store.products[0],
+        "products": store.products,
+        "carts": store.carts,
+        "users": store.users,
+        f"products x{large_items}": [p.to_dict() for p in factory.products(large_items)],
+    }
+
+
+def _response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = content
+    return response
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSON codec micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--large-items", type=int, default=10_000, help="대용량 목록의 원소 수")
+    parser.add_argument("--calls", type=int, default=3, help="응답 하나에서 json()을 호출하는 횟수")
+    args = parser.parse_args(argv)
+
+    payloads = _payloads(args.large_items)
+    baseline = CODECS["stdlib"]
+    print(f"backends: {', '.join(CODECS)} (orjson 미설치 시 stdlib만 측정)")
+    print(f"{'payload':<18}{'bytes':>10}{'backend':>9}{'loads':>12}{'dumps':>12}{'loads x':>9}{'dumps x':>9}")
+    for name, value in payloads.items():
+        content = baseline.dumps(value)
+        repeat = _repeat(args.repeat, content)
+        base_loads, _ = _best_of(lambda: baseline.loads(content), repeat)
+        base_dumps, _ = _best_of(lambda: baseline.dumps(value), repeat)
+        for codec in CODECS.values():
+            assert codec.loads(codec.dumps(value)) == value
+            loads, _ = _best_of(lambda: codec.loads(content), repeat)
+            dumps, _ = _best_of(lambda: codec.dumps(value), repeat)
+            print(f"{name:<18}{len(content):>10}{codec.name:>9}{loads / 1e3:>10.1f}us{dumps / 1e3:>10.1f}us"
+                  f"{base_loads / loads:>8.1f}x{base_dumps / dumps:>8.1f}x")
+
+    print(f"\njson() {args.calls}회 호출 (응답 1개)")
+    print(f"{'payload':<18}{'requests':>12}" + "".join(f"{'memo ' + c:>14}" for c in CODECS))
+    for name, value in payloads.items():
+        content = baseline.dumps(value)
+        repeat = _repeat(args.repeat, content)
+
+        def plain():
+            response = _response(content)
+            for _ in range(args.calls):
+                response.json()
+
+        row, _ = _best_of(plain, repeat)
+        line = f"{name:<18}{row / 1e3:>10.1f}us"
+        for codec in CODECS.values():
+            def memoized(codec=codec):
+                response = JSONResponse(_response(content), lambda data: decode(codec, data))
+                for _ in range(args.calls):
+                    response.json()
+
+            elapsed, _ = _best_of(memoized, repeat)
+            line += f"{elapsed / 1e3:>12.1f}us"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_columnar.py
+"""
+숫자 필드 불변식 일괄 검증 비용 측정 (utils/columnar.py vs 원소별 Python 루프)
+
+    python -m benchmarks.bench_columnar --items 1000000
+"""
+
+import argparse
+import time
+
+from config.config import Config
+from utils.columnar import check_column, check_invariants, extract_column
+from utils.fake_store_server import FakeStore
+
+
+def _python_loop(products):
+    bad = []
+    for index, product in enumerate(products):
+        rating = product["rating"]
+        if not (0 < product["price"] <= Config.VALIDATION_RULES["price"]["max"]
+                and 0 <= rating["rate"] <= 5 and rating["count"] >= 0):
+            bad.append(index)
+    return bad
+
+
+def _ms(func):
+    started = time.perf_counter_ns()
+    result = func()
+    return (time.perf_counter_ns() - started) / 1e6, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Columnar invariant check benchmark")
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    sample = FakeStore().products
+    products = [sample[i % len(sample)] for i in range(args.items)]
+    fields = ("price", "rating.rate", "rating.count")
+
+    extract_ms, columns = _ms(lambda: [extract_column(products, field) for field in fields])
+    rules_ms, _ = _ms(lambda: [check_column(c, Config.VALIDATION_RULES[c.field]) for c in columns])
+    total_ms, report = _ms(lambda: check_invariants(products, fields=fields))
+    loop_ms, _ = _ms(lambda: _python_loop(products))
+    assert report.ok
+    print(f"{args.items} records")
+    print(f"  column extraction   {extract_ms:>9.1f}ms")
+    print(f"  vectorized rules    {rules_ms:>9.1f}ms")
+    print(f"  check_invariants    {total_ms:>9.1f}ms")
+    print(f"  python loop         {loop_ms:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
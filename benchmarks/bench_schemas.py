@@ -0,0 +1,79 @@
+# benchmarks/bench_schemas.py
+"""
+스키마 검증 원소당 비용 마이크로 벤치마크
+컴파일된 검증 함수(utils/schemas.py)와 스키마를 원소마다 해석하는 방식을 비교
+
+    python -m benchmarks.bench_schemas --items 100000
+"""
+
+import argparse
+import copy
+import statistics
+import time
+
+from utils.fake_store_server import FakeStore
+from utils.schemas import CART, PRODUCT, USER, Optional, _type_name
+
+
+def interpret(spec, value, path, errors):
+    """비교 대상: 스키마 dict를 매번 해석하는 검증"""
+    if isinstance(spec, dict):
+        if type(value) is not dict:
+            errors.append(f"{path}: expected object, got {_type_name(value)}")
+            return
+        for field, field_spec in spec.items():
+            if field not in value:
+                if not isinstance(field_spec, Optional):
+                    errors.append(f"{path}.{field}: missing required field")
+                continue
+            if isinstance(field_spec, Optional):
+                field_spec = field_spec.spec
+            interpret(field_spec, value[field], f"{path}.{field}", errors)
+    elif isinstance(spec, list):
+        if type(value) is not list:
+            errors.append(f"{path}: expected array, got {_type_name(value)}")
+            return
+        for index, item in enumerate(value):
+            interpret(spec[0], item, f"{path}[{index}]", errors)
+    else:
+        types = spec if isinstance(spec, tuple) else (spec,)
+        if type(value) not in types:
+            errors.append(f"{path}: type mismatch, got {_type_name(value)}")
+
+
+def _interpret_many(schema, items):
+    errors = []
+    for index, item in enumerate(items):
+        interpret(schema.spec, item, f"$[{index}]", errors)
+    return errors
+
+
+def _best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        func()
+        timings.append(time.perf_counter_ns() - started)
+    return min(timings), statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Schema validation micro-benchmark")
+    parser.add_argument("--items", type=int, default=100_000, help="검증할 원소 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    store = FakeStore()
+    datasets = {PRODUCT: store.products, CART: store.carts, USER: store.users}
+    print(f"{'schema':<10}{'items':>9}{'compiled':>14}{'interpreted':>14}{'speedup':>9}")
+    for schema, sample in datasets.items():
+        items = [copy.deepcopy(sample[i % len(sample)]) for i in range(args.items)]
+        assert not schema.check_many(items)
+        compiled, _ = _best_of(lambda: schema.check_many(items), args.repeat)
+        interpreted, _ = _best_of(lambda: _interpret_many(schema, items), args.repeat)
+        print(f"{schema.name:<10}{args.items:>9}{compiled / args.items:>10.0f}ns/i"
+              f"{interpreted / args.items:>10.0f}ns/i{interpreted / compiled:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,208 @@ E-commerce API Test Configuration
 FakeStore API를 사용한 테스트 환경 설정
 """
 
+import os
+
 
 class Config:
-    BASE_URL = "https://fakestoreapi.com"
+    # API_BASE_URL=local 이면 로컬 stand-in 서버를 띄워서 테스트 (tests/conftest.py)
+    BASE_URL = os.environ.get("API_BASE_URL", "https://fakestoreapi.com")
+    LOCAL_BASE_URL = "local"
 
-    # 가격 검증 최대값
+    # 숫자 필드 값 범위 규칙 (utils/columnar.py에서 배열 연산으로 일괄 검증)
+    # min/max: 이상/이하, gt: 초과, integer: 정수값, "products[].quantity"는 목록 원소의 필드
     VALIDATION_RULES = {
-        "price": {"max": 1000}
+        "price": {"gt": 0, "max": 1000},
+        "rating.rate": {"min": 0, "max": 5},
+        "rating.count": {"min": 0, "integer": True},
+        "products[].quantity": {"gt": 0, "integer": True}
     }
 
     # 성능 기준 (초)
     PERFORMANCE_THRESHOLD = {
-        "response_time": 2  # 2초
-    }
\ No newline at end of file
+        "response_time": 2,  # 2초 (엔드포인트별 예산이 없을 때 기본값)
+        # 엔드포인트별 응답 시간 예산 (중앙값 기준)
+        "endpoints": {
+            "GET /products": 2,
+            "GET /products/{id}": 1,
+            "GET /products/categories": 1,
+            "GET /carts": 2,
+            "GET /users": 2
+        }
+    }
+
+    # APIClient 커넥션 풀 설정 (requests HTTPAdapter)
+    CONNECTION_POOL = {
+        "pool_connections": 4,  # 호스트별 풀 개수
+        "pool_maxsize": 32,     # 풀당 최대 커넥션 수 (동시에 요청하는 스레드 수 이상)
+        "pool_block": False,    # 풀이 가득 차면 대기하지 않고 임시 커넥션 생성
+        "keep_alive": True
+    }
+
+    # 새 커넥션 비용 줄이기 (utils/connection_cache.py)
+    CONNECTION_CACHE = {
+        "dns_ttl": 60,                               # 초, DNS 조회 결과 재사용 시간
+        "dns_store_path": "reports/dns_cache.json",  # xdist 워커끼리 공유하는 DNS 조회 결과
+        "tls_resumption": os.environ.get("API_TLS_RESUMPTION", "1") == "1"  # TLS 세션 재개 (프로세스 내부)
+    }
+
+    # /auth/login 토큰 캐시 (utils/auth.py, APIClient.authenticate)
+    AUTH = {
+        "login_path": "/auth/login",
+        "store_path": "reports/.auth_tokens.json",  # xdist 워커끼리 공유하는 토큰 (파일 락으로 보호)
+        "token_ttl": 3600,                          # 초, 만료 시각(JWT exp)을 알 수 없는 토큰의 유효 시간
+        "refresh_margin": 60                        # 초, 만료 이 시간 전부터 새로 로그인
+    }
+
+    # JSON 인코딩 / 디코딩 백엔드 (utils/codec.py) - auto면 orjson이 설치된 경우 orjson, 없으면 표준 라이브러리
+    CODEC = {
+        "backend": os.environ.get("API_JSON_CODEC", "auto")  # auto / orjson / stdlib
+    }
+
+    # 비동기 클라이언트 설정
+    ASYNC_CLIENT = {
+        "concurrency": 10,  # 동시 요청 최대 개수
+        "timeout": 30       # 요청당 타임아웃 (초)
+    }
+
+    # 로컬 stand-in 서버 설정 (utils/fake_store_server.py)
+    STAND_IN = {
+        "host": "127.0.0.1",
+        "port": 0,  # 0이면 빈 포트 자동 할당
+        "latency_profile": os.environ.get("STAND_IN_LATENCY", "none"),  # none / lan / wan / slow
+        "fault_profile": os.environ.get("STAND_IN_FAULTS", "none"),     # none / flaky / throttled / chaos
+        "seed": 42
+    }
+
+    # GET 응답 캐시 설정 (utils/response_cache.py) - API_CACHE=1 로 활성화
+    CACHE = {
+        "enabled": os.environ.get("API_CACHE", "0") == "1",
+        "max_entries": 256,
+        "max_bytes": 32 * 1024 * 1024,  # 32MB
+        "ttl": 60                       # 초, 만료 후에는 ETag/Last-Modified로 재검증
+    }
+
+    # 세션 시작 시 GET 응답 미리 받기 (plugins/prefetch.py, API_PREFETCH=0 으로 비활성화)
+    # 대상 경로: @pytest.mark.prefetch(...) + 이전 실행에서 테스트별로 기록한 GET 경로 (pytest cache)
+    PREFETCH = {
+        "enabled": os.environ.get("API_PREFETCH", "1") == "1",
+        "max_workers": 8,               # 동시 요청 수
+        "ttl": 300                      # 초, 스냅샷 응답을 재사용하는 시간
+    }
+
+    # 요청/응답 녹화·재생 카세트 (utils/cassette.py)
+    # API_CASSETTE=record 로 녹화, API_CASSETTE=replay 로 네트워크 없이 재생
+    CASSETTE = {
+        "mode": os.environ.get("API_CASSETTE", "off"),  # off / record / replay
+        "path": os.environ.get("API_CASSETTE_PATH", "cassettes/fakestore")
+    }
+
+    # 부하 테스트 기본값 (utils/load_generator.py, @pytest.mark.load)
+    LOAD = {
+        "rate": 50,          # 초당 요청 수
+        "duration": 5,       # 초
+        "max_workers": 100,  # 동시 요청 스레드 수
+        "max_error_rate": 0.01
+    }
+
+    # 가상 사용자 시나리오 부하 (utils/scenario.py)
+    SCENARIO = {
+        "think_time": (0.5, 2.0),  # 초, 단계 사이 대기 시간 범위
+        "seed": 42,                # 가상 사용자별 데이터 / think time 난수 seed
+        "tick": 0.1,               # 초, 가상 사용자 수 조정 주기
+        "grace_period": 10         # 초, 종료 시 진행 중인 시나리오를 기다리는 시간
+    }
+
+    # 속성 기반 계약 퍼징 (utils/fuzzer.py, @pytest.mark.fuzz - --run-fuzz 옵션으로 실행)
+    FUZZ = {
+        "seed": int(os.environ.get("API_FUZZ_SEED", "1234")),
+        "budget": float(os.environ.get("API_FUZZ_BUDGET", "10")),  # 초, 케이스 생성 / 실행 시간
+        "concurrency": 128,      # 동시 요청 수
+        "max_cases": None,       # 케이스 수 상한 (None이면 시간 예산까지)
+        "shrink_budget": 5       # 초, 실패 케이스 축소에 쓰는 시간
+    }
+
+    # 두 서버 응답 비교 (utils/differ.py)
+    DIFF = {
+        "concurrency": 64,
+        "ids": {"products": 20, "carts": 7, "users": 10},  # 단건 조회를 비교할 id 범위 (1 ~ N)
+        # 무시할 JSON 경로: "*.date" (모든 엔드포인트) 또는 ("GET /carts*", "$[*].date")
+        "ignore": [],
+        "max_differences": 20  # 경로 하나에서 보고하는 필드 차이 최대 개수
+    }
+
+    # 요청 단계별 지연 시간 히스토그램 (utils/timing.py, plugins/latency.py)
+    TIMING = {
+        "report_path": "reports/latency_histograms.json",
+        "summary": os.environ.get("API_TIMING_SUMMARY", "1") == "1"  # 테스트 종료 시 요약 출력
+    }
+
+    # 테스트 / 요청 결과 JSONL 기록 (utils/result_sink.py, plugins/results.py) - API_RESULTS=1 로 활성화
+    # python -m utils.report_builder 로 요약 HTML 생성
+    RESULTS = {
+        "enabled": os.environ.get("API_RESULTS", "0") == "1",
+        "path": os.environ.get("API_RESULTS_PATH", "reports/results.jsonl"),
+        "flush_every": 512,                 # 버퍼에 모았다가 한 번에 append하는 레코드 수
+        "summary_path": "reports/summary.html",
+        "trend_buckets": 120                # 지연 시간 추이 그래프의 최대 구간 수
+    }
+
+    # 클라이언트 오버헤드 프로파일링 (utils/profiler.py, plugins/profiler.py) - API_PROFILE=1 로 활성화
+    # 테스트별 wall / 네트워크 대기 / 요청 처리·디코딩·검증 CPU 시간 + 샘플링 스택(folded 형식)
+    PROFILE = {
+        "enabled": os.environ.get("API_PROFILE", "0") == "1",
+        "sampling": True,          # 테스트 스레드 스택 샘플링
+        "sample_interval": 0.005,  # 초
+        "max_depth": 64,           # 샘플당 최대 프레임 수
+        "report_path": "reports/client_profile.json",
+        "folded_path": "reports/client_profile.folded",  # flamegraph.pl / speedscope 입력
+        "top": 15                  # 요약에 출력하는 테스트 / 프레임 수
+    }
+
+    # 벤치마크 회귀 테스트 (utils/benchmark.py, @pytest.mark.benchmark)
+    BENCHMARK = {
+        "rounds": 20,                  # 측정 횟수
+        "warmup": 3,                   # 측정 전 워밍업 횟수
+        "alpha": 0.01,                 # Mann-Whitney 유의 수준
+        "min_regression": 0.10,        # 중앙값이 10% 이상 느려졌을 때만 회귀로 판정
+        "bootstrap_iterations": 2000,
+        "baseline_path": "benchmarks/baseline.json"
+    }
+
+    # xdist 실행 시간 기반 스케줄링 (plugins/scheduling.py, --duration-scheduling)
+    SCHEDULING = {
+        "history_path": "reports/test_durations.json",  # 테스트별 실행 시간 기록
+        "smoothing": 0.5,         # 새 실행 시간 반영 비율 (지수 이동 평균)
+        "default_duration": 0.5   # 기록이 없는 테스트의 예상 시간 (초, 기록이 있으면 기록된 시간의 중앙값)
+    }
+
+    # 재시도 / 적응형 동시성 제어 (utils/resilience.py) - API_RESILIENCE=1 로 활성화
+    # 기본값은 꺼짐: 기능 테스트가 5xx / 429 응답을 재시도로 가리지 않도록 함
+    RESILIENCE = {
+        "enabled": os.environ.get("API_RESILIENCE", "0") == "1",
+        "max_retries": 3,
+        "backoff_base": 0.1,               # 초, full jitter 지수 백오프
+        "backoff_cap": 5.0,
+        "max_retry_after": 30,             # Retry-After가 이보다 길면 재시도하지 않음 (초)
+        "retry_budget_ratio": 0.2,         # 요청 대비 재시도 비율 상한
+        "retry_budget_min_per_second": 5,  # 요청 수가 적어도 초당 허용하는 재시도 수
+        "initial_limit": 8,                # AIMD 동시 요청 수 초기값 / 최소 / 최대
+        "min_limit": 1,
+        "max_limit": 64,
+        "breaker_failure_threshold": 5,    # 연속 실패 시 서킷 open
+        "breaker_reset_timeout": 10        # open 유지 시간 (초)
+    }
+
+    # 페이지 단위 목록 조회 (APIClient.iter_collection, utils/pagination.py)
+    PAGINATION = {
+        "page_size": 50,          # 페이지당 원소 수 (limit)
+        "prefetch": 4,            # 동시에 요청하거나 받아두는 다음 페이지 수 (버퍼 상한)
+        "limit_param": "limit",
+        "offset_param": "offset"
+    }
+
+    # 스트리밍 JSON 검증 설정 (APIClient.iter_json / validate_stream)
+    STREAMING = {
+        "chunk_size": 64 * 1024,               # 소켓에서 한 번에 읽는 바이트 수
+        "max_item_bytes": 16 * 1024 * 1024     # 배열 원소 하나의 최대 크기 (UTF-8 바이트 수)
+    }
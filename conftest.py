@@ -0,0 +1,17 @@
+"""
+pytest 플러그인 등록
+각 플러그인은 plugins/ 아래에 있음
+"""
+
+pytest_plugins = [
+    "plugins.benchmark",
+    "plugins.client_stats",
+    "plugins.fuzz",
+    "plugins.latency",
+    "plugins.load",
+    "plugins.prefetch",
+    "plugins.profiler",
+    "plugins.results",
+    "plugins.scheduling",
+    "pytester",  # plugin 테스트 (tests/test_prefetch.py)
+]
@@ -0,0 +1,132 @@
+# plugins/benchmark.py
+"""
+@pytest.mark.benchmark 벤치마크 회귀 테스트 플러그인
+
+    @pytest.mark.benchmark(endpoint="GET /products")
+    def test_product_response_time(self, benchmark):
+        response = benchmark(self.client.get, "/products")
+        assert benchmark.median < benchmark.budget
+
+- 기본 실행: 1회만 측정 (일반 테스트와 동일)
+- --benchmark: warmup 후 N회 측정하고 기준선과 통계적으로 비교, 유의한 회귀면 실패
+- --benchmark-save: 측정 결과를 기준선 파일(Config.BENCHMARK['baseline_path'])에 저장
+"""
+
+import time
+
+import pytest
+
+from config.config import Config
+from utils.benchmark import BaselineStore, budget_for, compare, summarize
+
+_results = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "benchmark regression testing")
+    group.addoption("--benchmark", action="store_true", default=False,
+                    help="@pytest.mark.benchmark 테스트를 warmup 후 여러 번 실행하고 기준선과 비교")
+    group.addoption("--benchmark-save", action="store_true", default=False,
+                    help="측정 결과를 기준선으로 저장 (--benchmark 포함)")
+    group.addoption("--benchmark-rounds", type=int, default=None,
+                    help="측정 횟수 (기본값: Config.BENCHMARK['rounds'])")
+
+
+class BenchmarkFixture:
+    def __init__(self, name, endpoint, rounds, warmup, baseline):
+        self.name = name
+        self.endpoint = endpoint
+        self.rounds = rounds
+        self.warmup = warmup
+        self.baseline = baseline
+        self.budget = budget_for(endpoint)
+        self.samples = []
+        self.stats = None
+        self.comparison = None
+
+    @property
+    def median(self):
+        return self.stats["median"]
+
+    def __call__(self, func, *args, **kwargs):
+        result = None
+        for _ in range(self.warmup):
+            func(*args, **kwargs)
+        for _ in range(self.rounds):
+            started = time.perf_counter_ns()
+            result = func(*args, **kwargs)
+            self.samples.append((time.perf_counter_ns() - started) / 1e9)
+        self.stats = summarize(self.samples)
+        self._check_regression()
+        return result
+
+    def _check_regression(self):
+        if self.baseline is None or self.rounds < 2:
+            return
+        self.comparison = compare(self.samples, self.baseline["samples"])
+        if self.comparison["regression"]:
+            low, high = self.comparison["ci"]
+            pytest.fail(
+                f"{self.endpoint} regressed: median {self.median * 1000:.1f}ms vs baseline "
+                f"{self.baseline['median'] * 1000:.1f}ms (x{self.comparison['median_ratio']:.2f}, "
+                f"95% CI x{low:.2f}-x{high:.2f}, p={self.comparison['p_value']:.4f})"
+            )
+
+
+@pytest.fixture
+def benchmark(request):
+    marker = request.node.get_closest_marker("benchmark")
+    if marker is None:
+        pytest.fail("benchmark fixture requires @pytest.mark.benchmark")
+    config = request.config
+    endpoint = marker.kwargs.get("endpoint", request.node.name)
+    enabled = config.getoption("--benchmark") or config.getoption("--benchmark-save")
+    if enabled:
+        settings = Config.BENCHMARK
+        rounds = config.getoption("--benchmark-rounds") or marker.kwargs.get("rounds", settings["rounds"])
+        warmup = marker.kwargs.get("warmup", settings["warmup"])
+        baseline = None if config.getoption("--benchmark-save") else BaselineStore().get(request.node.nodeid)
+    else:
+        rounds, warmup, baseline = 1, 0, None
+
+    fixture = BenchmarkFixture(request.node.nodeid, endpoint, rounds, warmup, baseline)
+    yield fixture
+    if enabled and fixture.samples:
+        _results[fixture.name] = {"endpoint": endpoint, "samples": fixture.samples,
+                                  "comparison": fixture.comparison}
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["benchmark_results"] = _results
+        return
+    if config.getoption("--benchmark-save") and _results:
+        store = BaselineStore()
+        for name, result in _results.items():
+            store.update(name, result["endpoint"], result["samples"])
+        store.save()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    _results.update(getattr(node, "workeroutput", {}).get("benchmark_results", {}))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    terminalreporter.write_sep("-", "benchmarks")
+    terminalreporter.write_line(f"{'endpoint':<28}{'rounds':>7}{'median':>10}{'p90':>10}{'budget':>9}  vs baseline")
+    for name, result in sorted(_results.items()):
+        stats = summarize(result["samples"])
+        comparison = result["comparison"]
+        verdict = "-"
+        if comparison:
+            verdict = f"x{comparison['median_ratio']:.2f} (p={comparison['p_value']:.3f})"
+        terminalreporter.write_line(
+            f"{result['endpoint']:<28}{stats['rounds']:>7}{stats['median'] * 1000:>8.1f}ms"
+            f"{stats['p90'] * 1000:>8.1f}ms{budget_for(result['endpoint']):>8}s  {verdict}"
+        )
+    if terminalreporter.config.getoption("--benchmark-save"):
+        terminalreporter.write_line(f"baseline saved: {Config.BENCHMARK['baseline_path']}")
@@ -0,0 +1,74 @@
+# plugins/client_stats.py
+"""
+APIClient 통계 요약 플러그인
+- 커넥션 재사용 / handshake 절약 / TLS 세션 재개 / DNS 캐시 통계 (utils.timing.connection_stats)
+- API_CACHE=1 실행 시 응답 캐시 hit/miss 통계 (utils.response_cache)
+- 재시도 / 429 / 재시도 예산 소진 / 서킷 차단 횟수 (utils.resilience)
+xdist 워커의 통계는 workeroutput으로 컨트롤러에 전달해 합산
+"""
+
+import pytest
+
+from config.config import Config
+from utils.resilience import get_shared_policy
+from utils.response_cache import get_shared_cache
+from utils.timing import ConnectionStats, connection_stats
+
+_connections = ConnectionStats()
+_cache_stats = {}
+_resilience_stats = {}
+
+
+def _merge_counts(target, stats):
+    for key, value in stats.items():
+        if key != "hit_ratio":
+            target[key] = target.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    cache_stats = get_shared_cache().stats() if Config.CACHE["enabled"] else {}
+    policy = get_shared_policy()
+    resilience_stats = dict(policy.stats) if policy is not None else {}
+    if hasattr(config, "workerinput"):
+        config.workeroutput["connection_stats"] = connection_stats.to_dict()
+        config.workeroutput["cache_stats"] = cache_stats
+        config.workeroutput["resilience_stats"] = resilience_stats
+        return
+    _connections.merge(connection_stats.to_dict())
+    _merge_counts(_cache_stats, cache_stats)
+    _merge_counts(_resilience_stats, resilience_stats)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+    _connections.merge(output.get("connection_stats", {}))
+    _merge_counts(_cache_stats, output.get("cache_stats", {}))
+    _merge_counts(_resilience_stats, output.get("resilience_stats", {}))
+
+
+def pytest_terminal_summary(terminalreporter):
+    summary = _connections.summary()
+    if summary["requests"]:
+        terminalreporter.write_sep("-", "connection pool")
+        terminalreporter.write_line(
+            f"requests={summary['requests']} new_connections={summary['new_connections']} "
+            f"tls_handshakes={summary['tls_handshakes']} (resumed={summary['tls_resumed']} "
+            f"full={summary['tls_full']}) dns_cached={summary['dns_cached']} reused={summary['reused']} "
+            f"reuse_ratio={summary['reuse_ratio']:.1%} handshakes_avoided={summary['handshakes_avoided']} "
+            f"estimated_saved={summary['estimated_saved_ms']:.1f}ms"
+        )
+    if _cache_stats:
+        lookups = _cache_stats["hits"] + _cache_stats["misses"]
+        hit_ratio = (_cache_stats["hits"] + _cache_stats["revalidated"]) / lookups if lookups else 0.0
+        terminalreporter.write_sep("-", "response cache")
+        terminalreporter.write_line(
+            f"hits={_cache_stats['hits']} misses={_cache_stats['misses']} "
+            f"revalidated={_cache_stats['revalidated']} evictions={_cache_stats['evictions']} "
+            f"invalidations={_cache_stats['invalidations']} hit_ratio={hit_ratio:.1%} "
+            f"bytes_saved={_cache_stats['bytes_saved']}"
+        )
+    if _resilience_stats.get("retries") or _resilience_stats.get("circuit_rejected"):
+        terminalreporter.write_sep("-", "retries")
+        terminalreporter.write_line(" ".join(f"{key}={value}" for key, value in _resilience_stats.items()))
@@ -0,0 +1,51 @@
+# plugins/fuzz.py
+"""
+@pytest.mark.fuzz 계약 퍼징 플러그인 (utils/fuzzer.py)
+
+    @pytest.mark.fuzz(budget=10)
+    def test_contract_fuzz(fuzz_report):
+        assert fuzz_report.ok, fuzz_report.format()
+
+fuzz 마커가 붙은 테스트는 --run-fuzz 옵션을 줄 때만 실행
+--fuzz-seed / --fuzz-budget으로 CI에서 seed와 시간 예산을 지정 (실패 시 출력된 seed로 같은 케이스 재현)
+"""
+
+import pytest
+
+from utils.fuzzer import Fuzzer
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fuzz", "property-based contract fuzzing")
+    group.addoption("--run-fuzz", action="store_true", default=False,
+                    help="@pytest.mark.fuzz 테스트 실행")
+    group.addoption("--fuzz-seed", type=int, default=None,
+                    help="마커의 seed 대신 사용할 seed (기본값: Config.FUZZ['seed'])")
+    group.addoption("--fuzz-budget", type=float, default=None,
+                    help="마커의 budget 대신 사용할 실행 시간 (초)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-fuzz"):
+        return
+    skip_fuzz = pytest.mark.skip(reason="fuzz test - run with --run-fuzz")
+    for item in items:
+        if item.get_closest_marker("fuzz") is not None:
+            item.add_marker(skip_fuzz)
+
+
+@pytest.fixture
+def fuzz_report(request):
+    """fuzz 마커 설정으로 퍼징을 실행하고 FuzzReport 반환"""
+    marker = request.node.get_closest_marker("fuzz")
+    if marker is None:
+        pytest.fail("fuzz_report fixture requires @pytest.mark.fuzz")
+    options = dict(marker.kwargs)
+    seed = request.config.getoption("--fuzz-seed")
+    budget = request.config.getoption("--fuzz-budget")
+    report = Fuzzer(seed=seed if seed is not None else options.get("seed"),
+                    budget=budget or options.get("budget"),
+                    concurrency=options.get("concurrency"),
+                    max_cases=options.get("max_cases")).run()
+    print("\n" + report.format())
+    return report
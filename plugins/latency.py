@@ -0,0 +1,50 @@
+# plugins/latency.py
+"""
+요청 단계별 지연 시간 히스토그램 집계 플러그인
+- 각 프로세스(xdist 워커 포함)가 utils.timing.recorder에 기록
+- xdist 워커는 세션 종료 시 히스토그램을 workeroutput으로 컨트롤러에 전달하고 컨트롤러에서 merge
+- 세션 종료 시 Config.TIMING['report_path']에 JSON으로 저장하고 요약 출력
+"""
+
+import json
+import os
+
+import pytest
+
+from config.config import Config
+from utils.timing import LatencyRecorder, recorder
+
+_merged = LatencyRecorder()
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["latency_histograms"] = recorder.to_dict()
+        return
+    _merged.merge(recorder)
+    if not _merged.endpoints:
+        return
+    path = Config.TIMING["report_path"]
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(_merged.to_dict(), f)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist 컨트롤러: 종료된 워커의 히스토그램 merge"""
+    data = getattr(node, "workeroutput", {}).get("latency_histograms")
+    if data:
+        _merged.merge(LatencyRecorder.from_dict(data))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not Config.TIMING["summary"] or not _merged.endpoints:
+        return
+    terminalreporter.write_sep("-", "request latency by phase (mean)")
+    for line in _merged.format().splitlines():
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"histograms: {Config.TIMING['report_path']}")
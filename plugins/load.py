@@ -0,0 +1,56 @@
+# plugins/load.py
+"""
+@pytest.mark.load 부하 테스트 플러그인
+
+    @pytest.mark.load(rate=100, duration=10, endpoints=["GET /products", "GET /carts"])
+    def test_catalog_under_load(load_report):
+        assert load_report.error_rate < 0.01
+
+    # POST/PUT 본문은 utils/data_factory.py로 생성 (payloads="products" / "carts" / "users", seed)
+    @pytest.mark.load(rate=50, endpoints=["POST /carts"], payloads="carts", seed=7)
+
+load 마커가 붙은 테스트는 --run-load 옵션을 줄 때만 실행
+"""
+
+import pytest
+
+from config.config import Config
+from utils.data_factory import DataFactory
+from utils.load_generator import LoadGenerator
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("load", "open-loop load testing")
+    group.addoption("--run-load", action="store_true", default=False,
+                    help="@pytest.mark.load 테스트 실행")
+    group.addoption("--load-rate", type=float, default=None,
+                    help="마커의 rate 대신 사용할 초당 요청 수")
+    group.addoption("--load-duration", type=float, default=None,
+                    help="마커의 duration 대신 사용할 실행 시간 (초)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-load"):
+        return
+    skip_load = pytest.mark.skip(reason="load test - run with --run-load")
+    for item in items:
+        if item.get_closest_marker("load") is not None:
+            item.add_marker(skip_load)
+
+
+@pytest.fixture
+def load_report(request):
+    """load 마커 설정으로 부하를 발생시키고 LoadReport 반환"""
+    marker = request.node.get_closest_marker("load")
+    if marker is None:
+        pytest.fail("load_report fixture requires @pytest.mark.load")
+    options = dict(marker.kwargs)
+    rate = request.config.getoption("--load-rate") or options.get("rate", Config.LOAD["rate"])
+    duration = request.config.getoption("--load-duration") or options.get("duration", Config.LOAD["duration"])
+    payloads = None
+    if "payloads" in options:
+        payloads = getattr(DataFactory(options.get("seed", 42)), options["payloads"])()
+    report = LoadGenerator(options.get("endpoints", ["GET /products"]), rate=rate, duration=duration,
+                           max_workers=options.get("max_workers"), payloads=payloads).run()
+    print("\n" + report.format())
+    return report
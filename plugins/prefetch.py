@@ -0,0 +1,165 @@
+# plugins/prefetch.py
+"""
+세션 시작 시 GET 응답 미리 받기 (prefetch) 플러그인
+
+    @pytest.mark.prefetch("/products", "/products/categories")
+    class TestProductAPI: ...
+
+- 대상 경로: prefetch 마커 + 이전 실행에서 테스트별로 기록한 GET 경로 (pytest cache "prefetch/paths")
+- 선택된 테스트들이 필요로 하는 경로를 세션 시작 시 한 번에 동시 조회해 스냅샷(ResponseCache)에 저장
+- 테스트 실행 중에는 세션 APIClient가 스냅샷의 응답을 반환하므로 테스트 본문은 네트워크를 기다리지 않음
+- pytest-xdist 워커는 어떤 테스트를 받을지 미리 알 수 없으므로 세션 시작 시 전체를 받지 않고,
+  테스트를 실행하기 직전에 그 테스트의 경로 중 아직 받지 않은 경로만 조회 (워커 수만큼 요청이 늘지 않음)
+- 쓰기 요청(POST/PUT/DELETE)이 발생하면 같은 리소스의 스냅샷은 무효화
+- benchmark / load 마커가 붙은 테스트는 실제 요청 시간을 측정해야 하므로 스냅샷을 사용하지 않음
+Config.PREFETCH['enabled'] (API_PREFETCH=0)로 비활성화
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config.config import Config
+from utils.api_client import WRITE_METHODS
+from utils.response_cache import ResponseCache
+
+CACHE_KEY = "prefetch/paths"
+EXCLUDED_MARKERS = ("benchmark", "load")
+
+_recorded = {}   # nodeid -> 이번 실행에서 요청한 GET 경로
+_current = None  # 실행 중인 테스트 nodeid
+_snapshot = None
+_fetched = set()  # xdist 워커: 이미 조회한 경로
+_summary = {}
+
+
+def _eligible(item):
+    return not any(item.get_closest_marker(name) for name in EXCLUDED_MARKERS)
+
+
+def _planned_paths(item, recorded_map):
+    paths = set(recorded_map.get(item.nodeid, ()))
+    for marker in item.iter_markers("prefetch"):
+        paths.update(marker.args)
+    return paths
+
+
+def _record(method, path, response):
+    if _current is not None and method == "GET":
+        _recorded.setdefault(_current, set()).add(path)
+
+
+def _prefetch(client, paths, snapshot):
+    """paths를 동시에 조회해 200 응답만 스냅샷에 저장 (실패한 경로는 테스트에서 다시 요청)"""
+
+    def fetch(path):
+        try:
+            response = client.get(path)
+        except Exception:
+            return False
+        snapshot.store(path, response)
+        return response.status_code == 200
+
+    with ThreadPoolExecutor(max_workers=Config.PREFETCH["max_workers"]) as executor:
+        return sum(executor.map(fetch, sorted(paths)))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prefetch_snapshot(request, api_client):
+    """선택된 테스트들이 필요로 하는 GET 응답 스냅샷 (비활성화 시 None)"""
+    global _snapshot
+    config = request.config
+    cache = getattr(config, "cache", None)
+    recorded_map = cache.get(CACHE_KEY, {}) if cache is not None else {}
+
+    def on_request(method, path, response):
+        _record(method, path, response)
+        if method in WRITE_METHODS and snapshot is not None:
+            snapshot.invalidate(path)
+
+    snapshot = None
+    api_client.listeners.append(on_request)
+    if Config.PREFETCH["enabled"]:
+        paths = set()
+        for item in request.session.items:
+            if _eligible(item):
+                paths |= _planned_paths(item, recorded_map)
+        if paths:
+            snapshot = ResponseCache(max_entries=max(len(paths), 1), ttl=Config.PREFETCH["ttl"])
+            if not hasattr(config, "workerinput"):
+                # 단일 프로세스: 모든 테스트를 이 프로세스가 실행하므로 세션 시작 시 한 번에 조회
+                _fetch_into(api_client, paths, snapshot)
+    _snapshot = snapshot
+    yield snapshot
+    api_client.listeners.remove(on_request)
+    api_client.snapshot = None
+
+
+def _fetch_into(client, paths, snapshot):
+    _fetched.update(paths)
+    started = time.perf_counter()
+    fetched = _prefetch(client, paths, snapshot)
+    _summary["paths"] = _summary.get("paths", 0) + len(paths)
+    _summary["fetched"] = _summary.get("fetched", 0) + fetched
+    _summary["elapsed"] = _summary.get("elapsed", 0) + time.perf_counter() - started
+
+
+@pytest.fixture(autouse=True)
+def _serve_prefetched(request, prefetch_snapshot, api_client):
+    """테스트 실행 동안 세션 클라이언트가 스냅샷 응답을 사용하도록 설정"""
+    global _current
+    _current = request.node.nodeid
+    if prefetch_snapshot is not None and _eligible(request.node):
+        if hasattr(request.config, "workerinput"):
+            # xdist 워커: 이 워커가 실행하는 테스트의 경로만 조회
+            cache = getattr(request.config, "cache", None)
+            recorded_map = cache.get(CACHE_KEY, {}) if cache is not None else {}
+            missing = _planned_paths(request.node, recorded_map) - _fetched
+            if missing:
+                _fetch_into(api_client, missing, prefetch_snapshot)
+        api_client.snapshot = prefetch_snapshot
+    yield
+    api_client.snapshot = None
+    _current = None
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if _snapshot is not None:
+        _summary["served"] = _snapshot.stats()["hits"]
+    recorded = {nodeid: sorted(paths) for nodeid, paths in _recorded.items()}
+    if hasattr(config, "workerinput"):
+        config.workeroutput["prefetch_recorded"] = recorded
+        config.workeroutput["prefetch_summary"] = dict(_summary)
+        return
+    _save(config, recorded)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+    _save(node.config, output.get("prefetch_recorded", {}))
+    # 워커마다 자기가 실행한 테스트의 경로만 조회하므로 합산 (elapsed는 가장 오래 걸린 워커)
+    for key, value in output.get("prefetch_summary", {}).items():
+        _summary[key] = max(_summary.get(key, 0), value) if key == "elapsed" else _summary.get(key, 0) + value
+
+
+def _save(config, recorded):
+    """이번에 실행한 테스트의 기록만 갱신하고 나머지 테스트의 기록은 유지"""
+    cache = getattr(config, "cache", None)
+    if cache is None or not recorded:
+        return
+    recorded_map = cache.get(CACHE_KEY, {})
+    recorded_map.update(recorded)
+    cache.set(CACHE_KEY, recorded_map)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _summary:
+        return
+    terminalreporter.write_sep("-", "prefetch")
+    terminalreporter.write_line(
+        f"paths={_summary.get('paths', 0)} fetched={_summary.get('fetched', 0)} "
+        f"elapsed={_summary.get('elapsed', 0) * 1000:.1f}ms served_from_snapshot={_summary.get('served', 0)}"
+    )
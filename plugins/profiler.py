@@ -0,0 +1,89 @@
+# plugins/profiler.py
+"""
+클라이언트 오버헤드 프로파일링 플러그인 (API_PROFILE=1)
+- 테스트 call 단계마다 utils.profiler의 프로파일 시작 / 종료
+- xdist 워커는 테스트별 프로파일과 folded 스택을 workeroutput으로 컨트롤러에 전달
+- 세션 종료 시 Config.PROFILE['report_path'](JSON)와 folded_path(flamegraph 입력)에 저장하고 요약 출력
+    flamegraph.pl reports/client_profile.folded > flamegraph.svg
+"""
+
+import json
+import os
+from collections import Counter
+
+import _pytest
+import pluggy
+import pytest
+
+from config.config import Config
+from utils.profiler import format_profiles, get_shared_profiler, hottest_frames
+
+# 테스트 함수 아래의 pytest / pluggy 호출 프레임은 샘플에서 생략
+_HARNESS = tuple(os.path.dirname(module.__file__) + os.sep for module in (_pytest, pluggy))
+_profiles = []
+_stacks = Counter()
+
+
+@pytest.hookimpl(hookwrapper=True, trylast=True)
+def pytest_runtest_call(item):
+    # trylast: 출력 캡처 등 다른 hookwrapper 안쪽에서 테스트 함수 실행 구간만 측정
+    profiler = get_shared_profiler()
+    if profiler is None:
+        yield
+        return
+    if profiler.sampler is not None:
+        profiler.sampler.harness = _HARNESS
+    profiler.begin(item.nodeid)
+    try:
+        yield
+    finally:
+        profiler.end()
+
+
+def pytest_sessionfinish(session):
+    profiler = get_shared_profiler()
+    if profiler is None:
+        return
+    profiler.close()
+    profiles = [profile.to_dict() for profile in profiler.profiles]
+    stacks = profiler.sampler.stacks if profiler.sampler is not None else Counter()
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["client_profiles"] = profiles
+        config.workeroutput["client_stacks"] = dict(stacks)
+        return
+    _profiles.extend(profiles)
+    _stacks.update(stacks)
+    if not _profiles:
+        return
+    path = Config.PROFILE["report_path"]
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"tests": _profiles, "hottest": hottest_frames(_stacks, Config.PROFILE["top"])}, f, indent=2)
+    profiler.write_folded(Config.PROFILE["folded_path"], _stacks)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist 컨트롤러: 종료된 워커의 프로파일 / 스택 합산"""
+    output = getattr(node, "workeroutput", {})
+    _profiles.extend(output.get("client_profiles", []))
+    _stacks.update(output.get("client_stacks", {}))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not Config.PROFILE["enabled"] or not _profiles:
+        return
+    terminalreporter.write_sep("-", "client overhead by test")
+    for line in format_profiles(_profiles).splitlines():
+        terminalreporter.write_line(line)
+    hottest = hottest_frames(_stacks, Config.PROFILE["top"])
+    if hottest:
+        total = sum(_stacks.values())
+        terminalreporter.write_sep("-", f"hottest frames ({total} samples)")
+        for frame, count in hottest:
+            terminalreporter.write_line(f"{count / total:6.1%} {count:6d}  {frame}")
+    terminalreporter.write_line(
+        f"profile: {Config.PROFILE['report_path']} flamegraph: {Config.PROFILE['folded_path']}")
@@ -0,0 +1,57 @@
+# plugins/results.py
+"""
+테스트 / 요청 결과 JSONL 기록 플러그인 (API_RESULTS=1)
+- 컨트롤러(또는 단일 프로세스)가 실행 시작 시 결과 파일을 비움
+- 테스트를 실행한 프로세스가 테스트 결과와 요청 레코드를 기록 (요청 레코드에는 실행 중인 테스트 nodeid 포함)
+  xdist 컨트롤러가 다시 받는 워커의 리포트는 중복이므로 기록하지 않음
+- 요약 HTML: python -m utils.report_builder
+"""
+
+import time
+
+import pytest
+
+from config.config import Config
+from utils.result_sink import get_shared_sink
+
+
+def pytest_configure(config):
+    sink = get_shared_sink()
+    if sink is None or hasattr(config, "workerinput"):
+        return
+    # 워커가 시작되기 전에 실행되므로 워커의 요청 레코드가 지워지지 않음
+    sink.truncate()
+    sink.write({"type": "run", "ts": time.time()})
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    sink = get_shared_sink()
+    if sink is not None:
+        sink.current_test = item.nodeid
+    yield
+    if sink is not None:
+        sink.current_test = None
+
+
+def pytest_runtest_logreport(report):
+    sink = get_shared_sink()
+    if sink is None or getattr(report, "node", None) is not None:
+        return
+    # call 단계 결과 + setup/teardown 실패(또는 skip)만 기록
+    if report.when == "call" or not report.passed:
+        sink.test(report.nodeid, report.outcome, report.duration, report.when)
+
+
+def pytest_sessionfinish(session):
+    sink = get_shared_sink()
+    if sink is not None:
+        sink.flush()
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not Config.RESULTS["enabled"]:
+        return
+    terminalreporter.write_sep("-", "results")
+    terminalreporter.write_line(
+        f"results: {Config.RESULTS['path']} (summary: python -m utils.report_builder {Config.RESULTS['path']})")
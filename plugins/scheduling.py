@@ -0,0 +1,186 @@
+# plugins/scheduling.py
+"""
+xdist 실행 시간 기반 스케줄링 플러그인
+
+    pytest tests/ -n 16 --duration-scheduling
+
+- 매 실행마다 테스트별 실행 시간(setup + call + teardown)을 Config.SCHEDULING['history_path']에 기록 (지수 이동 평균)
+- --duration-scheduling이면 기록을 바탕으로 작업 단위를 만들어 오래 걸리는 단위부터 배분 (LPT: longest processing time first)
+  - 같은 엔드포인트를 사용하는 테스트(prefetch 플러그인이 기록한 GET 경로 기준)는 한 단위로 묶어
+    같은 워커에서 실행 (워커의 커넥션 / 응답 캐시 재사용)
+  - 한 그룹이 (전체 시간 / 워커 수)보다 길면 여러 단위로 나눠 critical path가 늘어나지 않도록 함
+"""
+
+import json
+import os
+import statistics
+from collections import OrderedDict
+
+import pytest
+
+from config.config import Config
+from plugins.prefetch import CACHE_KEY as PREFETCH_CACHE_KEY
+from utils.response_cache import resource_root
+
+_durations = {}  # nodeid -> 이번 실행 시간 (초)
+_plan = {}       # 스케줄 요약 (terminal summary 출력용)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scheduling", "duration-aware xdist scheduling")
+    group.addoption("--duration-scheduling", action="store_true", default=False,
+                    help="기록된 테스트별 실행 시간으로 xdist 작업을 LPT 순서로 배분 (-n 필요)")
+
+
+def load_history(path=None):
+    path = path or Config.SCHEDULING["history_path"]
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_history(durations, path=None):
+    """기존 기록과 이번 실행 시간을 지수 이동 평균으로 합쳐 저장"""
+    path = path or Config.SCHEDULING["history_path"]
+    alpha = Config.SCHEDULING["smoothing"]
+    history = load_history(path)
+    for nodeid, duration in durations.items():
+        previous = history.get(nodeid)
+        history[nodeid] = duration if previous is None else alpha * duration + (1 - alpha) * previous
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(dict(sorted(history.items())), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def plan_units(nodeids, history, endpoints, workers):
+    """
+    테스트 목록 -> [(단위 이름, [nodeid...], 예상 시간)] (예상 시간 내림차순)
+    endpoints: nodeid -> 테스트가 요청한 GET 경로 목록
+    """
+    known = [history[n] for n in nodeids if n in history]
+    default = statistics.median(known) if known else Config.SCHEDULING["default_duration"]
+    estimate = {nodeid: history.get(nodeid, default) for nodeid in nodeids}
+    position = {nodeid: index for index, nodeid in enumerate(nodeids)}
+
+    groups = OrderedDict()
+    for nodeid in nodeids:
+        roots = sorted({resource_root(path) for path in endpoints.get(nodeid, ())})
+        # 엔드포인트 기록이 없으면 xdist loadscope처럼 클래스/모듈 단위로 묶음
+        key = "+".join(roots) if roots else nodeid.rsplit("::", 1)[0]
+        groups.setdefault(key, []).append(nodeid)
+
+    cap = sum(estimate.values()) / max(workers, 1)
+    units = []
+    for key, members in groups.items():
+        total = sum(estimate[n] for n in members)
+        if total <= cap or len(members) == 1:
+            units.append((key, members, total))
+            continue
+        # 그룹이 너무 길면 LPT로 최소 개수의 단위에 나눠 담음
+        parts = min(len(members), int(total // cap) + 1)
+        bins = [[0.0, []] for _ in range(parts)]
+        for nodeid in sorted(members, key=estimate.get, reverse=True):
+            target = min(bins, key=lambda b: b[0])
+            target[0] += estimate[nodeid]
+            target[1].append(nodeid)
+        for index, (load, part) in enumerate(bins):
+            if part:
+                # 같은 단위 안에서는 원래 수집 순서대로 실행
+                units.append((f"{key}#{index}", sorted(part, key=position.get), load))
+    units.sort(key=lambda unit: unit[2], reverse=True)
+    return units
+
+
+def predicted_makespan(units, workers):
+    """단위를 LPT 순서로 가장 먼저 비는 워커에 배정했을 때 예상 전체 시간"""
+    loads = [0.0] * max(workers, 1)
+    for _, _, duration in units:
+        loads[loads.index(min(loads))] += duration
+    return max(loads)
+
+
+def _make_scheduler_class():
+    from xdist.scheduler import LoadScopeScheduling
+
+    class DurationScheduling(LoadScopeScheduling):
+        """LoadScopeScheduling의 작업 단위 / 순서를 실행 시간 기록 기반으로 바꾼 스케줄러"""
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            self._unit_of = {}
+
+        def _split_scope(self, nodeid):
+            return self._unit_of.get(nodeid, nodeid.rsplit("::", 1)[0])
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self._reschedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = list(next(iter(self.registered_collections.values())))
+            if not self.collection:
+                return
+
+            cache = getattr(self.config, "cache", None)
+            endpoints = cache.get(PREFETCH_CACHE_KEY, {}) if cache is not None else {}
+            units = plan_units(self.collection, load_history(), endpoints, len(self.nodes))
+            for name, members, _ in units:
+                self.workqueue[name] = OrderedDict((nodeid, False) for nodeid in members)
+                for nodeid in members:
+                    self._unit_of[nodeid] = name
+            _plan.update(units=len(units), workers=len(self.nodes),
+                         total=sum(u[2] for u in units), makespan=predicted_makespan(units, len(self.nodes)))
+
+            extra_nodes = len(self.nodes) - len(self.workqueue)
+            for _ in range(max(extra_nodes, 0)):
+                unused_node, _ = self.assigned_work.popitem(last=True)
+                unused_node.shutdown()
+            for node in self.nodes:
+                self._assign_work_unit(node)
+            for node in self.nodes:
+                self._reschedule(node)
+            if not self.workqueue:
+                for node in self.nodes:
+                    node.shutdown()
+
+    return DurationScheduling
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("--duration-scheduling") or config.getoption("dist") != "load":
+        return None
+    return _make_scheduler_class()(config, log)
+
+
+def pytest_runtest_logreport(report):
+    # xdist 워커의 리포트는 컨트롤러에서도 다시 호출되므로 기록 저장은 컨트롤러(또는 단일 프로세스)에서만
+    _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workerinput") or not _durations:
+        return
+    save_history(_durations)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _plan:
+        return
+    terminalreporter.write_sep("-", "duration scheduling")
+    terminalreporter.write_line(
+        f"units={_plan['units']} workers={_plan['workers']} total={_plan['total']:.2f}s "
+        f"predicted_critical_path={_plan['makespan']:.2f}s"
+    )
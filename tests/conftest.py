@@ -0,0 +1,106 @@
+"""
+공통 pytest fixture
+"""
+
+import time
+from http import HTTPStatus
+
+import pytest
+import requests
+from config.config import Config
+from utils.api_client import APIClient
+from utils.cassette import close_shared_cassette
+from utils.fake_store_server import FakeStoreServer
+
+
+class FakeClock:
+    """모듈이 import한 time 대신 사용: monotonic()은 가짜 시각, sleep()은 시계만 진행 (나머지는 time 그대로)"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    fake_clock(module, ...): 모듈들의 time을 같은 FakeClock으로 교체하고 반환
+    time 모듈 자체는 바꾸지 않으므로 백그라운드 stand-in 서버의 이벤트 루프에는 영향 없음
+    """
+
+    def install(*modules):
+        clock = FakeClock()
+        for module in modules:
+            monkeypatch.setattr(module, "time", clock)
+        return clock
+
+    return install
+
+
+@pytest.fixture
+def make_response():
+    """네트워크 없이 만든 requests.Response (헤더 인자의 _는 -로 바뀜: Retry_After -> Retry-After)"""
+
+    def make(status=200, body=b"", url=None, **headers):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = HTTPStatus(status).phrase
+        response.url = url
+        response._content = body
+        response.headers.update({name.replace("_", "-"): value for name, value in headers.items()})
+        return response
+
+    return make
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stand_in_server():
+    """
+    Config.BASE_URL이 "local"이면 로컬 stand-in 서버를 세션 동안 실행
+    테스트 클라이언트가 만들어지기 전에 실행되어 BASE_URL을 서버 주소로 교체
+    """
+    if Config.BASE_URL != Config.LOCAL_BASE_URL or Config.CASSETTE["mode"] == "replay":
+        yield None
+        return
+
+    server = FakeStoreServer().start()
+    Config.BASE_URL = server.base_url
+    yield server
+    Config.BASE_URL = Config.LOCAL_BASE_URL
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def api_client(stand_in_server):
+    """
+    세션 전체에서 공유하는 APIClient
+    모든 테스트 클래스가 같은 커넥션 풀을 사용하므로 클래스마다 TCP/TLS handshake를 다시 하지 않음
+    """
+    client = APIClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="class", autouse=True)
+def _bind_api_client(request, api_client):
+    """테스트 클래스에서 self.client로 세션 클라이언트를 사용할 수 있도록 바인딩"""
+    if request.cls is not None:
+        request.cls.client = api_client
+
+
+def pytest_sessionfinish(session):
+    """녹화 모드였다면 카세트 인덱스를 다시 작성"""
+    close_shared_cassette()
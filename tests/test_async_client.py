@@ -0,0 +1,98 @@
+"""
+Async Client Test Cases
+AsyncAPIClient의 gather 순서 / 동시 실행 제한 / 예외 처리 / 이벤트 루프 재사용 (로컬 stand-in 서버 사용)
+"""
+
+import asyncio
+
+import pytest
+
+from utils.async_client import AsyncAPIClient, AsyncResponse
+
+
+@pytest.fixture
+def async_client(stand_in_server):
+    client = AsyncAPIClient(concurrency=4, cassette=False, resilience=False)
+    yield client
+    client.close()
+
+
+class TestAsyncAPIClient:
+    def test_gather_returns_responses_in_request_order(self, async_client):
+        """
+        TC-ASYNC-01: "/path", (method, path), (method, path, json) 요청을 섞어도 요청 순서대로 응답 반환
+        """
+        ids = [5, 1, 9, 3, 7, 2]
+        specs = [f"/products/{i}" for i in ids] + [("GET", "/users/4"), ("POST", "/carts", {"userId": 1, "products": []})]
+        responses = async_client.run(async_client.gather(specs))
+
+        assert all(isinstance(r, AsyncResponse) and r.ok for r in responses)
+        assert [r.json()["id"] for r in responses[:len(ids)]] == ids
+        assert responses[-2].json()["id"] == 4
+        assert responses[-1].json()["userId"] == 1
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_gather_caps_in_flight_requests(self, async_client, monkeypatch, concurrency):
+        """TC-ASYNC-02: 동시에 실행 중인 요청 수가 concurrency를 넘지 않음 (요청이 더 많아도 모두 실행)"""
+        in_flight, peak = 0, 0
+        send = async_client._send
+
+        async def counting_send(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                return await send(*args)
+            finally:
+                in_flight -= 1
+
+        monkeypatch.setattr(async_client, "_send", counting_send)
+        responses = async_client.run(async_client.gather([f"/products/{i}" for i in range(1, 13)], concurrency))
+        assert len(responses) == 12 and peak == concurrency
+
+    def test_return_exceptions(self, async_client):
+        """TC-ASYNC-03: return_exceptions=True면 실패한 요청 자리에 예외, 아니면 예외 전달 (나머지 요청은 취소되어 루프에 남지 않음)"""
+        specs = ["/products/1", ("PATCH", "/products/1"), "/products/2"]
+        responses = async_client.run(async_client.gather(specs, return_exceptions=True))
+        assert isinstance(responses[1], ValueError)
+        assert [responses[0].json()["id"], responses[2].json()["id"]] == [1, 2]
+        with pytest.raises(ValueError, match="Unsupported HTTP method: PATCH"):
+            async_client.run(async_client.gather(specs))
+        assert not asyncio.all_tasks(async_client.loop)
+
+    def test_measure_response_time(self, async_client):
+        """TC-ASYNC-04: (응답, 경과 시간) 반환, 경과 시간은 response.elapsed와 같음"""
+        response, elapsed = async_client.run(async_client.measure_response_time("GET", "/products/1"))
+        assert response.status_code == 200
+        assert 0 < elapsed == response.elapsed
+
+    def test_session_is_rebuilt_on_another_event_loop(self, async_client):
+        """
+        TC-ASYNC-05: 다른 이벤트 루프에서 만든 세션을 재사용하지 않음
+        Expected: 다른 루프에서 쓴 뒤 run(), close() 이후 run(), asyncio.run() 모두 정상 응답,
+        아직 살아 있는 루프의 세션은 그 루프에서 aclose() 할 때 닫힘
+        """
+        other = asyncio.new_event_loop()
+        try:
+            assert other.run_until_complete(async_client.get("/products/1")).status_code == 200
+            first = async_client.session
+
+            assert async_client.run(async_client.get("/products/2")).status_code == 200
+            assert async_client.session is not first and not first.closed
+            async_client.close()
+            assert not first.closed
+
+            assert async_client.run(async_client.get("/products/3")).status_code == 200
+            other.run_until_complete(async_client.aclose())
+            assert first.closed
+        finally:
+            other.close()
+
+        async def fetch_and_close():
+            try:
+                return await async_client.get("/products/4")
+            finally:
+                await async_client.aclose()
+
+        assert asyncio.run(fetch_and_close()).status_code == 200
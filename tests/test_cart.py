@@ -4,22 +4,14 @@ Cart API Test Cases
 """
 
 import pytest
-from utils.api_client import APIClient
+from utils.integrity import IntegrityChecker
+from utils.schemas import CART
 from utils.test_data import TestData
 
 
+@pytest.mark.prefetch("/carts", "/carts/1")
 class TestCartAPI:
-    """장바구니 API 테스트 케이스"""
-    
-    @classmethod
-    def setup_class(cls):
-        """테스트 클래스 실행 전 1회 실행"""
-        cls.client = APIClient()
-    
-    @classmethod
-    def teardown_class(cls):
-        """테스트 클래스 종료 후 1회 실행"""
-        cls.client.close()
+    """장바구니 API 테스트 케이스 (self.client: 세션 공유 APIClient)"""
     
     def test_get_all_carts(self):
         """
@@ -46,10 +38,7 @@ class TestCartAPI:
         
         cart = response.json()
         assert cart['id'] == cart_id
-        assert 'userId' in cart
-        assert 'date' in cart
-        assert 'products' in cart
-        assert isinstance(cart['products'], list)
+        CART.validate(cart)
     
     def test_get_user_carts(self):
         """
@@ -76,7 +65,7 @@ class TestCartAPI:
         실무: 장바구니 담기 기능 검증
         Expected: 생성된 장바구니 정보 반환
         """
-        new_cart = TestData.VALID_CART.copy()
+        new_cart = TestData.valid_cart()
         
         response = self.client.post("/carts", json=new_cart)
         
@@ -128,37 +117,53 @@ class TestCartAPI:
         """
         TC-020: 장바구니-상품 데이터 무결성 검증
         실무: Backoffice-Frontend 데이터 정합성 검증 경험 반영
-        Expected: 장바구니의 상품 ID가 실제 존재하는 상품
+        Expected: 모든 장바구니의 상품 ID / 사용자 ID가 실제 존재하는 상품 / 사용자
         """
-        # 1. 장바구니 조회
-        cart_response = self.client.get("/carts/1")
-        cart = cart_response.json()
+        # /carts, /products, /users를 한 번씩만 조회하고 id 인덱스로 모든 외래 키 확인 (utils/integrity.py)
+        report = IntegrityChecker(self.client).run()
         
-        # 2. 장바구니의 각 상품이 실제로 존재하는지 확인
-        for cart_product in cart['products']:
-            product_id = cart_product['productId']
-            
-            # 해당 상품 조회
-            product_response = self.client.get(f"/products/{product_id}")
-            
-            # 상품이 존재해야 함
-            assert product_response.status_code == 200, \
-                f"Product {product_id} in cart does not exist"
-            
-            product = product_response.json()
-            assert product is not None, \
-                f"Product {product_id} returned null"
+        assert report.counts["carts"] > 0
+        assert report.ok, report.format()
+
+    def test_cart_integrity_detects_dangling_references(self):
+        """
+        TC-020-1: 끊어진 외래 키 검출 (load로 컬렉션을 직접 주입, 네트워크 사용 안 함)
+        Expected: 없는 사용자 / 없는 상품 / id가 될 수 없는 값(list)을 참조 경로와 함께 모두 보고
+        """
+        collections = {
+            "users": [{"id": 1}, {"id": 2}],
+            "products": [{"id": 1}, {"id": 2}],
+            "carts": [
+                {"id": 1, "userId": 1, "products": [{"productId": 1, "quantity": 1}]},
+                {"id": 2, "userId": 9, "products": [{"productId": 2, "quantity": 1}, {"productId": 7, "quantity": 2}]},
+                {"id": 3, "userId": 2, "products": [{"productId": [1], "quantity": 1}]},
+            ],
+        }
+        report = IntegrityChecker(None, load=collections.__getitem__).run()
+
+        assert not report.ok
+        assert report.dangling == [
+            {"source": "carts", "source_id": 2, "path": "userId", "value": 9, "target": "users"},
+            {"source": "carts", "source_id": 2, "path": "products[1].productId", "value": 7, "target": "products"},
+            {"source": "carts", "source_id": 3, "path": "products[0].productId", "value": [1], "target": "products"},
+        ]
+        assert report.checked == {"carts.userId -> users": 3, "carts.products[].productId -> products": 4}
+        assert report.format().splitlines() == [
+            "3 dangling reference(s) in 7 checked (carts=3, products=2, users=2)",
+            "  carts[id=2].userId = 9 -> missing in users",
+            "  carts[id=2].products[1].productId = 7 -> missing in products",
+            "  carts[id=3].products[0].productId = [1] -> missing in products",
+        ]
+        assert report.format(limit=1).splitlines()[-1] == "  ... (+2)"
     
     def test_cart_quantity_validation(self):
         """
         TC-021: 장바구니 수량 유효성 검증
         실무: 수량 데이터 검증
         Expected: 수량은 양의 정수
+        (목록을 스트리밍으로 파싱하면서 장바구니마다 검증)
         """
-        response = self.client.get("/carts")
-        carts = response.json()
-        
-        for cart in carts:
+        def check_quantities(cart):
             for product in cart['products']:
                 quantity = product['quantity']
                 
@@ -169,6 +174,9 @@ class TestCartAPI:
                 # 수량이 양수인지 확인
                 assert quantity > 0, \
                     f"Cart {cart['id']}: Quantity should be positive, got {quantity}"
+
+        report = self.client.validate_stream("/carts", check_quantities)
+        assert report.count > 0
     
     def test_get_carts_by_date_range(self):
         """
@@ -0,0 +1,88 @@
+"""
+Cassette Test Cases
+요청/응답 녹화 / 재생 / 인덱스 조회 (utils/cassette.py, 네트워크 사용 안 함)
+"""
+
+import pytest
+
+from utils.cassette import Cassette, CassetteMiss, request_key
+
+BASE_URL = "https://fakestoreapi.com"
+
+
+def _record(path, interactions):
+    cassette = Cassette(str(path), "record")
+    for method, request_path, json_body, response in interactions:
+        cassette.record(method, request_path, json_body, response)
+    cassette.close()
+
+
+class TestRecordReplay:
+    def test_replay_returns_recorded_response(self, tmp_path, make_response):
+        """
+        TC-CAS-01: 녹화한 응답을 status / reason / url / 헤더 / 본문 그대로 재생
+        Expected: 전송 관련 헤더(Content-Length 등)는 저장하지 않음
+        """
+        body = '{"title": "한글"}'.encode()
+        recorded = make_response(url=BASE_URL + "/products/1", body=body, **{
+            "Content-Type": "application/json; charset=utf-8", "Content-Length": "99", "ETag": '"v1"'})
+        _record(tmp_path / "store", [("get", "/products/1", None, recorded)])
+
+        replayed = Cassette(str(tmp_path / "store"), "replay").play("GET", "/products/1")
+        assert (replayed.status_code, replayed.reason, replayed.url) == (200, "OK", recorded.url)
+        assert replayed.content == body and replayed.json() == {"title": "한글"}
+        assert replayed.headers["etag"] == '"v1"' and "Content-Length" not in replayed.headers
+        assert replayed.encoding == "utf-8"
+
+    def test_request_key_uses_method_path_and_normalized_body(self, tmp_path, make_response):
+        """TC-CAS-02: 같은 경로라도 method / JSON body가 다르면 다른 응답, body 키 순서는 무시"""
+        assert request_key("get", "/carts") == request_key("GET", "/carts")
+        assert request_key("POST", "/carts", {"a": 1, "b": 2}) == request_key("POST", "/carts", {"b": 2, "a": 1})
+        _record(tmp_path / "store", [
+            ("GET", "/carts", None, make_response(url=BASE_URL + "/carts", body=b"[]")),
+            ("POST", "/carts", {"userId": 1}, make_response(url=BASE_URL + "/carts", body=b'{"id": 1}')),
+            ("POST", "/carts", {"userId": 2}, make_response(url=BASE_URL + "/carts", body=b'{"id": 2}')),
+        ])
+        cassette = Cassette(str(tmp_path / "store"), "replay")
+        assert cassette.play("GET", "/carts").content == b"[]"
+        assert cassette.play("POST", "/carts", {"userId": 2}).json() == {"id": 2}
+        with pytest.raises(CassetteMiss):
+            cassette.play("POST", "/carts", {"userId": 3})
+
+
+class TestIndex:
+    def test_binary_search_finds_every_record(self, tmp_path, make_response):
+        """
+        TC-CAS-03: 레코드가 많아도 인덱스 이진 탐색으로 모든 키를 찾고, 같은 키는 마지막 녹화가 우선
+        """
+        interactions = [
+            ("GET", f"/products/{i}", None, make_response(url=BASE_URL + f"/products/{i}", body=str(i).encode()))
+            for i in range(500)
+        ]
+        interactions.append(("GET", "/products/7", None, make_response(url=BASE_URL + "/products/7", body=b"latest")))
+        _record(tmp_path / "store", interactions)
+
+        cassette = Cassette(str(tmp_path / "store"), "replay")
+        assert len(cassette) == 500
+        for i in range(500):
+            expected = b"latest" if i == 7 else str(i).encode()
+            assert cassette.play("GET", f"/products/{i}").content == expected
+        with pytest.raises(CassetteMiss):
+            cassette.play("GET", "/products/500")
+        cassette.close()
+
+    def test_stale_index_is_rebuilt(self, tmp_path, make_response):
+        """TC-CAS-04: 인덱스 이후에 추가 녹화된 카세트를 재생하면 인덱스를 다시 작성"""
+        _record(tmp_path / "store", [("GET", "/users/1", None, make_response(url=BASE_URL + "/users/1", body=b"1"))])
+        # 인덱스를 만들지 않고 append만 한 상태 (close()를 호출하지 않은 녹화 프로세스)
+        Cassette(str(tmp_path / "store"), "record").record("GET", "/users/2", None, make_response(url=BASE_URL + "/users/2", body=b"2"))
+
+        cassette = Cassette(str(tmp_path / "store"), "replay")
+        assert len(cassette) == 2 and cassette.play("GET", "/users/2").content == b"2"
+
+    def test_invalid_mode_and_missing_cassette(self, tmp_path):
+        """TC-CAS-05: 지원하지 않는 mode는 ValueError, 녹화하지 않은 카세트 재생은 FileNotFoundError"""
+        with pytest.raises(ValueError):
+            Cassette(str(tmp_path / "store"), "off")
+        with pytest.raises(FileNotFoundError):
+            Cassette(str(tmp_path / "missing"), "replay")
@@ -0,0 +1,83 @@
+"""
+Columnar Invariant Test Cases
+숫자 필드 불변식 일괄 검증의 규칙 위반 보고 (utils/columnar.py, 네트워크 사용 안 함)
+"""
+
+import pytest
+
+from utils.columnar import check_invariants, extract_column
+from utils.fake_store_server import FakeStore
+
+_store = FakeStore()
+
+
+def _indices(report, field=None):
+    return report.indices(field).tolist()
+
+
+class TestRuleViolations:
+    def test_stand_in_data_satisfies_config_rules(self):
+        """TC-COL-01: stand-in 상품 / 장바구니 데이터는 Config.VALIDATION_RULES를 모두 만족"""
+        assert check_invariants(_store.products).ok
+        assert check_invariants(_store.carts).ok
+
+    def test_each_rule_reports_violating_records(self):
+        """
+        TC-COL-02: 규칙(gt / max / min / integer)마다 위반한 원래 레코드 인덱스를 보고
+        """
+        products = [dict(p, rating=dict(p["rating"])) for p in _store.products[:6]]
+        products[1]["price"] = 0
+        products[2]["price"] = 1000.01
+        products[3]["rating"]["rate"] = -0.1
+        products[4]["rating"]["count"] = 2.5
+        products[5]["rating"]["rate"] = 5
+        report = check_invariants(products)
+        assert [(field, rule, idx.tolist()) for field, rule, idx in report.violations] == [
+            ("price", "> 0", [1]),
+            ("price", "<= 1000", [2]),
+            ("rating.rate", ">= 0", [3]),
+            ("rating.count", "is an integer", [4]),
+        ]
+        assert _indices(report) == [1, 2, 3, 4] and _indices(report, "price") == [1, 2]
+
+    def test_missing_and_non_numeric_values(self):
+        """
+        TC-COL-03: 필드 누락 / 문자열 / bool / null 값은 "is a number" 위반으로 한 번만 보고 (다른 규칙과 중복 없음)
+        """
+        products = [dict(p) for p in _store.products[:5]]
+        del products[0]["price"]
+        products[1]["price"] = "9.99"
+        products[2]["price"] = True
+        products[3]["rating"] = None
+        report = check_invariants(products, fields=["price", "rating.rate"])
+        assert [(field, rule, idx.tolist()) for field, rule, idx in report.violations] == [
+            ("price", "is a number", [0, 1, 2]),
+            ("rating.rate", "is a number", [3]),
+        ]
+
+    def test_list_field_violations_map_to_owner_records(self):
+        """
+        TC-COL-04: products[].quantity 위반은 원소가 속한 장바구니 인덱스로 보고, 목록이 없으면 해당 장바구니 위반
+        """
+        carts = [dict(c, products=[dict(line) for line in c["products"]]) for c in _store.carts[:4]]
+        carts[1]["products"][-1]["quantity"] = 0
+        carts[2]["products"] = "none"
+        carts[3]["products"].append({"productId": 1, "quantity": 1.5})
+        report = check_invariants(carts)
+        assert [(rule, idx.tolist()) for _, rule, idx in report.violations] == [
+            ("is a number", [2]), ("> 0", [1]), ("is an integer", [3])]
+
+        column = extract_column(_store.carts[:2], "products[].quantity")
+        expected_owners = [i for i, cart in enumerate(_store.carts[:2]) for _ in cart["products"]]
+        assert column.owners.tolist() == expected_owners
+
+    def test_format_and_unknown_rule(self):
+        """TC-COL-05: format()은 limit개까지만 인덱스 표시, 알 수 없는 규칙은 ValueError"""
+        records = [{"price": -1} for _ in range(12)]
+        report = check_invariants(records, rules={"price": {"gt": 0}})
+        assert report.format(limit=3).splitlines() == [
+            "1 invariant(s) violated in 12 records",
+            "  price > 0: 12 record(s) at [0, 1, 2, ... (+9)]",
+        ]
+        with pytest.raises(ValueError, match="Unknown validation rule 'between'"):
+            check_invariants(records, rules={"price": {"between": (0, 1)}})
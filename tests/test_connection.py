@@ -0,0 +1,98 @@
+"""
+Connection Test Cases
+새 커넥션 비용 절약 검증 (DNS 캐시 / TLS 세션 재개)
+HTTPS로 실행한 로컬 stand-in 서버를 사용하므로 openssl CLI가 없으면 건너뜀
+"""
+
+import shutil
+import ssl
+import subprocess
+
+import pytest
+import requests
+
+from config.config import Config
+from utils.api_client import APIClient
+from utils.connection_cache import dns_cache, get_ssl_context
+from utils.fake_store_server import FakeStoreServer
+from utils.timing import connection_stats
+
+
+@pytest.fixture(scope="module")
+def https_server(tmp_path_factory):
+    """테스트 시작 시 만든 자체 서명 인증서로 HTTPS stand-in 서버 실행"""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl CLI not available")
+    directory = tmp_path_factory.mktemp("certs")
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", str(key), "-out", str(cert), "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"],
+        check=True, capture_output=True,
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    with FakeStoreServer(ssl_context=context) as server:
+        port = server.base_url.rsplit(":", 1)[1]
+        yield f"https://localhost:{port}", str(cert)
+
+
+class TestConnectionReuse:
+    """새 커넥션의 DNS 조회 / TLS handshake 절약"""
+
+    def _new_client(self, base_url, cert):
+        client = APIClient(cache=False, cassette=False, resilience=False)
+        client.base_url = base_url
+        client.session.verify = cert
+        # REQUESTS_CA_BUNDLE 환경 변수가 session.verify를 덮어쓰지 않도록
+        client.session.trust_env = False
+        return client
+
+    @pytest.mark.skipif(not Config.CONNECTION_CACHE["tls_resumption"], reason="TLS session resumption disabled")
+    def test_second_client_resumes_tls_session(self, https_server, tmp_path, monkeypatch):
+        """
+        TC-CONN-01: 다른 클라이언트(새 커넥션 풀)의 첫 요청
+        Expected: DNS 조회 결과와 TLS 세션을 재사용해 짧은 handshake로 연결
+        """
+        base_url, cert = https_server
+        monkeypatch.setattr(dns_cache, "store_path", str(tmp_path / "dns_cache.json"))
+        dns_cache.clear()
+
+        before = connection_stats.to_dict()
+        first = self._new_client(base_url, cert)
+        assert first.get("/products/1").status_code == 200
+        first.close()
+        after_first = connection_stats.to_dict()
+
+        second = self._new_client(base_url, cert)
+        assert second.get("/products/1").status_code == 200
+        second.close()
+        after_second = connection_stats.to_dict()
+
+        assert after_first["tls_handshakes"] - before["tls_handshakes"] == 1
+        assert after_first["tls_resumed"] == before["tls_resumed"], "first handshake cannot be resumed"
+        assert after_second["tls_handshakes"] - after_first["tls_handshakes"] == 1
+        assert after_second["tls_resumed"] - after_first["tls_resumed"] == 1, "TLS session was not resumed"
+        assert after_second["dns_cached"] - after_first["dns_cached"] == 1, "DNS answer was not reused"
+
+    @pytest.mark.filterwarnings("ignore::urllib3.exceptions.InsecureRequestWarning")
+    def test_insecure_client_does_not_weaken_default_client(self, https_server):
+        """
+        TC-CONN-02: verify=False 클라이언트와 자체 CA 번들 클라이언트가 먼저 연결한 뒤 기본 설정 클라이언트로 요청
+        Expected: 기본 클라이언트는 여전히 자체 서명 인증서를 거부 (공유 SSLContext의 검증 설정이 바뀌지 않음)
+        """
+        base_url, cert = https_server
+        for verify in (False, cert):
+            client = self._new_client(base_url, verify)
+            assert client.get("/products/1").status_code == 200
+            client.close()
+
+        default = self._new_client(base_url, True)
+        with pytest.raises(requests.exceptions.SSLError):
+            default.get("/products/1")
+        default.close()
+
+        context = get_ssl_context()
+        if context is not None:
+            assert context.verify_mode == ssl.CERT_REQUIRED and context.check_hostname
@@ -0,0 +1,40 @@
+"""
+Data Factory Test Cases
+대량 테스트 데이터 생성기 검증 (utils/data_factory.py)
+"""
+
+import pytest
+
+from utils.data_factory import PRODUCT_ID_RANGE, USER_ID_RANGE, DataFactory, Record
+from utils.schemas import CART
+
+
+class TestDataFactory:
+    """payload 유일성 / 재현성 / 스키마 (네트워크 사용 안 함)"""
+
+    @pytest.mark.parametrize("kind, count", [("products", 10_000), ("carts", 100_000), ("users", 10_000)])
+    def test_payloads_are_unique(self, kind, count):
+        """
+        TC-DATA-01: 같은 seed로 만든 payload가 모두 서로 다름
+        Expected: 직렬화한 payload 중복 0
+        """
+        payloads = {record.to_json() for record in getattr(DataFactory(seed=7), kind)(count)}
+        assert len(payloads) == count
+
+    def test_records_are_reproducible_and_valid(self):
+        """
+        TC-DATA-02: 같은 seed + index면 중간부터 생성해도 같은 레코드, 스키마 / 값 범위 만족
+        """
+        factory = DataFactory(seed=3)
+        carts = list(factory.carts(50))
+        assert [c.to_dict() for c in factory.carts(10, start=40)] == [c.to_dict() for c in carts[40:]]
+        assert not CART.check_many([dict(c.to_dict(), id=1) for c in carts])
+        for cart in carts:
+            assert 1 <= cart.user_id <= USER_ID_RANGE
+            assert all(1 <= product_id <= PRODUCT_ID_RANGE for product_id, _ in cart.lines)
+        assert all(0 < p.to_dict()["price"] < 1000 for p in factory.products(50))
+
+    def test_record_base_is_abstract(self):
+        """TC-DATA-03: to_dict()를 구현하지 않은 Record는 만들 수 없음"""
+        with pytest.raises(TypeError):
+            Record()
@@ -0,0 +1,32 @@
+"""
+Differential Test Cases
+두 서버 응답 비교 검증 (utils/differ.py)
+"""
+
+from utils.differ import Differ, default_paths
+from utils.fake_store_server import FakeStore, FakeStoreServer
+
+
+class TestDifferential:
+    """서로 다른 base URL 두 개의 GET 응답 비교"""
+
+    def test_differ_reports_changed_fields_only(self):
+        """
+        TC-DIFF-01: 상품 가격 하나와 장바구니 날짜가 다른 두 서버 비교
+        Expected: 날짜는 무시 규칙으로 제외되고, 가격 차이만 해당 경로 / 필드 단위로 보고
+        """
+        changed = FakeStore()
+        changed.products_by_id[3]["price"] = 1.0
+        for cart in changed.carts:
+            cart["date"] = "2026-01-01T00:00:00.000Z"
+
+        with FakeStoreServer() as left, FakeStoreServer(store=changed) as right:
+            report = Differ(left.base_url, right.base_url, paths=default_paths(),
+                            ignore=[("GET /carts*", "*.date")]).run()
+
+        different = {result.path: result for result in report.differences}
+        assert len(report.results) == len(default_paths())
+        assert sorted(different) == ["/products", "/products/3", "/products/category/men's clothing",
+                                     "/products?limit=5", "/products?sort=desc"], report.format()
+        assert different["/products/3"].differences[0][0] == "$.price"
+        assert different["/products"].differences[0][0] == "$[2].price"
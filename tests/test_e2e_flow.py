@@ -5,19 +5,13 @@ FakeStore API 특성 반영: 상태 유지 X, 로그인 토큰 없음
 """
 
 import pytest
-from utils.api_client import APIClient
+from utils.async_client import AsyncAPIClient
+from utils.scenario import ScenarioRunner, Stage, purchase_journey
 from utils.test_data import TestData
 
 
 class TestE2EFlow:
-
-    @classmethod
-    def setup_class(cls):
-        cls.client = APIClient()
-
-    @classmethod
-    def teardown_class(cls):
-        cls.client.close()
+    # self.client: 세션 공유 APIClient (tests/conftest.py)
 
     def test_user_purchase_flow(self):
         """
@@ -72,3 +66,50 @@ class TestE2EFlow:
 
         # 5️⃣ 전체 플로우 로그
         print("✅ E2E Flow Passed: User purchase flow simulated successfully")
+
+    def test_purchase_journey_with_virtual_users(self):
+        """
+        TC-E2E-02: 로그인 + 구매 흐름을 가상 사용자 여러 명이 동시에 실행 (utils/scenario.py)
+        Expected: 모든 단계 / 시나리오 성공
+        """
+        # 카세트 / 재시도 설정은 다른 테스트와 동일하게 적용
+        client = AsyncAPIClient(concurrency=3)
+        try:
+            # 바로 3명으로 시작해 max_iterations에서 종료 (60초 단계는 느린 서버에서의 상한일 뿐)
+            report = ScenarioRunner(purchase_journey(think=0), [Stage(3, 0), Stage(3, 60)], client=client,
+                                    max_iterations=6).run()
+        finally:
+            client.close()
+
+        assert report.iterations >= 6
+        assert report.failed == 0, report.format()
+        for name, step in report.steps.items():
+            assert step["requests"] >= 6, f"{name}: {step['requests']} requests"
+
+    def test_purchase_journey_sends_login_token(self):
+        """
+        TC-E2E-03: 구매 여정에서 로그인 응답의 토큰을 이후 단계에 전달
+        Expected: 로그인 요청은 헤더 없음, 나머지 단계는 모두 Authorization: Bearer <token>
+        """
+        client = AsyncAPIClient(concurrency=1)
+        sent = []
+        request = client.request
+
+        async def recording_request(method, path, json=None, headers=None):
+            response = await request(method, path, json=json, headers=headers)
+            sent.append((path, headers, response))
+            return response
+
+        client.request = recording_request
+        try:
+            report = ScenarioRunner(purchase_journey(think=0), [Stage(1, 0), Stage(1, 60)], client=client,
+                                    max_iterations=1).run()
+        finally:
+            client.close()
+
+        assert report.failed == 0, report.format()
+        (login_path, login_headers, login_response), *rest = sent
+        assert login_path == "/auth/login" and login_headers is None
+        token = login_response.json()["token"]
+        assert rest[0][0].startswith("/users/") and [path for path, _, _ in rest[1:]] == ["/products", "/carts"]
+        assert all(headers == {"Authorization": f"Bearer {token}"} for _, headers, _ in rest)
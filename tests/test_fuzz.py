@@ -0,0 +1,82 @@
+"""
+Fuzz Test Cases
+TestData payload / 경로 파라미터를 변형한 계약 퍼징 (--run-fuzz 옵션으로 실행)
+TestFuzzer는 stub 클라이언트로 실패 보고 / 축소 / seed 재현을 검증 (네트워크 사용 안 함, 항상 실행)
+"""
+
+import asyncio
+import random
+
+import pytest
+from utils.async_client import AsyncResponse
+from utils.fuzzer import FuzzTarget, Fuzzer
+from utils.test_data import TestData
+
+
+class PriceBugClient:
+    """price가 숫자가 아니면 500을 돌려주는 stand-in (응답 순서가 섞이도록 요청마다 임의로 지연)"""
+
+    def __init__(self):
+        self.rng = random.Random()
+
+    async def request(self, method, path, json=None):
+        await asyncio.sleep(self.rng.random() / 1000)
+        if isinstance(json, dict) and "price" in json and not isinstance(json["price"], (int, float)):
+            return AsyncResponse(500, {"Content-Type": "text/plain"}, b"Internal Server Error", path, 0.0)
+        return AsyncResponse(201, {"Content-Type": "application/json"}, b'{"id": 21}', path, 0.0)
+
+    def run(self, coro):
+        return asyncio.run(coro)
+
+
+class TestContractFuzz:
+    """변형된 요청에 대한 API 계약 검증"""
+
+    @pytest.mark.fuzz(budget=10)
+    def test_mutated_requests_keep_contract(self, fuzz_report):
+        """
+        TC-FUZZ-01: Product / Cart / User / 로그인 요청 변형 퍼징
+        Expected: 5xx / 잘못된 JSON 응답 / 커넥션 오류 없음 (실패 시 최소 재현 케이스 출력)
+        """
+        assert fuzz_report.cases > 0
+        assert fuzz_report.ok, fuzz_report.format()
+
+
+class TestFuzzer:
+    """퍼저 자체 동작 (stub 클라이언트)"""
+
+    TARGETS = (FuzzTarget("POST", "/products", TestData.valid_product),)
+
+    def _run(self, seed):
+        client = PriceBugClient()
+        return Fuzzer(self.TARGETS, seed=seed, budget=60, concurrency=8, max_cases=200, client=client).run()
+
+    def test_failure_is_reported_and_shrunk_to_single_mutation(self):
+        """
+        TC-FUZZ-02: seed 14의 첫 실패 케이스는 price에 4096자 문자열 + title 변형
+        Expected: 500 실패를 보고하고, 관계없는 변형 / payload 필드를 지우고 값을 줄여 price 하나만 남김
+        """
+        report = self._run(14)
+
+        assert not report.ok and report.cases == 200
+        [failure] = report.failures
+        assert failure.message == "server error: HTTP 500"
+        assert failure.occurrences == 7
+        assert failure.case.index == 6 and len(failure.case.mutations) == 2
+        assert [(m.where, m.value) for m in failure.minimal.mutations] == [(("body", "price"), "a")]
+        assert failure.minimal.build() == ("POST", "/products", {"price": "a"})
+        assert report.shrink_steps > 0
+        assert 'minimal: POST /products json={"price": "a"}' in report.format()
+
+    def test_same_seed_reproduces_same_failure(self):
+        """
+        TC-FUZZ-03: 같은 seed로 두 번 실행 (응답 순서는 매번 다름)
+        Expected: 같은 케이스를 같은 최소 재현 케이스로 보고, 요청 body도 같은 순서로 생성
+        """
+        first, second = self._run(14), self._run(14)
+
+        def summary(report):
+            return [(f.case.index, f.occurrences, f.case.describe(), f.minimal.describe()) for f in report.failures]
+
+        assert summary(first) == summary(second)
+        assert summary(first) != summary(self._run(2))
@@ -0,0 +1,94 @@
+"""
+Histogram Test Cases
+로그-선형 지연 시간 히스토그램의 백분위 정확도 / merge (utils/histogram.py, 네트워크 사용 안 함)
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from utils.histogram import DEFAULT_PRECISION_BITS, Histogram
+
+
+def _exact_percentile(values, pct):
+    """Histogram.percentile과 같은 nearest-rank 정의"""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+
+def _latencies(seed, count=20_000):
+    rng = random.Random(seed)
+    # 수십 µs ~ 수 초 범위의 나노초 값
+    return [int(rng.lognormvariate(math.log(5e6), 1.5)) for _ in range(count)]
+
+
+PERCENTILES = (0, 1, 25, 50, 90, 99, 99.9, 100)
+
+
+class TestPercentile:
+    def test_relative_error_within_bucket_precision(self):
+        """
+        TC-HIST-01: 모든 백분위가 정확한 값 대비 상대 오차 2^-precision_bits 이내
+        """
+        values = _latencies(seed=1)
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+        bound = 1 / (1 << DEFAULT_PRECISION_BITS)
+        for pct in PERCENTILES:
+            exact = _exact_percentile(values, pct)
+            assert abs(histogram.percentile(pct) - exact) <= exact * bound, pct
+        assert (histogram.percentile(0), histogram.percentile(100)) == (min(values), max(values))
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_small_values_are_exact(self):
+        """TC-HIST-02: 2^precision_bits 미만의 값은 버킷 하나에 값 하나 (오차 없음)"""
+        values = list(range(256)) * 3
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+        for pct in PERCENTILES:
+            assert histogram.percentile(pct) == _exact_percentile(values, pct)
+
+    def test_empty_and_clamped_values(self):
+        """TC-HIST-03: 빈 히스토그램은 0, 음수는 0으로 기록, count 인자는 같은 값 여러 번 기록과 동일"""
+        histogram = Histogram()
+        assert histogram.percentile(50) == 0 and histogram.mean == 0.0
+        histogram.record(-5)
+        histogram.record(1_000_000, count=3)
+        assert (histogram.count, histogram.min, histogram.max) == (4, 0, 1_000_000)
+        assert histogram.percentile(25) == 0 and histogram.percentile(50) == 1_000_000
+
+
+class TestMerge:
+    def test_merge_equals_single_histogram(self):
+        """
+        TC-HIST-04: 여러 워커의 히스토그램을 merge한 결과가 모든 값을 하나에 기록한 결과와 같음
+        (JSON 직렬화 후 복원한 히스토그램 포함 - xdist workeroutput 경로)
+        """
+        parts = [_latencies(seed) for seed in (2, 3, 4)]
+        combined = Histogram()
+        for value in (v for part in parts for v in part):
+            combined.record(value)
+
+        merged = Histogram()
+        for part in parts:
+            worker = Histogram()
+            for value in part:
+                worker.record(value)
+            merged.merge(Histogram.from_dict(json.loads(json.dumps(worker.to_dict()))))
+
+        assert merged.to_dict() == combined.to_dict()
+        for pct in PERCENTILES:
+            assert merged.percentile(pct) == combined.percentile(pct)
+
+    def test_merge_with_empty_and_different_precision(self):
+        """TC-HIST-05: 빈 히스토그램과의 merge는 min/max를 유지, precision이 다르면 ValueError"""
+        histogram = Histogram()
+        histogram.record(42)
+        assert Histogram().merge(histogram).min == 42
+        assert histogram.merge(Histogram()).to_dict()["min"] == 42
+        with pytest.raises(ValueError):
+            histogram.merge(Histogram(precision_bits=DEFAULT_PRECISION_BITS + 1))
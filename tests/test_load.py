@@ -0,0 +1,111 @@
+"""
+Load Test Cases
+고정 도착률 부하 테스트 (--run-load 옵션으로 실행)
+TestLoadGenerator는 stub 클라이언트로 부하 생성기 자체를 검증 (네트워크 사용 안 함, 항상 실행)
+"""
+
+import time
+
+import pytest
+import requests
+from config.config import Config
+from utils.load_generator import LoadGenerator
+from utils.scenario import ScenarioRunner, Stage, purchase_journey
+
+
+class StubClient:
+    """measure_response_time만 가진 클라이언트, stall 초 동안 첫 요청이 멈춤"""
+
+    def __init__(self, stall=0.0):
+        self.stall = stall
+        self.session = requests.Session()
+        self.calls = []
+        self.closed = False
+
+    def measure_response_time(self, method, path, json=None):
+        self.calls.append(time.perf_counter())
+        if len(self.calls) == 1 and self.stall:
+            time.sleep(self.stall)
+        response = requests.Response()
+        response.status_code = 200
+        return response, 0.0
+
+    def close(self):
+        self.closed = True
+
+
+class TestLoadGenerator:
+    """부하 생성기 동작 (stub 클라이언트)"""
+
+    def test_caller_client_is_left_untouched(self):
+        """
+        TC-LOAD-04: 호출 측이 넘긴 client의 세션 adapter는 바꾸지 않고, run()이 끝나도 닫지 않음
+        """
+        client = StubClient()
+        adapters = dict(client.session.adapters)
+        report = LoadGenerator(["GET /products"], rate=100, duration=0.05, max_workers=2, client=client).run()
+        assert report.total_requests == 5
+        assert client.session.adapters == adapters
+        assert not client.closed
+
+    def test_latency_includes_queueing_behind_stalled_request(self):
+        """
+        TC-LOAD-05: 워커 1개, 20 rps(도착 간격 50ms)에서 첫 요청이 300ms 동안 멈춤
+        Expected: 뒤에 밀린 요청의 지연 시간은 예정 시각부터 측정되어 대기 시간을 포함 (coordinated omission 보정)
+                  서비스 시간에는 대기 시간이 포함되지 않고, 이후 요청은 밀리지 않고 예정대로 발생 (open-loop)
+        """
+        client = StubClient(stall=0.3)
+        report = LoadGenerator(["GET /products"], rate=20, duration=0.5, max_workers=1, client=client).run()
+        stats = report.endpoints["GET /products"]
+        assert stats["requests"] == 10
+
+        # 예정 시각 0, 50, ..., 450ms 중 50~250ms 요청은 300ms까지 대기
+        # -> 지연 시간 약 [300, 250, 200, 150, 100, 50, 0, 0, 0, 0]ms (히스토그램 오차 0.4% 허용)
+        assert stats["max"] >= 0.3
+        assert stats["latency"]["p90"] >= 0.249
+        assert stats["latency"]["p50"] >= 0.0498
+        assert stats["service_time"]["p90"] < 0.03
+
+        # closed-loop라면 마지막 요청이 300 + 9 x 50 = 750ms 이후에 시작됨
+        assert client.calls[-1] - client.calls[0] < 0.6
+
+
+class TestLoad:
+    """부하 상황에서의 응답 시간 / 에러율 검증"""
+
+    @pytest.mark.load(endpoints=["GET /products", "GET /carts", "GET /users"])
+    def test_catalog_read_under_load(self, load_report):
+        """
+        TC-LOAD-01: 조회 API 고정 도착률 부하
+        Expected: 에러율 1% 미만, p99 지연 시간이 성능 기준 이내
+        """
+        assert load_report.error_rate < Config.LOAD["max_error_rate"], \
+            f"Error rate too high: {load_report.error_rate:.2%}"
+
+        for endpoint, stats in load_report.endpoints.items():
+            assert stats["latency"]["p99"] < Config.PERFORMANCE_THRESHOLD['response_time'], \
+                f"{endpoint}: p99 {stats['latency']['p99']:.3f}s exceeds threshold"
+
+    @pytest.mark.load(endpoints=["POST /carts"], payloads="carts", seed=7)
+    def test_cart_creation_under_load(self, load_report):
+        """
+        TC-LOAD-02: 장바구니 생성 API 부하 (utils/data_factory.py로 매 요청마다 다른 payload 생성)
+        Expected: 에러율 1% 미만
+        """
+        assert load_report.error_rate < Config.LOAD["max_error_rate"], \
+            f"Error rate too high: {load_report.error_rate:.2%}"
+
+    @pytest.mark.load
+    def test_purchase_journey_under_load(self):
+        """
+        TC-LOAD-03: 가상 사용자 200명이 구매 여정(로그인 -> 사용자 -> 상품 -> 장바구니)을 반복
+        Expected: 시나리오 실패율 1% 미만, 단계별 p99 지연 시간이 성능 기준 이내
+        """
+        report = ScenarioRunner(purchase_journey(think=(0.1, 0.5)),
+                                [Stage(200, 5), Stage(200, 10), Stage(0, 2)]).run()
+        print("\n" + report.format())
+
+        assert report.error_rate < Config.LOAD["max_error_rate"], report.format()
+        for name, step in report.steps.items():
+            assert step["latency"]["p99"] < Config.PERFORMANCE_THRESHOLD['response_time'], \
+                f"{name}: p99 {step['latency']['p99']:.3f}s exceeds threshold"
@@ -0,0 +1,107 @@
+"""
+Prefetch Plugin Test Cases
+GET 경로 기록 -> 다음 실행에서 스냅샷 응답 사용 (plugins/prefetch.py)
+pytester로 별도 pytest 프로세스를 같은 디렉토리에서 여러 번 실행 (pytest cache를 실행 간에 공유)
+"""
+
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONFTEST = """
+import pytest
+from config.config import Config
+from utils.api_client import APIClient
+from utils.fake_store_server import FakeStoreServer
+
+pytest_plugins = ["plugins.prefetch"]
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    server = FakeStoreServer().start()
+    Config.BASE_URL = server.base_url
+    client = APIClient(cache=False, cassette=False, resilience=False)
+    yield client
+    client.close()
+    server.stop()
+"""
+
+TESTS = """
+import pytest
+
+
+def test_product(api_client):
+    assert api_client.get("/products/1").status_code == 200
+
+
+def test_user(api_client):
+    assert api_client.get("/users/1").status_code == 200
+
+
+@pytest.mark.benchmark
+def test_benchmark(api_client):
+    assert api_client.get("/products/2").status_code == 200
+
+
+@pytest.mark.load
+def test_load(api_client):
+    assert api_client.get("/products/3").status_code == 200
+"""
+
+
+@pytest.fixture
+def project(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", ROOT)
+    monkeypatch.setenv("API_PREFETCH", "1")
+    pytester.makeini("[pytest]\nmarkers =\n    benchmark\n    load\n    prefetch(*paths)\n")
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_sample=TESTS)
+    return pytester
+
+
+def _recorded(pytester):
+    with open(pytester.path / ".pytest_cache" / "v" / "prefetch" / "paths") as f:
+        return json.load(f)
+
+
+class TestPrefetchPlugin:
+    def test_second_run_is_served_from_snapshot(self, project):
+        """
+        TC-PREFETCH-01: 첫 실행은 기록이 없어 미리 받지 않고 테스트별 GET 경로만 기록
+        Expected: 두 번째 실행은 benchmark / load 테스트를 제외한 경로만 미리 받아 스냅샷 응답으로 실행
+        """
+        first = project.runpytest_subprocess("-p", "no:xdist")
+        first.assert_outcomes(passed=4)
+        first.stdout.no_fnmatch_line("paths=* fetched=*")
+        assert _recorded(project) == {
+            "test_sample.py::test_product": ["/products/1"],
+            "test_sample.py::test_user": ["/users/1"],
+            "test_sample.py::test_benchmark": ["/products/2"],
+            "test_sample.py::test_load": ["/products/3"],
+        }
+
+        second = project.runpytest_subprocess("-p", "no:xdist")
+        second.assert_outcomes(passed=4)
+        second.stdout.fnmatch_lines(["paths=2 fetched=2 elapsed=*ms served_from_snapshot=2"])
+
+    def test_xdist_workers_fetch_only_their_own_paths(self, project):
+        """
+        TC-PREFETCH-02: -n 2로 두 번 실행
+        Expected: 워커의 기록을 controller가 pytest cache에 저장하고, 두 번째 실행에서 워커마다 자기가 실행하는
+                  테스트의 경로만 받으므로 합계는 단일 프로세스와 같음 (워커 수만큼 늘지 않음)
+        """
+        project.runpytest_subprocess("-n", "2").assert_outcomes(passed=4)
+        assert _recorded(project) == {
+            "test_sample.py::test_product": ["/products/1"],
+            "test_sample.py::test_user": ["/users/1"],
+            "test_sample.py::test_benchmark": ["/products/2"],
+            "test_sample.py::test_load": ["/products/3"],
+        }
+
+        result = project.runpytest_subprocess("-n", "2")
+        result.assert_outcomes(passed=4)
+        result.stdout.fnmatch_lines(["paths=2 fetched=2 elapsed=*ms served_from_snapshot=2"])
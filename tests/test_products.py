@@ -1,18 +1,19 @@
 # tests/test_products.py
+import threading
+import time
+
 import pytest
-from utils.api_client import APIClient
 from utils.test_data import TestData
 from config.config import Config
+from utils.codec import CODECS
+from utils.columnar import check_invariants
+from utils.pagination import PaginationError, iter_pages
+from utils.schemas import PRODUCT
 
+@pytest.mark.prefetch("/products", "/products/categories")
 class TestProductAPI:
+    # self.client: 세션 공유 APIClient (tests/conftest.py)
 
-    @classmethod
-    def setup_class(cls):
-        cls.client = APIClient()
-
-    @classmethod
-    def teardown_class(cls):
-        cls.client.close()
     # 전체 상품 목록 조회 상태 코드 확인
     #/products 호출 시 HTTP 상태 코드가 200 OK인지 확인
     def test_get_all_products_status_code(self):
@@ -25,10 +26,9 @@ class TestProductAPI:
         products = response.json()
         assert isinstance(products, list)
         assert len(products) > 0
-        first_product = products[0]
-        required_fields = ['id', 'title', 'price', 'category', 'description', 'image', 'rating']
-        for field in required_fields:
-            assert field in first_product
+        # 모든 상품의 필드/타입을 스키마로 검증 (utils/schemas.py)
+        errors = PRODUCT.check_many(products)
+        assert not errors, "\n".join(errors)
     # 단일 상품 조회 성공
     def test_get_single_product_success(self):
         product_id = 1
@@ -68,26 +68,99 @@ class TestProductAPI:
         for cat in expected_categories:
             assert cat in categories
     # 상품 가격 데이터 유효성 검증
+    # 목록을 스트리밍으로 파싱하면서 상품마다 검증 (첫 번째 잘못된 상품에서 바로 실패)
     def test_product_price_validation(self):
-        response = self.client.get("/products")
-        products = response.json()
-        for product in products:
+        def check_price(product):
             price = product['price']
             assert isinstance(price, (int, float))
             assert price > 0
             assert price <= Config.VALIDATION_RULES['price']['max']
-    # 상품 평점 데이터 유효성 검증
+
+        report = self.client.validate_stream("/products", check_price)
+        assert report.count > 0
+    # 상품 평점 데이터 유효성 검증 (Config.VALIDATION_RULES를 NumPy 열 연산으로 일괄 검증)
     def test_product_rating_validation(self):
         response = self.client.get("/products")
         products = response.json()
-        for product in products:
-            rating = product['rating']
-            assert 'rate' in rating
-            assert 'count' in rating
-            assert 0 <= rating['rate'] <= 5
-            assert rating['count'] >= 0
-    # 상품 조회 API 응답 시간
-    def test_product_response_time(self):
-        response, elapsed = self.client.measure_response_time('GET', '/products')
+        report = check_invariants(products, fields=("rating.rate", "rating.count"))
+        assert report.ok, report.format()
+    # 상품 조회 API 응답 시간 (--benchmark 옵션으로 반복 측정 및 기준선 비교)
+    @pytest.mark.benchmark(endpoint="GET /products")
+    def test_product_response_time(self, benchmark):
+        response = benchmark(self.client.get, '/products')
         assert response.status_code == 200
-        assert elapsed < Config.PERFORMANCE_THRESHOLD['response_time']
+        assert benchmark.median < benchmark.budget
+    # 응답 JSON은 처음 json() 호출 때 한 번만 디코딩하고 재사용 (utils/codec.py)
+    # 같은 경로를 다시 요청하면 새 응답이므로 디코딩 결과를 공유하지 않음
+    def test_response_json_decoded_once(self):
+        response = self.client.get("/products/1")
+        product = response.json()
+        assert response.json() is product
+        assert product["id"] == 1
+        again = self.client.get("/products/1")
+        assert again.json() == product and again.json() is not product
+    # 설치된 모든 JSON codec(orjson / 표준 라이브러리)의 인코딩 결과를 서버가 같은 값으로 해석하는지 확인
+    @pytest.mark.parametrize("codec", sorted(CODECS))
+    def test_codec_round_trip(self, codec):
+        payload = {"title": "Café ☕ \"quoted\"", "price": 13.5, "category": "electronics",
+                   "description": "x" * 1000, "image": "https://i.pravatar.cc", "stock": 2 ** 64}
+        assert CODECS[codec].loads(CODECS[codec].dumps(payload)) == payload
+        previous, self.client.codec = self.client.codec, CODECS[codec]
+        try:
+            response = self.client.post("/products", json=payload)
+        finally:
+            self.client.codec = previous
+        assert response.status_code in [200, 201]
+        created = response.json()
+        assert created["title"] == payload["title"] and created["price"] == payload["price"]
+    # limit / offset 페이지를 미리 받아오면서 원소 단위로 순회 (APIClient.iter_collection)
+    # 실제 FakeStore는 offset을 지원하지 않으므로 stand-in 서버에서만 실행
+    def test_iter_collection_matches_full_list(self, stand_in_server):
+        if stand_in_server is None:
+            pytest.skip("offset 페이지네이션은 stand-in 서버에서만 지원")
+        products = self.client.get("/products").json()
+        assert list(self.client.iter_collection("/products", page_size=3, prefetch=2)) == products
+        assert list(self.client.iter_collection("/products?sort=desc", page_size=7)) == products[::-1]
+        report = self.client.validate_collection("/products", PRODUCT, page_size=4)
+        assert report.count == len(products)
+    # 다음 페이지를 동시에 미리 요청하되 소비 위치보다 prefetch 페이지 이상 앞서가지 않음(backpressure)
+    # 서버가 offset을 무시해 같은 페이지가 반복되면 실패
+    def test_iter_pages_backpressure_and_repeated_page(self):
+        page_size, prefetch, total = 2, 3, 20
+        lock = threading.Lock()
+        state = {"consumed": 0, "running": 0, "max_running": 0, "max_ahead": 0}
+
+        def fetch_page(offset, limit):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+                # 요청하는 페이지 - 소비자가 읽고 있는 페이지
+                ahead = offset // page_size - state["consumed"] // page_size
+                state["max_ahead"] = max(state["max_ahead"], ahead)
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return list(range(offset, min(offset + limit, total)))
+
+        items = []
+        for item in iter_pages(fetch_page, page_size=page_size, prefetch=prefetch):
+            items.append(item)
+            time.sleep(0.005)  # 느린 소비자
+            with lock:
+                state["consumed"] += 1
+        assert items == list(range(total))
+        assert 2 <= state["max_running"] <= prefetch, state
+        assert prefetch - 1 <= state["max_ahead"] <= prefetch, state
+
+        # 중간에 닫으면 시작하지 않은 요청은 취소되고 더 이상 요청하지 않음
+        fetched = []
+        pages = iter_pages(lambda offset, limit: fetched.append(offset) or list(range(offset, offset + limit)),
+                           page_size=10, prefetch=3)
+        assert next(pages) == 0
+        pages.close()
+        count = len(fetched)
+        time.sleep(0.05)
+        assert len(fetched) == count and set(fetched) <= {0, 10, 20, 30}
+
+        with pytest.raises(PaginationError, match="repeats the previous page"):
+            list(iter_pages(lambda offset, limit: list(range(limit)), page_size=10, prefetch=2))
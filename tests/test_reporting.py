@@ -0,0 +1,81 @@
+"""
+Reporting Test Cases
+결과 JSONL 기록 / 요약 리포트 생성 / 클라이언트 오버헤드 프로파일 검증
+"""
+
+import json
+
+from utils.api_client import APIClient
+from utils.profiler import ClientProfiler
+from utils.report_builder import build_report
+from utils.result_sink import ResultSink
+
+
+class TestResultReporting:
+    """요청 결과 JSONL 기록과 스트리밍 요약"""
+
+    def test_requests_written_and_summarized(self, tmp_path):
+        """
+        TC-REPORT-01: APIClient 요청을 JSONL로 기록하고 요약 HTML 생성
+        Expected: 요청마다 레코드 1줄, 요약의 엔드포인트별 count가 요청 수와 일치
+        """
+        results = tmp_path / "results.jsonl"
+        sink = ResultSink(str(results), flush_every=2)
+        client = APIClient(cache=False, cassette=False, resilience=False)
+        client.results = sink
+        sink.current_test = "TC-REPORT-01"
+        try:
+            for product_id in (1, 2, 3):
+                assert client.get(f"/products/{product_id}").status_code == 200
+            assert client.get("/unknown").status_code == 404
+        finally:
+            client.close()
+        sink.test("TC-REPORT-01", "passed", 0.5)
+        sink.flush()
+
+        records = [json.loads(line) for line in results.read_text().splitlines()]
+        requests = [r for r in records if r["type"] == "request"]
+        assert len(requests) == 4
+        assert all(r["test"] == "TC-REPORT-01" and "total" in r["phases"] for r in requests)
+
+        builder = build_report(str(results), str(tmp_path / "summary.html"))
+        summary = builder.to_dict()
+        assert summary["tests"] == {"passed": 1}
+        assert summary["endpoints"]["GET /products/{id}"]["count"] == 3
+        assert summary["endpoints"]["GET /unknown"]["errors"] == 1
+        assert "GET /products/{id}" in (tmp_path / "summary.html").read_text()
+
+
+class TestClientProfiler:
+    """테스트별 네트워크 대기 / 클라이언트 CPU 시간 분해 (utils/profiler.py)"""
+
+    def test_profile_splits_network_decode_and_validation(self, tmp_path):
+        """
+        TC-REPORT-02: 요청 / 디코딩 / 검증 시간을 분리해서 기록하고 folded 스택 파일 생성
+        Expected: 요청 수 일치, 각 구간 시간 > 0, folded 파일의 모든 스택이 테스트 이름으로 시작
+        """
+        profiler = ClientProfiler(sampling=True)
+        profiler.sampler.interval = 0.001
+        client = APIClient(cache=False, cassette=False, resilience=False)
+        client.profiler = profiler
+        profiler.begin("TC-REPORT-02")
+        try:
+            products = [client.get(f"/products/{product_id}").json() for product_id in (1, 2, 3)]
+            # 검증 구간: 샘플이 잡힐 만큼 CPU를 쓰는 Python 루프
+            for _ in range(20_000):
+                assert all(product["price"] > 0 for product in products)
+        finally:
+            profile = profiler.end()
+            profiler.close()
+            client.close()
+
+        assert profile.requests == 3
+        assert profile.request > 0 and profile.decode > 0 and profile.validation > 0
+        assert profile.wall >= profile.network + profile.request + profile.decode
+        assert profile.samples > 0
+
+        folded = tmp_path / "profile.folded"
+        profiler.write_folded(str(folded))
+        lines = folded.read_text().splitlines()
+        assert lines and all(line.startswith("TC-REPORT-02;") for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
@@ -0,0 +1,188 @@
+"""
+Resilience Test Cases
+서킷 브레이커 / 재시도 예산 / AIMD 동시성 제한 / 재시도 정책의 상태 변화 (utils/resilience.py, 네트워크 사용 안 함)
+"""
+
+import asyncio
+
+import pytest
+import requests
+
+from config.config import Config
+from utils import resilience
+from utils.resilience import AIMDLimiter, CircuitBreaker, CircuitOpenError, ResiliencePolicy, RetryBudget
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(resilience)
+
+
+def _policy(**overrides):
+    return ResiliencePolicy(settings=dict(Config.RESILIENCE, **overrides))
+
+
+class TestCircuitBreaker:
+    def test_open_half_open_closed_transitions(self, clock):
+        """
+        TC-RES-01: 연속 실패 threshold회 -> open (요청 거부) -> reset_timeout 후 half-open (시험 요청 1건)
+        -> 시험 요청 성공 시 closed
+        """
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+        for _ in range(2):
+            breaker.before_request("GET /products")
+            breaker.record(False)
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_request("GET /products")
+        breaker.record(False)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.advance(9.9)
+        with pytest.raises(CircuitOpenError, match="open"):
+            breaker.before_request("GET /products")
+        clock.advance(0.1)
+        breaker.before_request("GET /products")
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError, match="half-open"):
+            breaker.before_request("GET /products")
+
+        breaker.record(True)
+        assert (breaker.state, breaker.failures) == (CircuitBreaker.CLOSED, 0)
+
+    def test_failed_trial_reopens(self, clock):
+        """TC-RES-02: half-open 시험 요청이 실패하면 threshold와 관계없이 다시 open"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5)
+        breaker.before_request("GET /carts")
+        breaker.record(False)
+        clock.advance(5)
+        breaker.before_request("GET /carts")
+        breaker.record(False)
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("GET /carts")
+
+
+class TestRetryBudget:
+    def test_min_per_second_then_tokens(self, clock):
+        """
+        TC-RES-03: 1초 구간마다 min_per_second회는 항상 허용, 그 이상은 요청마다 적립한 토큰 안에서만 허용
+        """
+        budget = RetryBudget(ratio=0.5, min_per_second=2)
+        assert [budget.withdraw() for _ in range(3)] == [True, True, False]
+        for _ in range(4):
+            budget.deposit()  # 0.5 x 4 = 토큰 2개
+        assert [budget.withdraw() for _ in range(3)] == [True, True, False]
+
+        clock.advance(1.0)
+        assert [budget.withdraw() for _ in range(3)] == [True, True, False]
+
+
+class TestAIMDLimiter:
+    def test_additive_increase_and_multiplicative_decrease(self, clock):
+        """
+        TC-RES-04: 성공 시 limit += 1/limit, 혼잡 시 절반 (cooldown 안의 연속 혼잡은 한 번만), min/max 범위 유지
+        """
+        limiter = AIMDLimiter(initial=4, min_limit=1, max_limit=5, decrease_cooldown=0.1)
+        for _ in range(4):
+            limiter.acquire()
+        assert limiter.in_flight == 4
+        limiter.release(congested=False)
+        assert limiter.limit == pytest.approx(4.25)
+
+        limiter.release(congested=True)
+        limiter.release(congested=True)
+        assert limiter.limit == pytest.approx(2.125)
+        clock.advance(0.1)
+        limiter.release(congested=True)
+        assert limiter.limit == pytest.approx(1.0625) and limiter.in_flight == 0
+
+        clock.advance(0.1)
+        limiter.acquire()
+        limiter.release(congested=True)
+        assert limiter.limit == 1
+        for _ in range(100):
+            limiter.acquire()
+            limiter.release(congested=False)
+        assert limiter.limit == 5
+
+
+class TestResiliencePolicy:
+    def test_retries_throttled_request_with_retry_after(self, clock, make_response):
+        """TC-RES-05: 503 + Retry-After면 헤더의 시간만큼 기다렸다가 재시도, POST 502는 재시도하지 않음"""
+        policy = _policy()
+        responses = iter([make_response(503, Retry_After="2"), make_response(200)])
+        assert policy.execute("GET", "/products", lambda: next(responses)).status_code == 200
+        assert clock.sleeps == [2.0]
+        assert (policy.stats["retries"], policy.stats["throttled"]) == (1, 1)
+
+        assert policy.execute("POST", "/carts", lambda: make_response(502)).status_code == 502
+        assert policy.stats["retries"] == 1
+
+    def test_exhausted_budget_stops_retries(self, clock, make_response):
+        """TC-RES-06: 재시도 예산이 없으면 재시도하지 않고 마지막 응답 반환"""
+        policy = _policy(retry_budget_ratio=0, retry_budget_min_per_second=1, max_retries=5)
+        calls = []
+
+        def send():
+            calls.append(1)
+            return make_response(503, Retry_After="0")
+
+        assert policy.execute("GET", "/products", send).status_code == 503
+        assert len(calls) == 2 and policy.stats["budget_exhausted"] == 1
+
+    def test_server_errors_open_endpoint_circuit(self, clock, make_response):
+        """
+        TC-RES-07: 재시도 후에도 실패한 5xx / 커넥션 에러만 엔드포인트 서킷 실패로 집계 (404 / 429는 제외)
+        Expected: 서킷은 엔드포인트(/products/{id})별로 열림
+        """
+        policy = _policy(max_retries=0, breaker_failure_threshold=2)
+        policy.execute("GET", "/products/1", lambda: make_response(404))
+        policy.execute("GET", "/products/1", lambda: make_response(429))
+        assert policy.breaker_for("GET /products/{id}").failures == 0
+
+        def refused():
+            raise requests.ConnectionError("refused")
+
+        with pytest.raises(requests.ConnectionError):
+            policy.execute("GET", "/products/1", refused)
+        policy.execute("GET", "/products/2", lambda: make_response(500))
+        with pytest.raises(CircuitOpenError):
+            policy.execute("GET", "/products/3", lambda: make_response(200))
+        assert policy.execute("GET", "/carts/1", lambda: make_response(200)).status_code == 200
+        assert policy.stats["circuit_rejected"] == 1
+
+    def test_unexpected_error_in_trial_reopens_circuit(self, clock, make_response):
+        """
+        TC-RES-08: half-open 시험 요청이 재시도 대상이 아닌 예외로 끝나도 실패로 기록
+        Expected: 서킷이 다시 open되고, reset_timeout 뒤에는 다음 시험 요청이 허용됨 (half-open에 갇히지 않음)
+        """
+        policy = _policy(max_retries=0, breaker_failure_threshold=1, breaker_reset_timeout=5)
+        policy.execute("GET", "/products", lambda: make_response(500))
+        clock.advance(5)
+
+        def truncated():
+            raise requests.exceptions.ChunkedEncodingError("truncated body")
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            policy.execute("GET", "/products", truncated)
+        assert policy.breaker_for("GET /products").state == CircuitBreaker.OPEN
+        clock.advance(5)
+        assert policy.execute("GET", "/products", lambda: make_response(200)).status_code == 200
+
+    def test_cancelled_async_trial_reopens_circuit(self, clock, make_response):
+        """TC-RES-09: execute_async의 시험 요청이 취소(CancelledError)되어도 같은 방식으로 실패로 기록"""
+        policy = _policy(max_retries=0, breaker_failure_threshold=1, breaker_reset_timeout=5)
+        policy.execute("GET", "/carts", lambda: make_response(503))
+        clock.advance(5)
+
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        async def ok():
+            return make_response(200)
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(policy.execute_async("GET", "/carts", cancelled))
+        assert policy.breaker_for("GET /carts").state == CircuitBreaker.OPEN
+        clock.advance(5)
+        assert asyncio.run(policy.execute_async("GET", "/carts", ok)).status_code == 200
@@ -0,0 +1,90 @@
+"""
+Response Cache Test Cases
+GET 응답 캐시의 TTL / 조건부 재검증 / LRU / 무효화 (utils/response_cache.py, 네트워크 사용 안 함)
+"""
+
+import pytest
+
+from utils import response_cache
+from utils.response_cache import ResponseCache, resource_root
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(response_cache)
+
+
+class TestTTLAndRevalidation:
+    def test_fresh_entry_is_served_until_ttl(self, clock, make_response):
+        """
+        TC-CACHE-01: TTL 안에서는 저장한 응답을 그대로 반환, TTL이 지나면 조건부 헤더 반환
+        """
+        cache = ResponseCache(max_entries=10, max_bytes=1024, ttl=30)
+        response = make_response(body=b'{"id": 1}', ETag='"v1"', Last_Modified="Mon, 01 Jan 2026 00:00:00 GMT")
+        cache.store("/products/1", response)
+
+        clock.advance(29.9)
+        assert cache.lookup("/products/1") == (response, None)
+        clock.advance(0.1)
+        cached, headers = cache.lookup("/products/1")
+        assert cached is None
+        assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT"}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["bytes_saved"]) == (1, 1, len(b'{"id": 1}'))
+
+    def test_revalidate_reuses_body_and_extends_ttl(self, clock, make_response):
+        """
+        TC-CACHE-02: 304 수신 후 revalidate()는 기존 응답을 반환하고 TTL을 다시 시작
+        """
+        cache = ResponseCache(max_entries=10, max_bytes=1024, ttl=30)
+        response = make_response(body=b"[1, 2]", ETag='"v1"')
+        cache.store("/products", response)
+        clock.advance(31)
+        assert cache.lookup("/products") == (None, {"If-None-Match": '"v1"'})
+
+        assert cache.revalidate("/products") is response
+        clock.advance(29)
+        assert cache.lookup("/products") == (response, None)
+        assert cache.stats()["revalidated"] == 1
+        assert cache.revalidate("/missing") is None
+
+    def test_expired_entry_without_validators_is_dropped(self, clock, make_response):
+        """TC-CACHE-03: ETag / Last-Modified가 없는 엔트리는 만료 시 제거되고 조건 없이 다시 요청"""
+        cache = ResponseCache(max_entries=10, max_bytes=1024, ttl=5)
+        cache.store("/users/1", make_response())
+        clock.advance(5)
+        assert cache.lookup("/users/1") == (None, None)
+        assert len(cache) == 0
+
+
+class TestStoreAndInvalidate:
+    def test_only_cacheable_responses_are_stored(self, make_response):
+        """TC-CACHE-04: 200이 아닌 응답 / no-store / max_bytes보다 큰 응답은 저장하지 않음"""
+        cache = ResponseCache(max_entries=10, max_bytes=8, ttl=30)
+        cache.store("/a", make_response(404))
+        cache.store("/b", make_response(Cache_Control="private, no-store"))
+        cache.store("/c", make_response(body=b"x" * 9))
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries_and_bytes(self, make_response):
+        """TC-CACHE-05: 최근에 조회한 엔트리는 남기고 가장 오래 사용하지 않은 엔트리부터 제거"""
+        cache = ResponseCache(max_entries=2, max_bytes=10, ttl=30)
+        cache.store("/a", make_response(body=b"aaa"))
+        cache.store("/b", make_response(body=b"bbb"))
+        cache.lookup("/a")
+        cache.store("/c", make_response(body=b"ccc"))
+        assert cache.lookup("/b") == (None, None)
+        assert cache.lookup("/a")[0] is not None and cache.lookup("/c")[0] is not None
+
+        cache.store("/d", make_response(body=b"dddddddd"))  # 3 + 8 > 10 바이트 -> /a, /c 모두 제거
+        assert len(cache) == 1 and cache.stats()["bytes"] == 8
+        assert cache.stats()["evictions"] == 3
+
+    def test_write_invalidates_same_resource(self, make_response):
+        """TC-CACHE-06: 같은 리소스 루트의 엔트리만 제거"""
+        cache = ResponseCache(max_entries=10, max_bytes=1024, ttl=30)
+        for path in ("/carts", "/carts/1", "/carts/user/2?limit=1", "/products/1"):
+            cache.store(path, make_response())
+        cache.invalidate("/carts/7")
+        assert len(cache) == 1 and cache.lookup("/products/1")[0] is not None
+        assert resource_root("/carts/1?x=y") == "/carts" and resource_root("") == "/"
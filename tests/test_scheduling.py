@@ -0,0 +1,75 @@
+"""
+Scheduling Test Cases
+실행 시간 기반 xdist 작업 단위 계획 / LPT 배정 (plugins/scheduling.py, 네트워크 사용 안 함)
+"""
+
+import pytest
+
+from config.config import Config
+from plugins.scheduling import load_history, plan_units, predicted_makespan, save_history
+
+
+def _ids(prefix, count):
+    return [f"tests/test_{prefix}.py::Test::test_{i}" for i in range(count)]
+
+
+class TestPlanUnits:
+    def test_groups_by_endpoint_and_sorts_longest_first(self):
+        """
+        TC-SCHED-01: 같은 리소스 경로를 쓰는 테스트는 한 단위, 기록이 없으면 클래스 단위, 예상 시간 내림차순
+        """
+        nodeids = ["t.py::A::a", "t.py::A::b", "t.py::B::c", "u.py::C::d", "u.py::C::e"]
+        history = {"t.py::A::a": 1.0, "t.py::A::b": 2.0, "t.py::B::c": 4.0, "u.py::C::d": 0.5, "u.py::C::e": 0.5}
+        endpoints = {"t.py::A::a": ["/products/1"], "t.py::B::c": ["/products?limit=5"], "t.py::A::b": ["/carts"]}
+        units = plan_units(nodeids, history, endpoints, workers=1)
+        assert units == [
+            ("/products", ["t.py::A::a", "t.py::B::c"], 5.0),
+            ("/carts", ["t.py::A::b"], 2.0),
+            ("u.py::C", ["u.py::C::d", "u.py::C::e"], 1.0),
+        ]
+
+    def test_oversized_group_is_split_with_lpt(self):
+        """
+        TC-SCHED-02: 전체 시간 / 워커 수보다 긴 그룹은 LPT로 나눠 담고, 각 단위는 원래 수집 순서 유지
+        Expected: [5, 4, 3, 3, 2, 1] -> 9 / 9 두 단위, 예상 critical path 11초 (나누지 않으면 18초)
+        """
+        heavy, light = _ids("heavy", 6), _ids("light", 1)
+        history = dict(zip(heavy, [5, 4, 3, 3, 2, 1]), **{light[0]: 2})
+        endpoints = {nodeid: ["/products"] for nodeid in heavy}
+        units = plan_units(heavy + light, history, endpoints, workers=2)
+
+        assert [(name, load) for name, _, load in units] == [("/products#0", 9), ("/products#1", 9),
+                                                               ("tests/test_light.py::Test", 2)]
+        assert units[0][1] == [heavy[0], heavy[3], heavy[5]]
+        assert units[1][1] == [heavy[1], heavy[2], heavy[4]]
+        assert predicted_makespan(units, workers=2) == 11
+        assert predicted_makespan([("all", heavy, 18), ("light", light, 2)], workers=2) == 18
+
+    def test_unknown_tests_use_median_or_default(self):
+        """TC-SCHED-03: 기록이 없는 테스트는 기록된 시간의 중앙값, 기록이 하나도 없으면 default_duration"""
+        nodeids = _ids("mixed", 4)
+        history = {nodeids[0]: 1.0, nodeids[1]: 3.0, nodeids[2]: 8.0}
+        units = plan_units(nodeids, history, {}, workers=1)
+        assert units == [("tests/test_mixed.py::Test", nodeids, 15.0)]
+        assert plan_units(nodeids[:2], {}, {}, workers=1)[0][2] == 2 * Config.SCHEDULING["default_duration"]
+
+    def test_lpt_assigns_to_least_loaded_worker(self):
+        """TC-SCHED-04: 긴 단위부터 가장 먼저 비는 워커에 배정"""
+        units = [(str(i), [], duration) for i, duration in enumerate([7, 5, 4, 3, 3, 2])]
+        # 워커 3개: [7, 2] [5, 3] [4, 3] -> 9
+        assert predicted_makespan(units, workers=3) == 9
+        assert predicted_makespan(units, workers=0) == 24
+
+
+class TestHistory:
+    def test_exponential_moving_average(self, tmp_path, monkeypatch):
+        """TC-SCHED-05: 기존 기록과 이번 실행 시간을 smoothing 비율로 합쳐 저장"""
+        monkeypatch.setitem(Config.SCHEDULING, "smoothing", 0.25)
+        path = str(tmp_path / "reports" / "durations.json")
+        assert load_history(path) == {}
+        save_history({"a": 4.0, "b": 1.0}, path)
+        save_history({"a": 8.0}, path)
+        assert load_history(path) == {"a": pytest.approx(5.0), "b": 1.0}
+
+        (tmp_path / "broken.json").write_text("{")
+        assert load_history(str(tmp_path / "broken.json")) == {}
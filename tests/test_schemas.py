@@ -0,0 +1,68 @@
+"""
+Schema Test Cases
+컴파일된 스키마 검증 함수의 오류 메시지 (utils/schemas.py, 네트워크 사용 안 함)
+"""
+
+import pytest
+
+from utils.fake_store_server import FakeStore
+from utils.schemas import CART, NUMBER, PRODUCT, Optional, Schema, SchemaError
+
+_store = FakeStore()
+
+
+class TestErrorMessages:
+    def test_valid_documents_have_no_errors(self):
+        """TC-SCHEMA-01: stand-in 데이터 전체가 PRODUCT / CART 스키마를 만족"""
+        assert PRODUCT.check_many(_store.products) == []
+        assert CART.check_many(_store.carts) == []
+
+    def test_every_violation_is_reported_with_path(self):
+        """
+        TC-SCHEMA-02: 첫 오류에서 멈추지 않고 모든 위반을 "경로: 기대 타입, 실제 타입" 형식으로 수집
+        """
+        product = dict(_store.products[0], price="109.95", rating={"rate": 3.9})
+        del product["title"]
+        assert PRODUCT.check(product) == [
+            "$.title: missing required field",
+            "$.price: expected number, got string",
+            "$.rating.count: missing required field",
+        ]
+
+    def test_nested_array_paths_include_indexes(self):
+        """TC-SCHEMA-03: 목록 / 중첩 배열 원소의 오류 경로에 인덱스 포함"""
+        carts = [dict(cart) for cart in _store.carts[:3]]
+        carts[2]["products"] = [{"productId": 1, "quantity": 1}, {"productId": None, "quantity": 2.5}]
+        carts[1]["products"] = {}
+        assert CART.check_many(carts) == [
+            "$[1].products: expected array, got object",
+            "$[2].products[1].productId: expected integer, got null",
+            "$[2].products[1].quantity: expected integer, got float",
+        ]
+        assert CART.check([], path="body") == ["body: expected object, got array"]
+
+    def test_exact_types_and_optional_fields(self):
+        """
+        TC-SCHEMA-04: bool은 integer / number로 통과하지 않고, Optional 필드는 없을 때만 건너뜀
+        """
+        schema = Schema("Item", {"id": int, "score": NUMBER, "note": Optional(str)})
+        assert schema.check({"id": 1, "score": 2}) == []
+        assert schema.check({"id": True, "score": False, "note": 3}) == [
+            "$.id: expected integer, got boolean",
+            "$.score: expected number, got boolean",
+            "$.note: expected string, got integer",
+        ]
+
+    def test_validate_raises_schema_error(self):
+        """TC-SCHEMA-05: validate()는 스키마 이름과 모든 오류를 담은 SchemaError (AssertionError)"""
+        with pytest.raises(SchemaError) as excinfo:
+            CART({"id": "1", "userId": 1, "date": "2026-01-01"})
+        assert isinstance(excinfo.value, AssertionError)
+        assert excinfo.value.errors == ["$.id: expected integer, got string", "$.products: missing required field"]
+        assert str(excinfo.value).startswith("Cart schema violations:\n$.id")
+
+    @pytest.mark.parametrize("spec, error", [({"x": [int, str]}, ValueError), ({"x": "int"}, TypeError)])
+    def test_invalid_spec_is_rejected(self, spec, error):
+        """TC-SCHEMA-06: 잘못된 스키마 선언은 Schema 생성 시 오류"""
+        with pytest.raises(error):
+            Schema("Broken", spec)
@@ -0,0 +1,81 @@
+"""
+Streaming JSON Test Cases
+청크 단위 JSON 배열 파싱 / 검증 (utils/streaming.py, 네트워크 사용 안 함)
+"""
+
+import json
+
+import pytest
+
+from utils.fake_store_server import FakeStore
+from utils.streaming import StreamValidationError, iter_json_array, validate_items
+
+_store = FakeStore()
+
+SAMPLES = [
+    b"[]",
+    b" [ ] ",
+    b"[109.95, 2, -0.5e-3, 1E+5, 0, -12]",
+    b'[true, false, null, "a,]\\"b", {"k": [1, {"x": 2.5}]}, []]',
+    '[{"title": "Café ☕ 한글"}, "€"]'.encode(),
+    json.dumps(_store.products[:3]).encode(),
+    json.dumps(_store.carts[:2], indent=2).encode(),
+]
+
+
+def _split_everywhere(body):
+    """모든 byte offset에서 두 청크로 나눈 경우 + 1바이트씩 나눈 경우"""
+    for offset in range(len(body) + 1):
+        yield [body[:offset], body[offset:]]
+    yield [body[i:i + 1] for i in range(len(body))]
+
+
+class TestIterJsonArray:
+    """청크 경계와 관계없이 json.loads와 같은 결과"""
+
+    @pytest.mark.parametrize("body", SAMPLES, ids=range(len(SAMPLES)))
+    def test_any_chunk_split_matches_json_loads(self, body):
+        """
+        TC-STREAM-01: 본문을 모든 byte offset에서 나눠도 같은 원소
+        (숫자 / 멀티바이트 UTF-8 / 문자열 안의 구분자가 청크 경계에 걸리는 경우 포함)
+        """
+        expected = json.loads(body)
+        for chunks in _split_everywhere(body):
+            assert list(iter_json_array(chunks)) == expected, chunks
+
+    @pytest.mark.parametrize("body", [b"{}", b"[1, 2", b"[1 2]", b"[1.x]", b"[1] 2", b"[tru]"])
+    def test_invalid_body_raises(self, body):
+        """TC-STREAM-02: 배열이 아니거나 잘못된 JSON이면 청크 경계와 관계없이 ValueError"""
+        for chunks in _split_everywhere(body):
+            with pytest.raises(ValueError):
+                list(iter_json_array(chunks))
+
+    def test_item_size_limit(self):
+        """TC-STREAM-03: 원소 하나가 max_item_bytes를 넘으면 ValueError"""
+        body = b'["' + b"x" * 100 + b'"]'
+        with pytest.raises(ValueError, match="exceeds"):
+            list(iter_json_array([body[i:i + 10] for i in range(0, len(body), 10)], max_item_bytes=50))
+
+    def test_item_size_limit_counts_utf8_bytes(self):
+        """
+        TC-STREAM-03-1: 멀티바이트 문자는 문자 수가 아니라 UTF-8 바이트 수로 제한
+        Expected: 32글자 / 92바이트 원소는 max_item_bytes=50이면 ValueError, 100이면 통과
+        """
+        body = ('["' + "한" * 30 + '"]').encode()
+        chunks = [body[i:i + 10] for i in range(0, len(body), 10)]  # 문자 중간에서 나뉘는 청크 포함
+        with pytest.raises(ValueError, match="exceeds 50 bytes"):
+            list(iter_json_array(chunks, max_item_bytes=50))
+        assert list(iter_json_array(chunks, max_item_bytes=100)) == ["한" * 30]
+
+
+class TestValidateItems:
+    def test_fail_fast_and_collect(self):
+        """TC-STREAM-04: fail_fast면 첫 실패의 index, 아니면 모든 실패를 StreamReport에 수집"""
+        def positive(item):
+            assert item > 0, f"{item} <= 0"
+
+        with pytest.raises(StreamValidationError, match=r"item\[1\]: -1 <= 0"):
+            validate_items(iter([3, -1, -2]), positive)
+        report = validate_items(iter([3, -1, -2]), positive, fail_fast=False)
+        assert report.count == 3 and [index for index, _ in report.errors] == [1, 2]
+        assert report.errors[0][1].startswith("-1 <= 0")
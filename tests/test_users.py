@@ -3,23 +3,19 @@ User API Test Cases
 사용자 API 테스트 케이스
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from utils.api_client import APIClient
+from utils.auth import TokenProvider
+from utils.response_cache import ResponseCache
+from utils.schemas import USER
 from utils.test_data import TestData
 
 
+@pytest.mark.prefetch("/users")
 class TestUserAPI:
-    """사용자 API 테스트 케이스"""
-    
-    @classmethod
-    def setup_class(cls):
-        """테스트 클래스 실행 전 1회 실행"""
-        cls.client = APIClient()
-    
-    @classmethod
-    def teardown_class(cls):
-        """테스트 클래스 종료 후 1회 실행"""
-        cls.client.close()
+    """사용자 API 테스트 케이스 (self.client: 세션 공유 APIClient)"""
     
     def test_get_all_users(self):
         """
@@ -49,29 +45,17 @@ class TestUserAPI:
         assert user['id'] == user_id, \
             f"Expected user id {user_id}, but got {user['id']}"
         
-        # 필수 필드 검증
-        required_fields = ['email', 'username', 'name', 'address', 'phone']
-        for field in required_fields:
-            assert field in user, f"Required field '{field}' is missing"
-        
-        # name 객체 내부 필드 검증
-        assert 'firstname' in user['name'], "firstname is missing in name"
-        assert 'lastname' in user['name'], "lastname is missing in name"
-        
-        # address 객체 내부 필드 검증
-        assert 'city' in user['address'], "city is missing in address"
-        assert 'street' in user['address'], "street is missing in address"
+        # 필수 필드 / name, address 내부 필드 검증 (utils/schemas.py)
+        USER.validate(user)
     
     def test_user_email_format_validation(self):
         """
         TC-025: 사용자 이메일 형식 검증
         실무: 이메일 유효성 검증
         Expected: 이메일 형식이 유효
+        (목록을 스트리밍으로 파싱하면서 사용자마다 검증)
         """
-        response = self.client.get("/users")
-        users = response.json()
-        
-        for user in users:
+        def check_email(user):
             email = user['email']
             
             # 이메일이 문자열인지 확인
@@ -91,6 +75,9 @@ class TestUserAPI:
             domain = email_parts[1]
             assert '.' in domain, \
                 f"User {user['id']}: Invalid email domain (missing .): {email}"
+
+        report = self.client.validate_stream("/users", check_email)
+        assert report.count > 0
     
     def test_user_phone_format(self):
         """
@@ -120,29 +107,16 @@ class TestUserAPI:
         response = self.client.get("/users")
         users = response.json()
         
-        required_address_fields = ['city', 'street', 'number', 'zipcode', 'geolocation']
-        required_geo_fields = ['lat', 'long']
-        
-        for user in users:
-            address = user['address']
-            
-            # 주소 필수 필드 확인
-            for field in required_address_fields:
-                assert field in address, \
-                    f"User {user['id']}: Address missing field '{field}'"
-            
-            # geolocation 필드 확인
-            geo = address['geolocation']
-            for field in required_geo_fields:
-                assert field in geo, \
-                    f"User {user['id']}: Geolocation missing field '{field}'"
+        # address / geolocation 필드를 포함한 전체 구조 검증, 오류는 "$[3].address.zipcode: ..." 형태로 모두 수집
+        errors = USER.check_many(users)
+        assert not errors, "\n".join(errors)
     
     def test_create_user_success(self):
         """
         TC-028: 사용자 생성 성공
         Expected: 생성된 사용자 정보 반환
         """
-        new_user = TestData.VALID_USER.copy()
+        new_user = TestData.valid_user()
         
         response = self.client.post("/users", json=new_user)
         
@@ -207,6 +181,63 @@ class TestUserAPI:
         assert response.status_code in [200,201]
         assert "token" in response.json()
 
+    def test_login_token_cached_across_clients(self, tmp_path):
+        """
+        TC-032: 인증 토큰 캐시
+        실무: 인증이 필요한 흐름마다 로그인하지 않고 토큰 재사용
+        Expected: 동시에 토큰을 요청해도 로그인 1회, 다른 워커(같은 토큰 파일)는 로그인 없이 토큰 사용,
+                  이후 요청에 Authorization 헤더 자동 추가
+        """
+        store_path = str(tmp_path / "tokens.json")
+        provider = TokenProvider(store_path=store_path)
+        clients = [APIClient(cache=False, cassette=False) for _ in range(4)]
+        try:
+            for client in clients:
+                client.auth = provider
+            with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+                tokens = list(executor.map(lambda c: c.authenticate(TestData.LOGIN_USER), clients))
+            assert len(set(tokens)) == 1
+            assert provider.stats["logins"] == 1, provider.stats
+
+            response = clients[0].get(f"/users/{TestData.EXISTING_USER['id']}")
+            assert response.status_code == 200
+            assert response.request.headers["Authorization"] == f"Bearer {tokens[0]}"
+        finally:
+            for client in clients:
+                client.close()
+
+        # 다른 xdist 워커의 provider는 파일에 저장된 토큰 사용
+        other_worker = TokenProvider(store_path=store_path)
+        assert other_worker.token(TestData.LOGIN_USER, login=pytest.fail) == tokens[0]
+        assert other_worker.stats["file_hits"] == 1
+
+    def test_authenticated_requests_bypass_shared_cache(self, tmp_path):
+        """
+        TC-032-1: 인증된 클라이언트는 경로로만 구분되는 응답 캐시 / 스냅샷을 사용하지 않음
+        Expected: 익명 클라이언트가 캐시한 응답을 인증된 클라이언트가 받지 않고, 인증된 응답도 캐시에 저장되지 않음
+        """
+        cache = ResponseCache(ttl=60)
+        path = f"/users/{TestData.EXISTING_USER['id']}"
+        anonymous = APIClient(cache=cache, cassette=False)
+        authenticated = APIClient(cache=cache, cassette=False)
+        try:
+            anonymous.get(path)
+            authenticated.snapshot = cache  # prefetch 스냅샷도 같은 ResponseCache
+            authenticated.auth = TokenProvider(store_path=str(tmp_path / "tokens.json"))
+            authenticated.authenticate(TestData.LOGIN_USER)
+            stats = cache.stats()
+            response = authenticated.get(path)
+            assert response.status_code == 200
+            assert response.request.headers["Authorization"].startswith("Bearer ")
+            assert cache.stats()["hits"] == stats["hits"] and cache.stats()["stores"] == stats["stores"]
+
+            authenticated.authenticate(None)
+            assert authenticated.get(path).request is not response.request
+            assert cache.stats()["hits"] == stats["hits"] + 1
+        finally:
+            anonymous.close()
+            authenticated.close()
+
     def test_user_login_invalid_credentials(self):
         """
         TC-033: 잘못된 인증 정보로 로그인 실패
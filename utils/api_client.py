@@ -1,31 +1,279 @@
 # utils/api_client.py
 import requests
 import time
+from contextlib import closing, nullcontext
 from config.config import Config
+from utils.auth import get_shared_provider
+from utils.cassette import get_shared_cassette
+from utils.codec import JSONResponse, decode, get_codec
+from utils.pagination import iter_pages, page_path
+from utils.profiler import get_shared_profiler
+from utils.resilience import get_shared_policy
+from utils.response_cache import ResponseCache, get_shared_cache
+from utils.result_sink import get_shared_sink
+from utils.streaming import iter_json_array, validate_items
+from utils.timing import RequestTiming, TimingAdapter, connection_stats, endpoint_key, recorder
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (GitHub Actions)",
+    "Accept": "application/json",
+    "Content-Type": "application/json"
+}
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
 
 class APIClient:
-    def __init__(self):
+    """
+    FakeStore API 동기 클라이언트
+    requests.Session 하나를 사용하며 커넥션 풀 크기는 Config.CONNECTION_POOL로 설정
+    (urllib3 커넥션 풀과 캐시/통계가 스레드 안전하므로 여러 스레드에서 공유 가능)
+    """
+
+    def __init__(self, cache=None, cassette=None, resilience=None):
+        """
+        cache: None이면 Config.CACHE['enabled']를 따름
+               True면 프로세스 공유 캐시, ResponseCache 인스턴스면 해당 캐시 사용
+        cassette: None이면 Config.CASSETTE['mode']에 따른 공유 카세트 (off면 사용 안 함)
+        resilience: None이면 Config.RESILIENCE에 따른 공유 재시도/동시성 정책, False면 사용 안 함
+        """
         self.base_url = Config.BASE_URL
         self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (GitHub Actions)",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        })
+        self.session.headers.update(DEFAULT_HEADERS)
+        pool = Config.CONNECTION_POOL
+        if not pool["keep_alive"]:
+            self.session.headers["Connection"] = "close"
+        adapter = TimingAdapter(pool_connections=pool["pool_connections"],
+                                pool_maxsize=pool["pool_maxsize"],
+                                pool_block=pool["pool_block"])
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # 요청 본문 인코딩 / 응답 디코딩 (Config.CODEC, orjson이 있으면 orjson)
+        self.codec = get_codec()
+        if cache is None:
+            cache = Config.CACHE["enabled"]
+        if isinstance(cache, ResponseCache):
+            self.cache = cache
+        else:
+            self.cache = get_shared_cache() if cache else None
+        self.cassette = get_shared_cassette() if cassette is None else (cassette or None)
+        self.resilience = get_shared_policy() if resilience is None else (resilience or None)
+        # Config.RESULTS['enabled']면 요청마다 결과를 JSONL 파일에 기록 (utils/result_sink.py)
+        self.results = get_shared_sink()
+        # Config.PROFILE['enabled']면 요청 / 디코딩 시간을 실행 중인 테스트의 프로파일에 기록 (utils/profiler.py)
+        self.profiler = get_shared_profiler()
+        # 세션 시작 시 미리 받아둔 GET 응답 (plugins/prefetch.py가 테스트마다 설정)
+        self.snapshot = None
+        # 요청마다 listener(method, path, response) 호출 (요청 기록 등 플러그인 확장용)
+        self.listeners = []
+        # authenticate()로 인증 정보를 설정하면 요청마다 Authorization 헤더 자동 추가 (utils/auth.py)
+        self.credentials = None
+        self.auth = get_shared_provider()
+
+    def authenticate(self, credentials):
+        """
+        이후 요청에 credentials로 받은 토큰을 Bearer 헤더로 붙임 (None이면 해제)
+        인증된 동안의 GET은 응답 캐시 / prefetch 스냅샷을 거치지 않음 (다른 사용자 / 익명 응답과 섞이지 않도록)
+        토큰은 프로세스 / xdist 워커 간에 공유되므로 인증 정보당 로그인은 한 번
+        """
+        self.credentials = credentials
+        return self.token() if credentials is not None else None
+
+    def token(self):
+        return self.auth.token(self.credentials, self._login)
+
+    def _login(self, credentials):
+        response = self._send_once("POST", Config.AUTH["login_path"], json=credentials)
+        response.raise_for_status()
+        return decode(self.codec, response.content)["token"]
+
+    def _with_auth(self, path, headers=None):
+        if self.credentials is None or path == Config.AUTH["login_path"]:
+            return headers
+        return {**(headers or {}), "Authorization": f"Bearer {self.token()}"}
+
+    def request(self, method, path, json=None):
+        """
+        응답은 JSONResponse 래퍼: json()은 처음 호출할 때 한 번만 디코딩 (utils/codec.py)
+        캐시 / 스냅샷 응답도 호출마다 새 래퍼로 감싸므로 디코딩 결과를 다른 테스트와 공유하지 않음
+        """
+        method = method.upper()
+        response = None
+        # 스냅샷 / 캐시는 경로만으로 응답을 공유하므로 인증된 요청에는 사용하지 않음 (_request)
+        if method == "GET" and self.snapshot is not None and self.credentials is None:
+            response, _ = self.snapshot.lookup(path)
+        if response is None:
+            response = self._request(method, path, json)
+        response = JSONResponse(response, self._decoder(response, endpoint_key(method, path)))
+        for listener in self.listeners:
+            listener(method, path, response)
+        return response
+
+    def _request(self, method, path, json):
+        if method == "GET" and self.cache is not None and self.credentials is None:
+            return self._cached_get(path)
+        response = self._send(method, path, json=json)
+        if method in WRITE_METHODS and self.cache is not None:
+            self.cache.invalidate(path)
+        return response
+
+    def _cached_get(self, path):
+        cached, conditional_headers = self.cache.lookup(path)
+        if cached is not None:
+            return cached
+        response = self._send("GET", path, headers=conditional_headers)
+        if response.status_code == 304:
+            revalidated = self.cache.revalidate(path)
+            if revalidated is not None:
+                return revalidated
+            # 재검증 도중 엔트리가 무효화된 경우 조건 없이 다시 요청
+            response = self._send("GET", path)
+        self.cache.store(path, response)
+        return response
+
+    def _send(self, method, path, json=None, headers=None):
+        authorized = self._with_auth(path, headers)
+        response = self._send_once(method, path, json, authorized)
+        if response.status_code == 401 and authorized is not headers:
+            # 서버가 토큰을 거부하면 캐시에서 지우고 한 번만 새 토큰으로 재요청
+            self.auth.invalidate(self.credentials, authorized["Authorization"].split(" ", 1)[1])
+            response = self._send_once(method, path, json, self._with_auth(path, headers))
+        return response
+
+    def _send_once(self, method, path, json=None, headers=None):
+        # 재생 모드면 네트워크 대신 카세트에서 응답 반환
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return self.cassette.play(method, path, json)
+        if self.resilience is not None:
+            response = self.resilience.execute(
+                method, path, lambda: self._timed_request(method, path, json, headers))
+        else:
+            response = self._timed_request(method, path, json, headers)
+        if self.cassette is not None and response.status_code != 304:
+            self.cassette.record(method, path, json, response)
+        return response
+
+    def _timed_request(self, method, path, json, headers):
+        """실제 HTTP 요청 1회 (재시도 시 시도마다 단계별 시간 기록)"""
+        timing = RequestTiming()
+        with timing.activate(), self._profile("request"):
+            # stream=True로 헤더 수신(TTFB)과 본문 다운로드를 분리해서 측정
+            # 본문은 requests의 json= 대신 codec으로 인코딩 (Content-Type은 DEFAULT_HEADERS)
+            body = self.codec.dumps(json) if json is not None else None
+            response = self.session.request(method, self.base_url + path, data=body,
+                                            headers=headers, stream=True)
+            timing.headers_received()
+            response.content
+            timing.body_received()
+        endpoint = endpoint_key(method, path)
+        recorder.record(endpoint, timing.phases)
+        connection_stats.record(timing.phases, timing.tls_resumed, timing.dns_cached)
+        if self.results is not None:
+            self.results.request(endpoint, response.status_code, timing.phases)
+        response.timing = timing
+        return response
+
+    def _profile(self, category):
+        return self.profiler.measure(category) if self.profiler is not None else nullcontext()
+
+    def _decoder(self, response, endpoint):
+        # 디코딩 시간을 decode 단계로 기록하는 codec.loads
+        def timed_decode(content):
+            started = time.perf_counter_ns()
+            try:
+                with self._profile("decode"):
+                    return decode(self.codec, content)
+            finally:
+                elapsed = time.perf_counter_ns() - started
+                timing = getattr(response, "timing", None)
+                if timing is not None:
+                    timing.add("decode", elapsed)
+                recorder.record(endpoint, {"decode": elapsed})
+
+        return timed_decode
+
     def get(self, path):
-        return self.session.get(self.base_url + path)
+        return self.request("GET", path)
 
     def post(self, path, json=None):
-        return self.session.post(self.base_url + path, json=json)
+        return self.request("POST", path, json=json)
 
     def put(self, path, json=None):
-        return self.session.put(self.base_url + path, json=json)
+        return self.request("PUT", path, json=json)
 
     def delete(self, path):
-        return self.session.delete(self.base_url + path)
+        return self.request("DELETE", path)
+
+    def iter_json(self, path):
+        """
+        JSON 배열 응답을 원소 단위로 yield (본문 전체를 메모리에 올리지 않음)
+        캐시/카세트 기록은 거치지 않으며, 재생 모드에서는 카세트 본문을 청크로 나눠 파싱
+        """
+        chunk_size = Config.STREAMING["chunk_size"]
+        if self.cassette is not None and self.cassette.mode == "replay":
+            response = self.cassette.play("GET", path)
+            response.raise_for_status()
+            content = response.content
+            yield from iter_json_array(content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+            return
+        if self.resilience is not None:
+            response = self.resilience.execute("GET", path, lambda: self._open_stream(path))
+        else:
+            response = self._open_stream(path)
+        try:
+            response.raise_for_status()
+            yield from iter_json_array(response.iter_content(chunk_size))
+        finally:
+            response.close()
+
+    def _open_stream(self, path):
+        """헤더까지만 받은 스트리밍 응답 (dns/connect/tls/ttfb만 기록)"""
+        timing = RequestTiming()
+        with timing.activate():
+            response = self.session.get(self.base_url + path, stream=True, headers=self._with_auth(path))
+            timing.headers_received()
+        if response.status_code != 200:
+            response.content  # 재시도 전에 커넥션을 풀로 반환
+        endpoint = endpoint_key("GET", path)
+        recorder.record(endpoint, timing.phases)
+        connection_stats.record(timing.phases, timing.tls_resumed, timing.dns_cached)
+        if self.results is not None:
+            self.results.request(endpoint, response.status_code, timing.phases)
+        response.timing = timing
+        return response
+
+    def validate_stream(self, path, *validators, fail_fast=True):
+        """
+        iter_json(path)의 원소마다 validator(item) 실행 (utils/streaming.py validate_items)
+        fail_fast=True면 첫 번째 잘못된 원소에서 StreamValidationError, 아니면 StreamReport에 모아서 반환
+        """
+        # 중간에 실패해도 스트림(커넥션)을 바로 닫도록 closing 사용
+        with closing(self.iter_json(path)) as items:
+            return validate_items(items, *validators, fail_fast=fail_fast)
+
+    def iter_collection(self, path, page_size=None, prefetch=None):
+        """
+        limit / offset 페이지로 목록을 나눠 받아 원소 단위로 yield (utils/pagination.py iter_pages)
+        다음 prefetch개 페이지는 백그라운드에서 동시에 요청하며, 받아둔 페이지 수는 prefetch 이하로 유지
+        서버가 offset을 무시해 같은 페이지가 반복되면 PaginationError
+        """
+        settings = Config.PAGINATION
+
+        def fetch_page(offset, limit):
+            response = self.get(page_path(path, offset, limit))
+            response.raise_for_status()
+            return response.json()
+
+        return iter_pages(fetch_page, page_size or settings["page_size"], prefetch or settings["prefetch"])
+
+    def validate_collection(self, path, *validators, page_size=None, prefetch=None, fail_fast=True):
+        """iter_collection(path)의 원소마다 validator(item) 실행 (validate_stream과 같은 StreamReport 반환)"""
+        # 중간에 실패하면 남은 페이지 요청을 취소하도록 closing 사용
+        with closing(self.iter_collection(path, page_size=page_size, prefetch=prefetch)) as items:
+            return validate_items(items, *validators, fail_fast=fail_fast)
 
     def measure_response_time(self, method, path, json=None):
-        start = time.time()
+        start = time.perf_counter_ns()
         if method.upper() == 'GET':
             response = self.get(path)
         elif method.upper() == 'POST':
@@ -36,7 +284,7 @@ class APIClient:
             response = self.delete(path)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         return response, elapsed
 
     def close(self):
@@ -0,0 +1,194 @@
+# utils/async_client.py
+import asyncio
+import time
+
+import aiohttp
+
+from config.config import Config
+from utils.api_client import DEFAULT_HEADERS
+from utils.cassette import get_shared_cassette
+from utils.codec import decode, get_codec
+from utils.resilience import get_shared_policy
+
+SUPPORTED_METHODS = ("GET", "POST", "PUT", "DELETE")
+
+
+class AsyncResponse:
+    """
+    aiohttp 응답을 requests.Response와 같은 형태로 감싼 객체
+    body를 미리 읽어두므로 커넥션 반환 후에도 사용 가능
+    json()은 처음 호출할 때 한 번만 디코딩 (utils/codec.py)
+    """
+
+    def __init__(self, status_code, headers, content, url, elapsed):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.elapsed = elapsed
+        self._json = None
+        self._decoded = False
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        if not self._decoded:
+            self._json = decode(get_codec(), self.content)
+            self._decoded = True
+        return self._json
+
+    def __repr__(self):
+        return f"<AsyncResponse [{self.status_code}]>"
+
+
+class AsyncAPIClient:
+    """
+    APIClient와 같은 get/post/put/delete/measure_response_time 메서드를 제공하는 비동기 클라이언트
+    gather()로 여러 요청을 동시 실행하며, 동시 실행 개수는 concurrency로 제한
+
+    동기 테스트에서는 run()으로 코루틴을 실행:
+        client = AsyncAPIClient()
+        responses = client.run(client.gather([("GET", "/products/1"), ("GET", "/products/2")]))
+        client.close()
+    """
+
+    def __init__(self, concurrency=None, timeout=None, cassette=None, resilience=None):
+        self.base_url = Config.BASE_URL
+        self.concurrency = concurrency or Config.ASYNC_CLIENT["concurrency"]
+        self.timeout = timeout or Config.ASYNC_CLIENT["timeout"]
+        self.cassette = get_shared_cassette() if cassette is None else (cassette or None)
+        self.resilience = get_shared_policy() if resilience is None else (resilience or None)
+        self.loop = None
+        self.session = None
+        self._session_loop = None  # session을 만든 이벤트 루프
+        self._stale_sessions = []  # 아직 살아 있는 다른 루프에서 만든 세션 (close() 때 그 루프에서 닫음)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _get_session(self):
+        # ClientSession은 만든 이벤트 루프에 묶이므로 다른 루프(이전 asyncio.run() 등)에서 만든 세션은 재사용하지 않음
+        loop = asyncio.get_running_loop()
+        if self.session is not None and self._session_loop is not loop:
+            await self._release_session()
+        if self.session is None or self.session.closed:
+            codec = get_codec()
+            self.session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                json_serialize=lambda value: codec.dumps(value).decode(),
+                connector=aiohttp.TCPConnector(limit=self.concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+        return self.session
+
+    async def _release_session(self):
+        """
+        현재 세션을 닫음
+        다른 루프에서 만든 세션은 그 루프가 이미 닫혔으면 (커넥션도 닫혔으므로) 바로 닫고,
+        아직 살아 있으면 close() 때 그 루프에서 닫도록 보관
+        """
+        session, loop = self.session, self._session_loop
+        self.session = self._session_loop = None
+        if session.closed:
+            return
+        if loop is asyncio.get_running_loop() or loop.is_closed():
+            await session.close()
+        else:
+            self._stale_sessions.append((session, loop))
+
+    async def request(self, method, path, json=None, headers=None):
+        method = method.upper()
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        if self.cassette is not None and self.cassette.mode == "replay":
+            played = self.cassette.play(method, path, json)
+            return AsyncResponse(played.status_code, played.headers, played.content, played.url, 0.0)
+        if self.resilience is not None:
+            response = await self.resilience.execute_async(
+                method, path, lambda: self._send(method, path, json, headers),
+                retryable_errors=(aiohttp.ClientConnectionError, asyncio.TimeoutError))
+        else:
+            response = await self._send(method, path, json, headers)
+        if self.cassette is not None:
+            self.cassette.record(method, path, json, response)
+        return response
+
+    async def _send(self, method, path, json, headers=None):
+        session = await self._get_session()
+        start = time.perf_counter()
+        async with session.request(method, self.base_url + path, json=json, headers=headers) as resp:
+            content = await resp.read()
+        elapsed = time.perf_counter() - start
+        return AsyncResponse(resp.status, resp.headers, content, str(resp.url), elapsed)
+
+    async def get(self, path):
+        return await self.request("GET", path)
+
+    async def post(self, path, json=None):
+        return await self.request("POST", path, json=json)
+
+    async def put(self, path, json=None):
+        return await self.request("PUT", path, json=json)
+
+    async def delete(self, path):
+        return await self.request("DELETE", path)
+
+    async def measure_response_time(self, method, path, json=None):
+        response = await self.request(method, path, json=json)
+        return response, response.elapsed
+
+    async def gather(self, requests, concurrency=None, return_exceptions=False):
+        """
+        여러 요청을 동시에 실행하고 요청 순서대로 응답 리스트 반환
+        requests: "/path" 또는 (method, path) / (method, path, json) 튜플 목록
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def _limited(spec):
+            if isinstance(spec, str):
+                spec = ("GET", spec)
+            async with semaphore:
+                return await self.request(*spec)
+
+        tasks = [asyncio.ensure_future(_limited(spec)) for spec in requests]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            # 하나가 실패하면 나머지 요청이 루프에 남아 커넥션을 잡고 있지 않도록 취소하고 정리될 때까지 기다림
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def run(self, coro):
+        """동기 코드(기존 테스트)에서 코루틴을 실행 - 클라이언트 전용 루프 재사용"""
+        if self.loop is None or self.loop.is_closed():
+            self.loop = asyncio.new_event_loop()
+        return self.loop.run_until_complete(coro)
+
+    async def aclose(self):
+        if self.session is not None:
+            await self._release_session()
+        loop = asyncio.get_running_loop()
+        stale, self._stale_sessions = self._stale_sessions, []
+        for session, session_loop in stale:
+            if session_loop is loop or session_loop.is_closed():
+                await session.close()
+            else:
+                self._stale_sessions.append((session, session_loop))
+
+    def close(self):
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.run_until_complete(self.aclose())
+            self.loop.close()
+        self.loop = None
@@ -0,0 +1,157 @@
+# utils/auth.py
+"""
+/auth/login 토큰 캐시
+- 인증 정보(username/password)별로 한 번만 로그인하고 만료 전까지 토큰 재사용
+- 같은 인증 정보로 동시에 토큰을 요청하면 한 스레드만 로그인하고 나머지는 결과를 기다림 (single-flight)
+- 토큰은 파일 락(flock)으로 보호되는 로컬 파일에 저장해 pytest-xdist 워커끼리 공유
+  다른 워커가 로그인 중이면 락을 기다렸다가 저장된 토큰을 사용하므로 전체 실행에서 로그인은 인증 정보당 1회
+- 만료 시각: JWT의 exp 클레임, 없으면 Config.AUTH['token_ttl']
+  만료 refresh_margin초 전부터는 새로 로그인
+
+    provider = TokenProvider()
+    token = provider.token(TestData.LOGIN_USER, login)   # login(credentials) -> 토큰 문자열
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+
+from config.config import Config
+from utils.file_lock import FileLock
+
+
+def credentials_key(credentials):
+    """인증 정보 식별자 (비밀번호를 파일에 남기지 않도록 해시)"""
+    raw = f"{credentials.get('username')}\0{credentials.get('password')}".encode()
+    return hashlib.sha256(raw).hexdigest()[:32]
+
+
+def token_expiry(token, issued_at, ttl):
+    """JWT면 exp 클레임, 아니면 발급 시각 + ttl"""
+    parts = token.split(".")
+    if len(parts) == 3:
+        try:
+            payload = parts[1] + "=" * (-len(parts[1]) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+            if isinstance(exp, (int, float)):
+                return float(exp)
+        except (ValueError, AttributeError):
+            pass
+    return issued_at + ttl
+
+
+class TokenProvider:
+    def __init__(self, store_path=None, ttl=None, refresh_margin=None):
+        settings = Config.AUTH
+        self.store_path = settings["store_path"] if store_path is None else store_path
+        self.ttl = settings["token_ttl"] if ttl is None else ttl
+        self.refresh_margin = settings["refresh_margin"] if refresh_margin is None else refresh_margin
+        self._tokens = {}  # key -> (token, expires_at)
+        self._locks = {}
+        self._lock = threading.Lock()
+        self.stats = {"logins": 0, "memory_hits": 0, "file_hits": 0, "invalidations": 0}
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _fresh(self, entry):
+        return entry is not None and entry[1] - self.refresh_margin > time.time()
+
+    def token(self, credentials, login):
+        key = credentials_key(credentials)
+        entry = self._tokens.get(key)
+        if self._fresh(entry):
+            self._count("memory_hits")
+            return entry[0]
+        # 같은 인증 정보의 갱신은 프로세스 안에서 한 번만 (single-flight)
+        with self._key_lock(key):
+            entry = self._tokens.get(key)
+            if self._fresh(entry):
+                self._count("memory_hits")
+                return entry[0]
+            entry = self._load_or_login(key, credentials, login)
+            self._tokens[key] = entry
+            return entry[0]
+
+    def invalidate(self, credentials, token=None):
+        """서버가 토큰을 거부한 경우 (token을 주면 그 토큰이 아직 캐시에 있을 때만) 삭제"""
+        key = credentials_key(credentials)
+        with self._key_lock(key):
+            entry = self._tokens.get(key)
+            if entry is None or (token is not None and entry[0] != token):
+                return
+            del self._tokens[key]
+            self._count("invalidations")
+            if self.store_path is not None:
+                with FileLock(self._lock_path()):
+                    entries = self._read_store()
+                    if entries.get(key, {}).get("token") == entry[0]:
+                        del entries[key]
+                        self._write_store(entries)
+
+    def _load_or_login(self, key, credentials, login):
+        if self.store_path is None:
+            return self._login(credentials, login)
+        # 배타 락을 잡은 채로 로그인하므로 다른 워커는 기다렸다가 저장된 토큰을 사용 (프로세스 간 single-flight)
+        with FileLock(self._lock_path()):
+            stored = self._read_store().get(key)
+            if stored is not None:
+                entry = (stored["token"], stored["expires_at"])
+                if self._fresh(entry):
+                    self._count("file_hits")
+                    return entry
+            entry = self._login(credentials, login)
+            entries = self._read_store()
+            entries[key] = {"token": entry[0], "expires_at": entry[1]}
+            self._write_store(entries)
+            return entry
+
+    def _login(self, credentials, login):
+        issued_at = time.time()
+        token = login(credentials)
+        self._count("logins")
+        return token, token_expiry(token, issued_at, self.ttl)
+
+    def _count(self, field):
+        with self._lock:
+            self.stats[field] += 1
+
+    def _lock_path(self):
+        directory = os.path.dirname(self.store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return self.store_path + ".lock"
+
+    def _read_store(self):
+        try:
+            with open(self.store_path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {k: v for k, v in entries.items() if v.get("expires_at", 0) > now}
+
+    def _write_store(self, entries):
+        tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+        # 토큰이 들어 있으므로 소유자만 읽을 수 있게 생성
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.store_path)
+
+
+_shared_provider = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_provider():
+    """프로세스 공유 TokenProvider (모든 APIClient가 같은 메모리 캐시 사용)"""
+    global _shared_provider
+    with _shared_lock:
+        if _shared_provider is None:
+            _shared_provider = TokenProvider()
+        return _shared_provider
@@ -0,0 +1,150 @@
+# utils/benchmark.py
+"""
+벤치마크 통계 / 기준선(baseline) 저장 및 비교
+- 기준선: 버전이 있는 JSON 파일 (원본 샘플 + 중앙값/백분위수/분산)
+- 비교: Mann-Whitney U 검정(단측, 현재가 더 느린지) + 중앙값 비율의 bootstrap 신뢰구간
+- 통계적으로 유의하고(p < alpha) 중앙값이 min_regression 이상 느려졌을 때만 회귀로 판정
+"""
+
+import json
+import math
+import os
+import platform
+import random
+import statistics
+from datetime import datetime, timezone
+
+from config.config import Config
+
+SCHEMA_VERSION = 1
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[max(1, math.ceil(p / 100 * len(ordered))) - 1]
+
+    return {
+        "rounds": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p90": pct(90),
+        "p99": pct(99),
+        "variance": statistics.variance(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def mann_whitney_greater(current, baseline):
+    """
+    current가 baseline보다 큰지(느린지) 단측 Mann-Whitney U 검정
+    정규 근사 + 동순위(tie) 보정 + 연속성 보정, (U, p-value) 반환
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = average_rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_median_ratio(current, baseline, iterations=None, confidence=0.95, seed=0):
+    """current/baseline 중앙값 비율의 bootstrap 신뢰구간 (low, high)"""
+    iterations = iterations or Config.BENCHMARK["bootstrap_iterations"]
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(iterations):
+        cur = statistics.median(rng.choices(current, k=len(current)))
+        base = statistics.median(rng.choices(baseline, k=len(baseline)))
+        ratios.append(cur / base if base else math.inf)
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (iterations - 1))]
+    high = ratios[int((1 - tail) * (iterations - 1))]
+    return low, high
+
+
+def compare(current, baseline, alpha=None, min_regression=None):
+    """현재 샘플과 기준선 샘플 비교 결과"""
+    settings = Config.BENCHMARK
+    alpha = settings["alpha"] if alpha is None else alpha
+    min_regression = settings["min_regression"] if min_regression is None else min_regression
+    _, p_value = mann_whitney_greater(current, baseline)
+    base_median = statistics.median(baseline)
+    ratio = statistics.median(current) / base_median if base_median else math.inf
+    ci_low, ci_high = bootstrap_median_ratio(current, baseline)
+    return {
+        "p_value": p_value,
+        "median_ratio": ratio,
+        "ci": (ci_low, ci_high),
+        "regression": p_value < alpha and ratio > 1 + min_regression,
+    }
+
+
+def budget_for(endpoint):
+    """Config.PERFORMANCE_THRESHOLD의 엔드포인트별 응답 시간 예산 (없으면 기본값)"""
+    thresholds = Config.PERFORMANCE_THRESHOLD
+    return thresholds.get("endpoints", {}).get(endpoint, thresholds["response_time"])
+
+
+class BaselineStore:
+    """benchmarks/baseline.json 읽기/쓰기"""
+
+    def __init__(self, path=None):
+        self.path = path or Config.BENCHMARK["baseline_path"]
+        self.benchmarks = {}
+        self.loaded_version = None
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                data = json.load(f)
+            self.loaded_version = data.get("schema_version")
+            # 스키마 버전이 다르면 기준선을 무시하고 다시 저장하도록 함
+            if self.loaded_version == SCHEMA_VERSION:
+                self.benchmarks = data.get("benchmarks", {})
+
+    def get(self, name):
+        return self.benchmarks.get(name)
+
+    def update(self, name, endpoint, samples):
+        self.benchmarks[name] = {"endpoint": endpoint, **summarize(samples), "samples": samples}
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "schema_version": SCHEMA_VERSION,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "environment": {
+                "base_url": Config.BASE_URL,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "benchmarks": dict(sorted(self.benchmarks.items())),
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
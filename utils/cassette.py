@@ -0,0 +1,203 @@
+# utils/cassette.py
+"""
+요청/응답 녹화(record) & 재생(replay) 카세트
+
+파일 구성 (path = cassettes/fakestore):
+- fakestore.cassette : append-only 레코드 파일
+    [MAGIC][레코드 헤더(key 16B, meta 길이 4B, body 길이 4B)][meta JSON][body] ...
+- fakestore.idx      : key 기준 정렬된 고정 길이 인덱스 (key 16B, offset 8B)
+    헤더에 인덱싱 당시 카세트 파일 크기를 기록해 오래된 인덱스를 감지
+
+재생 시 두 파일을 mmap으로 열고 인덱스를 이진 탐색하므로 시작 시 파싱 비용이 없음
+녹화는 파일 락(flock) 안에서 append 하므로 pytest-xdist 워커가 동시에 녹화/재생해도 안전
+"""
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from datetime import timedelta
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config.config import Config
+from utils.file_lock import FileLock
+
+DATA_MAGIC = b"APICAS01"
+INDEX_MAGIC = b"APIIDX01"
+RECORD_HEADER = struct.Struct("<16sII")
+INDEX_HEADER = struct.Struct("<8sQQ")   # magic, 인덱싱된 카세트 크기, 엔트리 수
+INDEX_ENTRY = struct.Struct("<16sQ")
+
+# requests가 이미 디코딩한 본문을 저장하므로 전송 관련 헤더는 제외
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class CassetteMiss(LookupError):
+    """재생 모드에서 녹화되지 않은 요청을 보낸 경우"""
+
+
+def request_key(method, path, json_body=None):
+    """method + path + 정규화된 JSON body로 16바이트 키 생성"""
+    body = "" if json_body is None else json.dumps(json_body, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(f"{method.upper()} {path}\n{body}".encode(), digest_size=16).digest()
+
+
+class Cassette:
+    def __init__(self, path, mode):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.mode = mode
+        self.data_path = path + ".cassette"
+        self.index_path = path + ".idx"
+        self.lock_path = path + ".lock"
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._data = None
+        self._index = None
+        self._count = 0
+        directory = os.path.dirname(self.data_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if mode == "replay":
+            self._open_for_replay()
+
+    def __len__(self):
+        return self._count
+
+    # ---------- record ----------
+
+    def record(self, method, path, json_body, response):
+        meta = {
+            "method": method.upper(),
+            "path": path,
+            "status": response.status_code,
+            "reason": getattr(response, "reason", None),
+            "url": response.url,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in SKIPPED_HEADERS},
+        }
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode()
+        body = response.content or b""
+        header = RECORD_HEADER.pack(request_key(method, path, json_body), len(meta_bytes), len(body))
+        with self._lock, FileLock(self.lock_path):
+            with open(self.data_path, "ab") as f:
+                if f.tell() == 0:
+                    f.write(DATA_MAGIC)
+                f.write(header + meta_bytes + body)
+            self._dirty = True
+
+    def build_index(self):
+        """카세트 파일의 레코드 헤더만 훑어서 정렬된 인덱스 파일을 다시 작성 (같은 키는 마지막 레코드 우선)"""
+        with FileLock(self.lock_path):
+            offsets = {}
+            with open(self.data_path, "rb") as f:
+                if f.read(len(DATA_MAGIC)) != DATA_MAGIC:
+                    raise ValueError(f"Not a cassette file: {self.data_path}")
+                offset = len(DATA_MAGIC)
+                while True:
+                    header = f.read(RECORD_HEADER.size)
+                    if len(header) < RECORD_HEADER.size:
+                        break
+                    key, meta_len, body_len = RECORD_HEADER.unpack(header)
+                    offsets[key] = offset
+                    offset += RECORD_HEADER.size + meta_len + body_len
+                    f.seek(offset)
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, offset, len(offsets)))
+                for key in sorted(offsets):
+                    f.write(INDEX_ENTRY.pack(key, offsets[key]))
+            # 다른 워커가 읽는 중이어도 안전하도록 원자적으로 교체
+            os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    # ---------- replay ----------
+
+    def _open_for_replay(self):
+        if not os.path.exists(self.data_path):
+            raise FileNotFoundError(f"Cassette not found: {self.data_path} (record it first)")
+        with open(self.data_path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if not self._index_is_current():
+            self.build_index()
+        with open(self.index_path, "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, self._count = INDEX_HEADER.unpack_from(self._index, 0)
+
+    def _index_is_current(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, indexed_size, _ = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return magic == INDEX_MAGIC and indexed_size == len(self._data)
+
+    def _find(self, key):
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_key, offset = INDEX_ENTRY.unpack_from(self._index, INDEX_HEADER.size + mid * INDEX_ENTRY.size)
+            if entry_key == key:
+                return offset
+            if entry_key < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def play(self, method, path, json_body=None):
+        offset = self._find(request_key(method, path, json_body))
+        if offset is None:
+            raise CassetteMiss(f"No recorded interaction for {method.upper()} {path}")
+        _, meta_len, body_len = RECORD_HEADER.unpack_from(self._data, offset)
+        start = offset + RECORD_HEADER.size
+        meta = json.loads(self._data[start:start + meta_len])
+        body = self._data[start + meta_len:start + meta_len + body_len]
+
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.url = meta["url"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(0)
+        response._content = body
+        return response
+
+    def close(self):
+        if self.mode == "record" and self._dirty:
+            self.build_index()
+        for mapped in (self._data, self._index):
+            if mapped is not None:
+                mapped.close()
+        self._data = self._index = None
+
+
+_shared_cassette = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_cassette():
+    """Config.CASSETTE 설정에 따른 프로세스 공유 카세트 (mode가 off면 None)"""
+    global _shared_cassette
+    settings = Config.CASSETTE
+    if settings["mode"] == "off":
+        return None
+    with _shared_lock:
+        if _shared_cassette is None:
+            _shared_cassette = Cassette(settings["path"], settings["mode"])
+        return _shared_cassette
+
+
+@atexit.register
+def close_shared_cassette():
+    global _shared_cassette
+    with _shared_lock:
+        if _shared_cassette is not None:
+            _shared_cassette.close()
+            _shared_cassette = None
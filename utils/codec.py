@@ -0,0 +1,119 @@
+# utils/codec.py
+"""
+JSON 인코딩 / 디코딩 백엔드 (Config.CODEC['backend'], API_JSON_CODEC)
+- orjson이 설치되어 있으면 orjson, 없으면 표준 라이브러리 json (auto)
+- APIClient / AsyncAPIClient의 요청 본문 인코딩과 응답 디코딩이 같은 codec을 사용
+- orjson이 처리하지 못하는 값(64비트를 넘는 정수 등)은 표준 라이브러리로 인코딩
+
+응답 래퍼 JSONResponse:
+- json()은 처음 호출할 때 한 번만 디코딩하고 결과를 재사용 (text도 한 번만 디코딩)
+- 나머지 속성(status_code, headers, content, timing ...)은 감싼 requests.Response에 위임
+- APIClient.request() 호출마다 새 래퍼를 만들므로 캐시 / 스냅샷 응답을 여러 테스트가 받아도
+  디코딩 결과(list / dict)를 공유하지 않음
+
+    codec = get_codec()
+    body = codec.dumps({"userId": 1})   # bytes
+    data = codec.loads(response.content)
+"""
+
+import json
+
+from requests.exceptions import JSONDecodeError
+
+from config.config import Config
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+class StdlibCodec:
+    name = "stdlib"
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(value):
+        # requests의 json= 인코딩과 같이 NaN / Infinity는 허용하지 않음
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode()
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(value):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return StdlibCodec.dumps(value)
+
+
+CODECS = {"stdlib": StdlibCodec}
+if orjson is not None:
+    CODECS["orjson"] = OrjsonCodec
+
+
+def get_codec(name=None):
+    """name(기본값 Config.CODEC['backend']): auto / orjson / stdlib"""
+    name = name or Config.CODEC["backend"]
+    if name == "auto":
+        return CODECS.get("orjson", StdlibCodec)
+    if name not in CODECS:
+        raise ValueError(f"Unknown or unavailable JSON codec: {name} (available: {', '.join(CODECS)})")
+    return CODECS[name]
+
+
+def decode(codec, content):
+    """codec.loads + requests.Response.json()과 같은 예외(requests.exceptions.JSONDecodeError)"""
+    try:
+        return codec.loads(content)
+    except json.JSONDecodeError as error:  # orjson.JSONDecodeError 포함
+        raise JSONDecodeError(error.msg, error.doc, error.pos) from error
+    except ValueError as error:
+        raise JSONDecodeError(str(error), "", 0) from error
+
+
+_UNSET = object()
+
+
+class JSONResponse:
+    """requests.Response 래퍼: JSON 본문을 처음 json() 호출 시 한 번만 디코딩"""
+
+    def __init__(self, response, loads):
+        """loads: content(bytes) -> 값 (APIClient가 디코딩 시간 기록을 포함해서 전달)"""
+        if isinstance(response, JSONResponse):  # 스냅샷에 저장된 래퍼 응답
+            response = response.response
+        self.response = response
+        self._loads = loads
+        self._json = _UNSET
+        self._text = None
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+    def json(self, **kwargs):
+        if kwargs:  # object_hook 등 옵션이 있으면 requests 기본 동작 (메모하지 않음)
+            return self.response.json(**kwargs)
+        if self._json is _UNSET:
+            self._json = self._loads(self.response.content)
+        return self._json
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = self.response.text
+        return self._text
+
+    def __bool__(self):
+        return bool(self.response)
+
+    def __repr__(self):
+        return repr(self.response)
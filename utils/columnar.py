@@ -0,0 +1,178 @@
+# utils/columnar.py
+"""
+숫자 필드 불변식(invariant) 일괄 검증
+- 목록 응답을 필드별 NumPy 열(column)로 변환한 뒤 Config.VALIDATION_RULES의 규칙을 배열 연산으로 한 번에 평가
+- 필드 경로: "price", "rating.rate", "products[].quantity" (목록 원소의 필드는 원래 레코드 인덱스를 함께 보관)
+- 필드가 없거나 숫자가 아닌 값은 NaN이 되어 모든 규칙에서 위반으로 보고
+
+    report = check_invariants(products)
+    assert report.ok, report.format()
+"""
+
+import math
+
+import numpy as np
+
+from config.config import Config
+
+_OPERATORS = {
+    "min": (np.greater_equal, ">="),
+    "max": (np.less_equal, "<="),
+    "gt": (np.greater, ">"),
+    "lt": (np.less, "<"),
+}
+
+
+_NUMERIC_TYPES = {int, float}
+
+
+def _number(value):
+    # bool은 int의 하위 타입이지만 숫자 필드 값으로 인정하지 않음
+    return value if type(value) is int or type(value) is float else math.nan
+
+
+def _lookup(record, keys):
+    for key in keys:
+        if type(record) is not dict:
+            return math.nan
+        record = record.get(key)
+    return _number(record)
+
+
+class Column:
+    """필드 하나의 값 배열 (float64), owners: 값마다 원래 레코드 인덱스"""
+
+    def __init__(self, field, values, owners):
+        self.field = field
+        self.values = values
+        self.owners = owners
+
+
+def _pluck(records, keys):
+    """records[*][k1][k2]... 를 레벨마다 list comprehension으로 추출 (빠른 경로, 형태가 다르면 예외)"""
+    for key in keys:
+        records = [record[key] for record in records]
+    return records
+
+
+def _to_array(raw):
+    if not set(map(type, raw)) <= _NUMERIC_TYPES:
+        raise TypeError("non-numeric value")
+    return np.array(raw, dtype=np.float64)
+
+
+def extract_column(records, field):
+    """
+    필드 경로의 값을 열로 추출
+    모든 레코드 형태가 올바르면 comprehension + np.array로 한 번에 변환하고,
+    필드 누락/타입 오류가 있으면 레코드별로 NaN을 채우는 느린 경로로 다시 추출
+    """
+    if "[]." in field:
+        list_field, _, item_field = field.partition("[].")
+        list_keys, item_keys = list_field.split("."), item_field.split(".")
+        try:
+            lists = _pluck(records, list_keys)
+            if not set(map(type, lists)) <= {list}:
+                raise TypeError("non-list value")
+            owners = np.repeat(np.arange(len(records), dtype=np.int64), list(map(len, lists)))
+            values = _to_array(_pluck([item for items in lists for item in items], item_keys))
+            return Column(field, values, owners)
+        except (KeyError, TypeError, IndexError):
+            pass
+        values, owners = [], []
+        for index, record in enumerate(records):
+            items = _lookup_list(record, list_keys)
+            if items is None:
+                # 목록 자체가 없으면 해당 레코드를 위반으로 보고하도록 NaN 하나 추가
+                values.append(math.nan)
+                owners.append(index)
+                continue
+            for item in items:
+                values.append(_lookup(item, item_keys))
+                owners.append(index)
+        return Column(field, np.array(values, dtype=np.float64), np.array(owners, dtype=np.int64))
+
+    keys = field.split(".")
+    owners = np.arange(len(records), dtype=np.int64)
+    try:
+        return Column(field, _to_array(_pluck(records, keys)), owners)
+    except (KeyError, TypeError, IndexError):
+        pass
+    values = np.fromiter((_lookup(record, keys) for record in records), dtype=np.float64, count=len(records))
+    return Column(field, values, owners)
+
+
+def _lookup_list(record, keys):
+    for key in keys:
+        if type(record) is not dict:
+            return None
+        record = record.get(key)
+    return record if type(record) is list else None
+
+
+class InvariantReport:
+    def __init__(self, count):
+        self.count = count
+        self.violations = []  # (field, 규칙 설명, 위반 레코드 인덱스 배열)
+
+    @property
+    def ok(self):
+        return not self.violations
+
+    def indices(self, field=None):
+        """위반 레코드 인덱스 (field를 주면 해당 필드만)"""
+        selected = [idx for f, _, idx in self.violations if field is None or f == field]
+        if not selected:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(selected))
+
+    def format(self, limit=10):
+        lines = [f"{len(self.violations)} invariant(s) violated in {self.count} records"]
+        for field, rule, indices in self.violations:
+            shown = ", ".join(str(i) for i in indices[:limit])
+            more = f", ... (+{len(indices) - limit})" if len(indices) > limit else ""
+            lines.append(f"  {field} {rule}: {len(indices)} record(s) at [{shown}{more}]")
+        return "\n".join(lines)
+
+
+def check_column(column, rules):
+    """열 하나에 규칙 dict 적용 -> [(규칙 설명, 위반 레코드 인덱스)]"""
+    values = column.values
+    missing = np.isnan(values)
+    results = []
+    if missing.any():
+        results.append(("is a number", np.unique(column.owners[missing])))
+    for name, bound in rules.items():
+        if name == "integer":
+            if not bound:
+                continue
+            bad = ~missing & (np.mod(values, 1) != 0)
+            description = "is an integer"
+        elif name in _OPERATORS:
+            compare, symbol = _OPERATORS[name]
+            # NaN은 이미 위에서 보고했으므로 중복 집계하지 않음
+            bad = ~missing & ~compare(values, bound)
+            description = f"{symbol} {bound}"
+        else:
+            raise ValueError(f"Unknown validation rule '{name}' for {column.field}")
+        if bad.any():
+            results.append((description, np.unique(column.owners[bad])))
+    return results
+
+
+def check_invariants(records, fields=None, rules=None):
+    """
+    records에 규칙을 일괄 적용
+    fields: 검사할 필드 경로 (기본값: 첫 레코드에 최상위 키가 있는 규칙 전체)
+    rules: 필드 경로 -> 규칙 dict (기본값: Config.VALIDATION_RULES)
+    """
+    rules = Config.VALIDATION_RULES if rules is None else rules
+    if fields is None:
+        first = records[0] if records and type(records[0]) is dict else {}
+        fields = [field for field in rules if field.split(".", 1)[0].split("[", 1)[0] in first]
+    report = InvariantReport(len(records))
+    for field in fields:
+        column = extract_column(records, field)
+        for description, indices in check_column(column, rules[field]):
+            report.violations.append((field, description, indices))
+    return report
@@ -0,0 +1,230 @@
+# utils/connection_cache.py
+"""
+새 커넥션 비용 줄이기: DNS 조회 캐시 + TLS 세션 재개
+- DNSCache: getaddrinfo 결과를 TTL 동안 재사용
+  store_path를 주면 파일(flock)로 xdist 워커끼리 조회 결과를 공유
+- TLSSessionStore / ResumingSSLContext: 서버별 마지막 TLS 세션을 보관했다가 새 커넥션의 handshake에 전달
+  (세션 재개 시 인증서 교환 / 키 교환 생략)
+  표준 ssl 모듈의 SSLSession은 직렬화할 수 없으므로 세션 재개는 프로세스 내부(모든 APIClient 공유)에서만 동작
+
+SSLSession은 만든 SSLContext에서만 사용할 수 있으므로 커넥션은 get_ssl_context()로
+검증 설정(verify / CA 번들 / 클라이언트 인증서)별로 공유되는 SSLContext를 사용
+- 공유 context는 생성 시 설정을 마친 뒤 고정(frozen)되어 urllib3가 커넥션마다 다른 값으로 바꿀 수 없음
+  (verify=False 클라이언트가 기본 클라이언트의 검증을 약화시키지 않음)
+"""
+
+import ipaddress
+import json
+import os
+import ssl
+import threading
+import time
+
+from urllib3.util.ssl_ import create_urllib3_context
+
+from config.config import Config
+from utils.file_lock import FileLock
+
+
+def _is_ip_address(host):
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+class DNSCache:
+    def __init__(self, ttl=None, store_path=None):
+        settings = Config.CONNECTION_CACHE
+        self.ttl = settings["dns_ttl"] if ttl is None else ttl
+        self.store_path = store_path
+        self._entries = {}  # "host:port" -> (만료 시각(time.time), 주소 목록)
+        self._lock = threading.Lock()
+
+    def resolve(self, host, port, resolver):
+        """
+        (주소 목록, 캐시 사용 여부) 반환
+        resolver(host, port): 실제 DNS 조회 함수 (캐시에 없거나 만료된 경우에만 호출)
+        """
+        if _is_ip_address(host):
+            return resolver(host, port), False
+        key = f"{host}:{port}"
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1], True
+
+        # 다른 워커가 이미 조회한 결과가 있으면 사용
+        if self.store_path is not None:
+            entry = self._read_store().get(key)
+            if entry is not None and entry[0] > now:
+                with self._lock:
+                    self._entries[key] = (entry[0], list(entry[1]))
+                return list(entry[1]), True
+
+        addresses = resolver(host, port)
+        entry = (now + self.ttl, addresses)
+        with self._lock:
+            self._entries[key] = entry
+        if self.store_path is not None:
+            self._write_store(key, entry)
+        return addresses, False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _read_store(self):
+        try:
+            with FileLock(self.store_path + ".lock", shared=True), open(self.store_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_store(self, key, entry):
+        directory = os.path.dirname(self.store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with FileLock(self.store_path + ".lock"):
+            try:
+                with open(self.store_path) as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            now = time.time()
+            entries = {k: v for k, v in entries.items() if v[0] > now}
+            entries[key] = entry
+            tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.store_path)
+
+
+class TLSSessionStore:
+    """(SSLContext, server_hostname 또는 IP, port) -> 마지막으로 받은 SSLSession"""
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(context, server_hostname, peer):
+        return id(context), server_hostname or peer[0], peer[1]
+
+    def get(self, key):
+        with self._lock:
+            return self._sessions.get(key)
+
+    def put(self, key, session):
+        if session is None:
+            return
+        with self._lock:
+            self._sessions[key] = session
+
+    def save_from(self, ssl_sock):
+        """응답을 받은 뒤 호출 (TLS 1.3 세션 티켓은 handshake 이후 첫 데이터와 함께 도착)"""
+        try:
+            self.put(self.key(ssl_sock.context, ssl_sock.server_hostname, ssl_sock.getpeername()), ssl_sock.session)
+        except (OSError, AttributeError):
+            pass
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+class ResumingSSLContext(ssl.SSLContext):
+    """
+    wrap_socket 시 session_store에 저장된 세션을 전달해 TLS 세션 재개를 시도
+    frozen 이후에는 검증 설정을 다른 값으로 바꿀 수 없고, 생성 시 이미 읽은 인증서 파일은 다시 읽지 않음
+    """
+
+    session_store = None
+    frozen = False
+
+    @property
+    def verify_mode(self):
+        return ssl.SSLContext.verify_mode.__get__(self)
+
+    @verify_mode.setter
+    def verify_mode(self, value):
+        self._check_frozen("verify_mode", value)
+        ssl.SSLContext.verify_mode.__set__(self, value)
+
+    @property
+    def check_hostname(self):
+        return ssl.SSLContext.check_hostname.__get__(self)
+
+    @check_hostname.setter
+    def check_hostname(self, value):
+        self._check_frozen("check_hostname", value)
+        ssl.SSLContext.check_hostname.__set__(self, value)
+
+    def _check_frozen(self, name, value):
+        if self.frozen and getattr(self, name) != value:
+            raise ValueError(f"shared SSLContext is frozen: cannot change {name} to {value!r}")
+
+    def load_verify_locations(self, *args, **kwargs):
+        # get_ssl_context()의 key에 CA 번들이 포함되므로 frozen context에는 같은 파일이 이미 로드되어 있음
+        if not self.frozen:
+            super().load_verify_locations(*args, **kwargs)
+
+    def load_cert_chain(self, *args, **kwargs):
+        if not self.frozen:
+            super().load_cert_chain(*args, **kwargs)
+
+    def load_default_certs(self, *args, **kwargs):
+        if not self.frozen:
+            super().load_default_certs(*args, **kwargs)
+
+    def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+        if session is None and self.session_store is not None:
+            try:
+                session = self.session_store.get(TLSSessionStore.key(self, server_hostname, sock.getpeername()))
+            except OSError:
+                session = None
+        return super().wrap_socket(sock, *args, server_hostname=server_hostname, session=session, **kwargs)
+
+
+def create_resuming_context(session_store, cert_reqs=ssl.CERT_REQUIRED, check_hostname=True, ca_certs=None,
+                            ca_cert_dir=None, ca_cert_data=None, cert_file=None, key_file=None, key_password=None):
+    """검증 설정을 모두 마친 뒤 고정한 ResumingSSLContext"""
+    # urllib3 기본 설정과 같지만 OP_NO_TICKET을 빼서 TLS 1.2 세션 티켓도 받음
+    context = create_urllib3_context(
+        options=ssl.OP_NO_SSLv2 | ssl.OP_NO_SSLv3 | ssl.OP_NO_COMPRESSION, cert_reqs=cert_reqs
+    )
+    context.__class__ = ResumingSSLContext
+    context.session_store = session_store
+    # 호스트 이름 검증은 OpenSSL이 수행 (assert_hostname / assert_fingerprint를 쓰는 풀만 urllib3가 직접 수행)
+    context.check_hostname = cert_reqs != ssl.CERT_NONE and check_hostname
+    if ca_certs or ca_cert_dir or ca_cert_data:
+        context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
+    elif cert_reqs != ssl.CERT_NONE:
+        context.load_default_certs()
+    if cert_file:
+        context.load_cert_chain(cert_file, key_file, key_password)
+    context.frozen = True
+    return context
+
+
+dns_cache = DNSCache(store_path=Config.CONNECTION_CACHE["dns_store_path"])
+tls_sessions = TLSSessionStore()
+_contexts = {}
+_contexts_lock = threading.Lock()
+
+
+def get_ssl_context(cert_reqs=ssl.CERT_REQUIRED, check_hostname=True, ca_certs=None, ca_cert_dir=None,
+                    ca_cert_data=None, cert_file=None, key_file=None, key_password=None):
+    """
+    검증 설정별로 프로세스 전체에서 공유하는 세션 재개 SSLContext
+    (Config.CONNECTION_CACHE['tls_resumption']가 False면 None)
+    """
+    if not Config.CONNECTION_CACHE["tls_resumption"]:
+        return None
+    key = (cert_reqs, check_hostname, ca_certs, ca_cert_dir, ca_cert_data, cert_file, key_file, key_password)
+    with _contexts_lock:
+        context = _contexts.get(key)
+        if context is None:
+            context = _contexts[key] = create_resuming_context(tls_sessions, *key)
+        return context
@@ -0,0 +1,174 @@
+# utils/data_factory.py
+"""
+대량 테스트 데이터 생성기 (부하 / 볼륨 테스트용)
+- DataFactory(seed)의 products() / carts() / users()는 유효하고 서로 다른 payload를 generator로 생성
+- 같은 seed + index면 항상 같은 레코드 (index마다 splitmix64 해시로 값을 만들므로 중간부터 생성해도 동일)
+- 레코드는 __slots__ 클래스에 원시 값만 보관하고, 요청을 보낼 때 to_dict() / to_json()으로 직렬화
+- 레코드를 하나씩 만들어 넘기므로 생성 개수와 관계없이 메모리 사용량이 일정
+
+    factory = DataFactory(seed=7)
+    for cart in factory.carts(1_000_000):
+        client.post("/carts", json=cart.to_dict())
+"""
+
+import itertools
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+
+_MASK64 = (1 << 64) - 1
+
+CATEGORIES = ("electronics", "jewelery", "men's clothing", "women's clothing")
+ADJECTIVES = ("Slim", "Classic", "Premium", "Casual", "Solid", "Rain", "Silver", "Portable")
+NOUNS = ("Jacket", "Backpack", "T-Shirt", "Bracelet", "Monitor", "Hard Drive", "Ring", "Coat")
+FIRST_NAMES = ("john", "david", "kevin", "don", "derek", "michael", "miriam", "william", "kate", "jimmie")
+LAST_NAMES = ("doe", "morrison", "ryan", "romer", "powell", "russell", "snyder", "hopkins", "hale", "kerl")
+CITIES = ("kilcoole", "Cullman", "San Antonio", "El Paso", "Fresno", "Mesa", "Miami Beach", "Fort Wayne")
+STREETS = ("new road", "Lovers Ln", "Frances Ct", "Hunters Creek Dr", "adams St", "prospect st")
+
+# FakeStore에 실제로 있는 상품 / 사용자 id 범위 (장바구니 참조 무결성 유지)
+PRODUCT_ID_RANGE = 20
+USER_ID_RANGE = 10
+
+# 장바구니 date: CART_EPOCH + index분 (+ 난수 초) -> index마다 다른 날짜이므로 장바구니 payload가 모두 다름
+CART_EPOCH = datetime(2026, 1, 1)
+
+
+def _mix(seed, index):
+    """splitmix64(seed, index) -> 64비트 정수"""
+    z = (seed * 0x9E3779B97F4A7C15 + index + 1) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class Record(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def to_dict(self):
+        """요청 payload dict"""
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class ProductRecord(Record):
+    __slots__ = ("index", "title", "price_cents", "category", "image_id")
+
+    def __init__(self, index, title, price_cents, category, image_id):
+        self.index = index
+        self.title = title
+        self.price_cents = price_cents
+        self.category = category
+        self.image_id = image_id
+
+    def to_dict(self):
+        return {
+            "title": self.title,
+            "price": self.price_cents / 100,
+            "description": f"Synthetic product #{self.index}",
+            "image": f"https://i.pravatar.cc/{self.image_id}",
+            "category": self.category,
+        }
+
+
+class CartRecord(Record):
+    __slots__ = ("index", "user_id", "second", "lines")
+
+    def __init__(self, index, user_id, second, lines):
+        self.index = index
+        self.user_id = user_id
+        self.second = second  # 분 안의 초 (0 ~ 59)
+        self.lines = lines  # ((productId, quantity), ...)
+
+    def to_dict(self):
+        date = CART_EPOCH + timedelta(minutes=self.index, seconds=self.second)
+        return {
+            "userId": self.user_id,
+            "date": date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),  # FakeStore 장바구니 date 형식
+            "products": [{"productId": product_id, "quantity": quantity} for product_id, quantity in self.lines],
+        }
+
+
+class UserRecord(Record):
+    __slots__ = ("index", "first", "last", "city", "street", "number", "zip_code")
+
+    def __init__(self, index, first, last, city, street, number, zip_code):
+        self.index = index
+        self.first = first
+        self.last = last
+        self.city = city
+        self.street = street
+        self.number = number
+        self.zip_code = zip_code
+
+    def to_dict(self):
+        return {
+            "username": f"user_{self.index}",
+            "email": f"user{self.index}@example.com",
+            "password": f"pw{self.index:08d}!",
+            "name": {"firstname": self.first, "lastname": self.last},
+            "address": {
+                "city": self.city,
+                "street": self.street,
+                "number": self.number,
+                "zipcode": f"{self.zip_code:05d}-{self.number % 10000:04d}",
+            },
+            "phone": f"1-{self.zip_code % 1000:03d}-{self.number % 1000:03d}-{self.index % 10000:04d}",
+        }
+
+
+class DataFactory:
+    def __init__(self, seed=42):
+        self.seed = seed
+
+    def _indexes(self, count, start):
+        return itertools.count(start) if count is None else range(start, start + count)
+
+    def product(self, index):
+        bits = _mix(self.seed, index)
+        return ProductRecord(
+            index,
+            f"{ADJECTIVES[bits & 7]} {NOUNS[(bits >> 3) & 7]} #{index}",
+            100 + (bits >> 6) % 99_900,  # 1.00 ~ 999.99 (Config.VALIDATION_RULES['price'] 범위)
+            CATEGORIES[(bits >> 24) & 3],
+            (bits >> 26) % 1000,
+        )
+
+    def cart(self, index):
+        bits = _mix(self.seed, index)
+        line_count = 1 + (bits & 3)
+        lines, used = [], set()
+        for line in range(line_count):
+            product_id = 1 + (bits >> (8 + line * 8)) % PRODUCT_ID_RANGE
+            if product_id in used:
+                continue
+            used.add(product_id)
+            lines.append((product_id, 1 + (bits >> (40 + line * 4)) % 10))
+        return CartRecord(index, 1 + (bits >> 2) % USER_ID_RANGE, (bits >> 56) % 60, tuple(lines))
+
+    def user(self, index):
+        bits = _mix(self.seed, index)
+        return UserRecord(
+            index,
+            FIRST_NAMES[bits % len(FIRST_NAMES)],
+            LAST_NAMES[(bits >> 8) % len(LAST_NAMES)],
+            CITIES[(bits >> 16) & 7],
+            STREETS[(bits >> 19) % len(STREETS)],
+            1 + (bits >> 24) % 9999,
+            (bits >> 40) % 100_000,
+        )
+
+    def products(self, count=None, start=0):
+        """ProductRecord generator (count=None이면 무한)"""
+        return map(self.product, self._indexes(count, start))
+
+    def carts(self, count=None, start=0):
+        return map(self.cart, self._indexes(count, start))
+
+    def users(self, count=None, start=0):
+        return map(self.user, self._indexes(count, start))
@@ -0,0 +1,274 @@
+# utils/differ.py
+"""
+두 서버(예: staging / production)의 응답 비교 (differential testing)
+- 테스트가 사용하는 GET 엔드포인트(+ id 범위, prefetch 플러그인이 기록한 경로)를 양쪽에 동시에 요청
+- 본문은 무시 규칙을 적용한 뒤 정규화(canonical) JSON(키 정렬, 공백 없음)의 해시로 비교
+  해시가 다를 때만 경로 단위 구조 비교(diff) 수행
+- 무시 규칙: (엔드포인트 패턴, JSON 경로 패턴) - "*"는 임의 문자열, 경로의 배열 index는 [*]로 바꿔서 비교
+    ("*", "*.date")             모든 엔드포인트의 모든 깊이 date 필드
+    ("GET /carts*", "$[*].id")  장바구니 목록의 id
+- 쓰기 요청(POST/PUT/DELETE)은 서버 상태를 바꾸므로 비교하지 않음
+
+CLI:
+    python -m utils.differ --left https://staging.example.com --right https://fakestoreapi.com --ignore "*.date"
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import time
+
+from config.config import Config
+from utils.async_client import AsyncAPIClient
+from utils.timing import endpoint_key
+
+_INDEX = re.compile(r"\[\d+\]")
+_MISSING = object()
+
+CATEGORIES = ("electronics", "jewelery", "men's clothing", "women's clothing")
+
+
+def default_paths(ids=None, recorded=()):
+    """비교할 GET 경로: 목록 / 단건(id 범위) / 카테고리 / 사용자별 장바구니 + 기록된 경로"""
+    ids = ids or Config.DIFF["ids"]
+    paths = ["/products", "/products/categories", "/carts", "/users",
+             "/products?limit=5", "/products?sort=desc", "/carts?sort=desc", "/users?limit=5"]
+    paths += [f"/products/category/{category}" for category in CATEGORIES]
+    paths += [f"/products/{i}" for i in range(1, ids["products"] + 1)]
+    paths += [f"/carts/{i}" for i in range(1, ids["carts"] + 1)]
+    paths += [f"/users/{i}" for i in range(1, ids["users"] + 1)]
+    paths += [f"/carts/user/{i}" for i in range(1, ids["users"] + 1)]
+    for path in recorded:
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+
+def recorded_paths(cache_dir=".pytest_cache"):
+    """plugins/prefetch.py가 pytest cache에 기록한 테스트별 GET 경로"""
+    try:
+        with open(f"{cache_dir}/v/prefetch/paths") as f:
+            recorded = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return sorted({path for paths in recorded.values() for path in paths})
+
+
+def _glob(pattern):
+    """"*"만 와일드카드로 쓰는 패턴 -> 정규식 ("[*]"의 대괄호는 문자 그대로)"""
+    return re.compile("^" + re.escape(pattern).replace(r"\*", ".*") + "$")
+
+
+class IgnoreRules:
+    def __init__(self, rules=()):
+        """rules: "경로 패턴" (모든 엔드포인트) 또는 (엔드포인트 패턴, 경로 패턴)"""
+        self.rules = [("*", rule) if isinstance(rule, str) else tuple(rule) for rule in rules]
+        self._compiled = [(_glob(endpoint), _glob(path)) for endpoint, path in self.rules]
+
+    def for_endpoint(self, endpoint):
+        """endpoint("GET /products/{id}")에 적용되는 경로 패턴 목록"""
+        return [path for pattern, path in self._compiled if pattern.match(endpoint)]
+
+
+def _ignored(path, patterns):
+    normalized = _INDEX.sub("[*]", path)
+    return any(pattern.match(normalized) for pattern in patterns)
+
+
+def strip_ignored(value, patterns, path="$"):
+    """무시 규칙에 해당하는 필드를 제거한 사본"""
+    if not patterns:
+        return value
+    if isinstance(value, dict):
+        result = {}
+        for key, child in value.items():
+            child_path = f"{path}.{key}"
+            if not _ignored(child_path, patterns):
+                result[key] = strip_ignored(child, patterns, child_path)
+        return result
+    if isinstance(value, list):
+        return [strip_ignored(child, patterns, f"{path}[{i}]") for i, child in enumerate(value)]
+    return value
+
+
+def canonical_hash(value):
+    """키 정렬 / 공백 없는 JSON의 blake2b 해시 (필드 순서와 포맷 차이는 무시)"""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def structural_diff(left, right, path="$", limit=None):
+    """경로 단위 차이 목록 [(경로, 왼쪽 값, 오른쪽 값)] (없는 쪽은 _MISSING)"""
+    limit = limit or Config.DIFF["max_differences"]
+    differences = []
+
+    def walk(a, b, where):
+        if len(differences) >= limit:
+            return
+        if isinstance(a, dict) and isinstance(b, dict):
+            for key in sorted(a.keys() | b.keys(), key=str):
+                walk(a.get(key, _MISSING), b.get(key, _MISSING), f"{where}.{key}")
+        elif isinstance(a, list) and isinstance(b, list):
+            for index in range(max(len(a), len(b))):
+                walk(a[index] if index < len(a) else _MISSING,
+                     b[index] if index < len(b) else _MISSING, f"{where}[{index}]")
+        elif a != b or type(a) is not type(b):
+            differences.append((where, a, b))
+
+    walk(left, right, path)
+    return differences
+
+
+def _render(value):
+    if value is _MISSING:
+        return "<missing>"
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= 80 else text[:80] + "..."
+
+
+class PathResult:
+    def __init__(self, path, left_status, right_status, differences=(), error=None):
+        self.path = path
+        self.left_status = left_status
+        self.right_status = right_status
+        self.differences = list(differences)
+        self.error = error
+
+    @property
+    def identical(self):
+        return self.error is None and self.left_status == self.right_status and not self.differences
+
+    def format(self):
+        if self.error is not None:
+            return f"GET {self.path}: {self.error}"
+        lines = [f"GET {self.path}: status {self.left_status} vs {self.right_status}"
+                 if self.left_status != self.right_status else f"GET {self.path}:"]
+        lines.extend(f"    {where}: {_render(a)} != {_render(b)}" for where, a, b in self.differences)
+        return "\n".join(lines)
+
+
+class DiffReport:
+    def __init__(self, left, right, results, elapsed):
+        self.left = left
+        self.right = right
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def differences(self):
+        return [r for r in self.results if not r.identical]
+
+    @property
+    def ok(self):
+        return not self.differences
+
+    def to_dict(self):
+        return {
+            "left": self.left,
+            "right": self.right,
+            "compared": len(self.results),
+            "different": len(self.differences),
+            "elapsed": self.elapsed,
+            "differences": [
+                {"path": r.path, "status": [r.left_status, r.right_status], "error": r.error,
+                 "fields": [{"path": w, "left": _render(a), "right": _render(b)} for w, a, b in r.differences]}
+                for r in self.differences
+            ],
+        }
+
+    def format(self):
+        lines = [f"diff {self.left} vs {self.right}: {len(self.results)} paths, "
+                 f"{len(self.differences)} different, {self.elapsed:.2f}s"]
+        lines.extend(result.format() for result in self.differences)
+        return "\n".join(lines)
+
+
+class Differ:
+    def __init__(self, left, right, paths=None, ignore=None, concurrency=None):
+        settings = Config.DIFF
+        self.left_url = left
+        self.right_url = right
+        self.paths = list(paths) if paths is not None else default_paths(recorded=recorded_paths())
+        self.ignore = ignore if isinstance(ignore, IgnoreRules) else IgnoreRules(
+            settings["ignore"] if ignore is None else ignore)
+        self.concurrency = concurrency or settings["concurrency"]
+
+    def _client(self, base_url):
+        # 양쪽 응답을 그대로 비교해야 하므로 카세트 / 재시도 없이 요청
+        client = AsyncAPIClient(concurrency=self.concurrency, cassette=False, resilience=False)
+        client.base_url = base_url.rstrip("/")
+        return client
+
+    def _compare(self, path, left, right):
+        patterns = self.ignore.for_endpoint(endpoint_key("GET", path))
+        bodies = []
+        for response in (left, right):
+            if not response.content:
+                bodies.append(None)
+                continue
+            try:
+                bodies.append(strip_ignored(response.json(), patterns))
+            except ValueError:
+                bodies.append(response.text)  # JSON이 아니면 본문 문자열 그대로 비교
+        differences = []
+        if canonical_hash(bodies[0]) != canonical_hash(bodies[1]):
+            differences = structural_diff(bodies[0], bodies[1])
+        return PathResult(path, left.status_code, right.status_code, differences)
+
+    async def _run(self, left_client, right_client):
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def compare(path):
+            async with semaphore:
+                try:
+                    left, right = await asyncio.gather(left_client.get(path), right_client.get(path))
+                except Exception as error:  # 한쪽이라도 응답하지 않으면 차이로 보고
+                    return PathResult(path, None, None, error=f"{type(error).__name__}: {error}")
+            return self._compare(path, left, right)
+
+        try:
+            return await asyncio.gather(*(compare(path) for path in self.paths))
+        finally:
+            await left_client.aclose()
+            await right_client.aclose()
+
+    def run(self):
+        left_client, right_client = self._client(self.left_url), self._client(self.right_url)
+        started = time.perf_counter()
+        try:
+            results = left_client.run(self._run(left_client, right_client))
+        finally:
+            left_client.close()
+        return DiffReport(self.left_url, self.right_url, results, time.perf_counter() - started)
+
+
+def _parse_ignore(rule):
+    """"*.date" 또는 "GET /carts*=*.date" """
+    endpoint, sep, path = rule.partition("=")
+    return (endpoint, path) if sep else rule
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential testing between two base URLs")
+    parser.add_argument("--left", required=True, help="기준 서버 (예: production)")
+    parser.add_argument("--right", required=True, help="비교 대상 서버 (예: staging)")
+    parser.add_argument("--path", action="append", help="비교할 GET 경로 (기본값: 테스트가 사용하는 엔드포인트 전체)")
+    parser.add_argument("--ignore", action="append", default=[],
+                        help='무시할 JSON 경로 "*.date" 또는 "GET /carts*=$[*].id" (여러 번 지정 가능)')
+    parser.add_argument("--concurrency", type=int, default=Config.DIFF["concurrency"])
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    rules = list(Config.DIFF["ignore"]) + [_parse_ignore(rule) for rule in args.ignore]
+    report = Differ(args.left, args.right, paths=args.path, ignore=rules, concurrency=args.concurrency).run()
+    print(report.format())
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+    raise SystemExit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+# utils/fake_store_server.py
+"""
+FakeStore API 로컬 대역(stand-in) 서버
+테스트가 사용하는 /products, /carts, /users, /auth/login 엔드포인트를 asyncio(aiohttp)로 재현
+- 인터넷 없이 결정적(deterministic)인 응답 제공
+- 지연(latency) / 장애(fault) 프로파일로 네트워크 상황 재현
+
+실행:
+    python -m utils.fake_store_server --port 8000 --latency wan --faults flaky
+테스트에서 사용:
+    API_BASE_URL=local pytest tests/
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import threading
+from email.utils import formatdate
+
+from aiohttp import web
+
+from config.config import Config
+
+CATEGORIES = ["electronics", "jewelery", "men's clothing", "women's clothing"]
+
+# 지연 프로파일: (기본 지연, 지터) - 초 단위
+LATENCY_PROFILES = {
+    "none": (0.0, 0.0),
+    "lan": (0.001, 0.001),
+    "wan": (0.040, 0.020),
+    "slow": (0.300, 0.100),
+}
+
+# 장애 프로파일: 요청마다 아래 확률로 장애 주입
+FAULT_PROFILES = {
+    "none": {},
+    "flaky": {"error_500": 0.02},
+    "throttled": {"throttle_429": 0.10},
+    "chaos": {"error_500": 0.05, "throttle_429": 0.05, "reset": 0.01},
+}
+
+
+def _build_products():
+    products = []
+    for i in range(1, 21):
+        products.append({
+            "id": i,
+            "title": f"Product {i}",
+            "price": round(9.99 + (i * 37.5) % 990, 2),
+            "description": f"Description of product {i}",
+            "category": CATEGORIES[(i - 1) % len(CATEGORIES)],
+            "image": f"https://fakestoreapi.com/img/{i}.jpg",
+            "rating": {"rate": round((i * 0.7) % 5, 1), "count": i * 13},
+        })
+    return products
+
+
+def _build_users():
+    users = [{
+        "id": 1,
+        "email": "john@gmail.com",
+        "username": "johnd",
+        "password": "m38rmF$",
+        "name": {"firstname": "john", "lastname": "doe"},
+        "address": {
+            "city": "kilcoole",
+            "street": "new road",
+            "number": 7682,
+            "zipcode": "12926-3874",
+            "geolocation": {"lat": "-37.3159", "long": "81.1496"},
+        },
+        "phone": "1-570-236-7033",
+    }, {
+        "id": 2,
+        "email": "morrison@gmail.com",
+        "username": "mor_2314",
+        "password": "83r5^_",
+        "name": {"firstname": "david", "lastname": "morrison"},
+        "address": {
+            "city": "kilcoole",
+            "street": "Lovers Ln",
+            "number": 7267,
+            "zipcode": "12926-3874",
+            "geolocation": {"lat": "-37.3159", "long": "81.1496"},
+        },
+        "phone": "1-570-236-7033",
+    }]
+    for i in range(3, 11):
+        users.append({
+            "id": i,
+            "email": f"user{i}@gmail.com",
+            "username": f"user_{i}",
+            "password": f"pass{i}!",
+            "name": {"firstname": f"first{i}", "lastname": f"last{i}"},
+            "address": {
+                "city": "San Antonio",
+                "street": f"{i} Hunters Creek Dr",
+                "number": 6454 + i,
+                "zipcode": f"98234-{1000 + i}",
+                "geolocation": {"lat": "40.3467", "long": "-30.1310"},
+            },
+            "phone": f"1-765-789-{6700 + i}",
+        })
+    return users
+
+
+def _build_carts():
+    carts = []
+    for i in range(1, 8):
+        user_id = 1 if i <= 2 else i
+        carts.append({
+            "id": i,
+            "userId": user_id,
+            "date": f"2020-03-0{i}T00:00:00.000Z",
+            "products": [
+                {"productId": (i + k) % 20 + 1, "quantity": k + 1}
+                for k in range(3)
+            ],
+        })
+    return carts
+
+
+class FakeStore:
+    """stand-in 서버가 사용하는 정적 데이터 (FakeStore처럼 쓰기 요청은 저장하지 않음)"""
+
+    def __init__(self):
+        self.products = _build_products()
+        self.users = _build_users()
+        self.carts = _build_carts()
+        self.products_by_id = {p["id"]: p for p in self.products}
+        self.users_by_id = {u["id"]: u for u in self.users}
+        self.carts_by_id = {c["id"]: c for c in self.carts}
+
+
+def _json(data, status=200):
+    return web.Response(body=json.dumps(data).encode(), status=status,
+                        content_type="application/json")
+
+
+def _apply_query(request, items):
+    # FakeStore와 동일하게 sort(asc/desc), limit 쿼리 지원
+    # + 페이지 단위 조회(APIClient.iter_collection)를 위한 offset (운영 API의 페이지네이션과 동일)
+    if request.query.get("sort") == "desc":
+        items = list(reversed(items))
+    offset = request.query.get("offset")
+    if offset and offset.isdigit():
+        items = items[int(offset):]
+    limit = request.query.get("limit")
+    if limit and limit.isdigit():
+        items = items[:int(limit)]
+    return items
+
+
+def _parse_id(request):
+    value = request.match_info["id"]
+    return int(value) if value.isdigit() else None
+
+
+async def _read_json(request):
+    try:
+        return await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+async def _read_object(request):
+    """JSON 객체 본문 (본문이 없거나 JSON이 아니면 빈 dict), 객체가 아닌 JSON(배열 / 문자열 ...)이면 None"""
+    body = await _read_json(request)
+    if body is None:
+        return {}
+    return body if isinstance(body, dict) else None
+
+
+def _not_an_object():
+    return web.Response(status=400, text="request body must be a JSON object")
+
+
+def build_app(store=None, latency_profile="none", fault_profile="none", seed=42):
+    """FakeStore 라우트와 지연/장애 미들웨어가 등록된 aiohttp 앱 생성"""
+    if latency_profile not in LATENCY_PROFILES:
+        raise ValueError(f"Unknown latency profile: {latency_profile}")
+    if fault_profile not in FAULT_PROFILES:
+        raise ValueError(f"Unknown fault profile: {fault_profile}")
+
+    store = store or FakeStore()
+    rng = random.Random(seed)
+    base_delay, jitter = LATENCY_PROFILES[latency_profile]
+    faults = FAULT_PROFILES[fault_profile]
+
+    # 변하지 않는 목록 응답은 미리 직렬화
+    products_body = json.dumps(store.products).encode()
+    users_body = json.dumps(store.users).encode()
+    carts_body = json.dumps(store.carts).encode()
+    categories_body = json.dumps(CATEGORIES).encode()
+    # 데이터가 바뀌지 않으므로 서버 시작 시각을 Last-Modified로 사용
+    last_modified = formatdate(usegmt=True)
+
+    @web.middleware
+    async def profile_middleware(request, handler):
+        if base_delay or jitter:
+            await asyncio.sleep(max(0.0, base_delay + rng.uniform(-jitter, jitter)))
+        roll = rng.random()
+        threshold = 0.0
+        for fault, probability in faults.items():
+            threshold += probability
+            if roll < threshold:
+                if fault == "error_500":
+                    return _json({"message": "Injected server error"}, status=500)
+                if fault == "throttle_429":
+                    return web.Response(status=429, text="Too Many Requests",
+                                        headers={"Retry-After": "1"})
+                if fault == "reset":
+                    # 응답 없이 커넥션을 끊어 connection reset 재현
+                    request.transport.abort()
+                    return web.Response(status=500)
+        response = await handler(request)
+        if request.method == "GET" and response.status == 200 and response.body:
+            return _conditional(request, response)
+        return response
+
+    def _conditional(request, response):
+        # ETag / Last-Modified 부여, 조건부 요청이 일치하면 304 Not Modified
+        etag = '"' + hashlib.blake2b(response.body, digest_size=8).hexdigest() + '"'
+        validators = {"ETag": etag, "Last-Modified": last_modified}
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            if etag in [tag.strip() for tag in if_none_match.split(",")]:
+                return web.Response(status=304, headers=validators)
+        elif request.headers.get("If-Modified-Since") == last_modified:
+            return web.Response(status=304, headers=validators)
+        response.headers.update(validators)
+        return response
+
+    async def list_products(request):
+        if not request.query:
+            return web.Response(body=products_body, content_type="application/json")
+        return _json(_apply_query(request, store.products))
+
+    async def get_product(request):
+        product = store.products_by_id.get(_parse_id(request))
+        if product is None:
+            # FakeStore는 존재하지 않는 상품에 대해 200 OK + 빈 바디 반환
+            return web.Response(status=200)
+        return _json(product)
+
+    async def list_categories(request):
+        return web.Response(body=categories_body, content_type="application/json")
+
+    async def products_in_category(request):
+        category = request.match_info["category"]
+        return _json(_apply_query(request, [p for p in store.products if p["category"] == category]))
+
+    async def list_carts(request):
+        if not request.query:
+            return web.Response(body=carts_body, content_type="application/json")
+        return _json(_apply_query(request, store.carts))
+
+    async def get_cart(request):
+        return _json(store.carts_by_id.get(_parse_id(request)))
+
+    async def user_carts(request):
+        user_id = _parse_id(request)
+        return _json([c for c in store.carts if c["userId"] == user_id])
+
+    async def list_users(request):
+        if not request.query:
+            return web.Response(body=users_body, content_type="application/json")
+        return _json(_apply_query(request, store.users))
+
+    async def get_user(request):
+        # 존재하지 않는 사용자는 null 반환
+        return _json(store.users_by_id.get(_parse_id(request)))
+
+    def create(collection):
+        async def handler(request):
+            body = await _read_object(request)
+            if body is None:
+                return _not_an_object()
+            return _json({**body, "id": len(collection) + 1}, status=201)
+        return handler
+
+    async def update(request):
+        body = await _read_object(request)
+        if body is None:
+            return _not_an_object()
+        return _json({**body, "id": _parse_id(request)})
+
+    def delete(collection_by_id):
+        async def handler(request):
+            return _json(collection_by_id.get(_parse_id(request)))
+        return handler
+
+    async def login(request):
+        body = await _read_object(request)
+        if body is None:
+            return _not_an_object()
+        username, password = body.get("username"), body.get("password")
+        if not username or not password:
+            return web.Response(status=400,
+                                text="username and password are not provided in JSON format")
+        for user in store.users:
+            if user["username"] == username and user["password"] == password:
+                return _json({"token": f"stand-in-token-{user['id']}"}, status=201)
+        return web.Response(status=401, text="username or password is incorrect")
+
+    app = web.Application(middlewares=[profile_middleware])
+    app.router.add_get("/products", list_products)
+    app.router.add_get("/products/categories", list_categories)
+    app.router.add_get("/products/category/{category}", products_in_category)
+    app.router.add_get("/products/{id}", get_product)
+    app.router.add_post("/products", create(store.products))
+    app.router.add_put("/products/{id}", update)
+    app.router.add_patch("/products/{id}", update)
+    app.router.add_delete("/products/{id}", delete(store.products_by_id))
+    app.router.add_get("/carts", list_carts)
+    app.router.add_get("/carts/user/{id}", user_carts)
+    app.router.add_get("/carts/{id}", get_cart)
+    app.router.add_post("/carts", create(store.carts))
+    app.router.add_put("/carts/{id}", update)
+    app.router.add_patch("/carts/{id}", update)
+    app.router.add_delete("/carts/{id}", delete(store.carts_by_id))
+    app.router.add_get("/users", list_users)
+    app.router.add_get("/users/{id}", get_user)
+    app.router.add_post("/users", create(store.users))
+    app.router.add_put("/users/{id}", update)
+    app.router.add_patch("/users/{id}", update)
+    app.router.add_delete("/users/{id}", delete(store.users_by_id))
+    app.router.add_post("/auth/login", login)
+    return app
+
+
+class FakeStoreServer:
+    """
+    stand-in 서버를 백그라운드 스레드의 이벤트 루프에서 실행 (프로세스 내부)
+        server = FakeStoreServer().start()
+        Config.BASE_URL = server.base_url
+        ...
+        server.stop()
+    ssl_context를 주면 HTTPS로 실행 (TLS handshake / 세션 재개 테스트용)
+    store를 주면 기본 데이터 대신 사용 (두 서버 응답 비교 테스트용)
+    """
+
+    def __init__(self, host=None, port=None, latency_profile=None, fault_profile=None, seed=None,
+                 ssl_context=None, store=None):
+        settings = Config.STAND_IN
+        self.host = host or settings["host"]
+        self.port = settings["port"] if port is None else port
+        self.latency_profile = latency_profile or settings["latency_profile"]
+        self.fault_profile = fault_profile or settings["fault_profile"]
+        self.seed = settings["seed"] if seed is None else seed
+        self.ssl_context = ssl_context
+        self.store = store
+        self.base_url = None
+        self._loop = None
+        self._runner = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    async def _start_site(self):
+        app = build_app(store=self.store, latency_profile=self.latency_profile,
+                        fault_profile=self.fault_profile, seed=self.seed)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port, ssl_context=self.ssl_context)
+        await site.start()
+        # port=0이면 OS가 할당한 포트 사용
+        host, port = self._runner.addresses[0][:2]
+        scheme = "https" if self.ssl_context is not None else "http"
+        self.base_url = f"{scheme}://{host}:{port}"
+
+    def start(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="fake-store-server", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_site(), self._loop).result()
+        return self
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FakeStore API stand-in server")
+    parser.add_argument("--host", default=Config.STAND_IN["host"])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", choices=sorted(LATENCY_PROFILES),
+                        default=Config.STAND_IN["latency_profile"])
+    parser.add_argument("--faults", choices=sorted(FAULT_PROFILES),
+                        default=Config.STAND_IN["fault_profile"])
+    parser.add_argument("--seed", type=int, default=Config.STAND_IN["seed"])
+    args = parser.parse_args()
+
+    app = build_app(latency_profile=args.latency, fault_profile=args.faults, seed=args.seed)
+    web.run_app(app, host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
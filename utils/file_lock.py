@@ -0,0 +1,32 @@
+# utils/file_lock.py
+"""
+프로세스 간 파일 락 (pytest-xdist 워커끼리 같은 파일을 갱신할 때 사용)
+fcntl.flock 기반이며, fcntl이 없는 플랫폼(Windows)에서는 락 없이 동작
+"""
+
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class FileLock:
+    def __init__(self, path, shared=False):
+        """shared=True면 공유(읽기) 락, 기본값은 배타(쓰기) 락"""
+        self.path = path
+        self.shared = shared
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
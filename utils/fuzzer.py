@@ -0,0 +1,397 @@
+# utils/fuzzer.py
+"""
+속성 기반(property-based) REST 계약 퍼징
+- utils/test_data.TestData의 Product / Cart / User / 로그인 payload와 경로 파라미터를 변형(mutation)해서 요청
+  (필드 삭제, 타입 바꾸기, 경계값, 긴 문자열 / 유니코드, 추가 필드, 본문 전체 교체, 잘못된 id ...)
+- AsyncAPIClient로 동시에 실행하며 응답마다 속성 검사
+  기본 속성: 5xx 없음, JSON 응답은 파싱 가능, 커넥션 오류 / 타임아웃 없음
+- 실패한 케이스는 같은 실패가 재현되는 범위에서 변형 / payload를 줄여 최소 재현 케이스로 축소(shrink)
+- 케이스 i는 (seed, i)만으로 결정되므로 같은 seed면 같은 순서로 같은 요청을 생성
+  실행 시간 예산(budget)이 끝나면 중단하므로 CI 시간에 맞출 수 있음
+
+    report = Fuzzer(seed=1234, budget=10).run()
+    assert report.ok, report.format()
+
+CLI:
+    python -m utils.fuzzer --seed 1234 --budget 30 --concurrency 128
+"""
+
+import argparse
+import asyncio
+import copy
+import itertools
+import json
+import random
+import time
+from urllib.parse import quote
+
+from config.config import Config
+from utils.async_client import AsyncAPIClient
+from utils.test_data import TestData
+
+_DROP = object()  # 필드 삭제 표시
+
+# 필드 / 본문에 넣어 보는 값 (타입 불일치, 경계값, 긴 문자열, 특수 문자)
+INTERESTING_VALUES = (
+    None, True, False, 0, -1, 1.5, 2 ** 31, -2 ** 63, 2 ** 64, 1e308,
+    "", " ", "0", "-1", "null", "a" * 4096, "é中\U0001F642" * 16, "\x00", "' OR 1=1 --",
+    "<script>alert(1)</script>", [], [None], {}, {"nested": {"deep": [1, 2, 3]}},
+)
+# 경로 파라미터에 넣어 보는 값
+INTERESTING_PARAMS = (
+    "0", "-1", "1.5", "abc", "99999999999999999999", "%00", "%2F", "null", " ", "1;DROP", "\U0001F642",
+    "a" * 2048,
+)
+ROOT_VALUES = ([], [1, 2], "text", 0, True, {})
+
+
+class FuzzTarget:
+    """퍼징 대상 요청: method, path 템플릿("/carts/{id}"), 유효한 경로 파라미터 값, 유효한 payload 생성 함수"""
+
+    def __init__(self, method, template, payload=None, params=None):
+        self.method = method
+        self.template = template
+        self.payload = payload
+        self.params = params or ({"id": range(1, 11)} if "{id}" in template else {})
+
+    @property
+    def name(self):
+        return f"{self.method} {self.template}"
+
+
+TARGETS = (
+    FuzzTarget("GET", "/products/{id}"),
+    FuzzTarget("GET", "/products/category/{category}",
+               params={"category": ("electronics", "jewelery", "men's clothing", "women's clothing")}),
+    FuzzTarget("GET", "/products?limit={limit}&sort={sort}", params={"limit": range(1, 21), "sort": ("asc", "desc")}),
+    FuzzTarget("POST", "/products", TestData.valid_product),
+    FuzzTarget("PUT", "/products/{id}", TestData.valid_product),
+    FuzzTarget("DELETE", "/products/{id}"),
+    FuzzTarget("GET", "/carts/{id}"),
+    FuzzTarget("GET", "/carts/user/{id}"),
+    FuzzTarget("POST", "/carts", TestData.valid_cart),
+    FuzzTarget("PUT", "/carts/{id}", TestData.valid_cart),
+    FuzzTarget("DELETE", "/carts/{id}"),
+    FuzzTarget("GET", "/users/{id}"),
+    FuzzTarget("POST", "/users", TestData.valid_user),
+    FuzzTarget("PUT", "/users/{id}", TestData.valid_user),
+    FuzzTarget("DELETE", "/users/{id}"),
+    FuzzTarget("POST", "/auth/login", lambda: dict(TestData.LOGIN_USER)),
+)
+
+
+class Mutation:
+    """
+    where: ("param", 이름) / ("body", key, index, ...) / ("body",)은 본문 전체
+    value: 바꿀 값 (_DROP이면 삭제)
+    """
+
+    __slots__ = ("where", "value")
+
+    def __init__(self, where, value):
+        self.where = tuple(where)
+        self.value = value
+
+    def __repr__(self):
+        target = ".".join(str(part) for part in self.where)
+        if self.value is _DROP:
+            return f"drop {target}"
+        return f"{target}={_short(self.value)}"
+
+
+def _short(value, limit=60):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= limit else f"{text[:limit]}...({len(text)} chars)"
+
+
+def _field_paths(value, prefix=("body",)):
+    """payload 안의 모든 필드 / 원소 경로"""
+    paths = []
+    if isinstance(value, dict):
+        for key, child in value.items():
+            paths.append(prefix + (key,))
+            paths.extend(_field_paths(child, prefix + (key,)))
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            paths.append(prefix + (index,))
+            paths.extend(_field_paths(child, prefix + (index,)))
+    return paths
+
+
+class FuzzCase:
+    def __init__(self, index, target, params, body, mutations):
+        self.index = index
+        self.target = target
+        self.params = params        # 변형 전 경로 파라미터
+        self.body = body            # 변형 전 payload (없으면 None)
+        self.mutations = mutations
+
+    def with_mutations(self, mutations, body=None):
+        return FuzzCase(self.index, self.target, self.params, self.body if body is None else body, mutations)
+
+    def build(self):
+        """(method, path, json) - 변형을 적용한 실제 요청"""
+        params = dict(self.params)
+        body = copy.deepcopy(self.body)
+        for mutation in self.mutations:
+            if mutation.where[0] == "param":
+                params[mutation.where[1]] = mutation.value
+            elif len(mutation.where) == 1:
+                body = copy.deepcopy(mutation.value)
+            else:
+                body = _apply(body, mutation.where[1:], mutation.value)
+        path = self.target.template.format(**{k: quote(str(v), safe="") for k, v in params.items()})
+        return self.target.method, path, body
+
+    def describe(self):
+        method, path, body = self.build()
+        line = f"{method} {path}"
+        if body is not None:
+            line += f" json={_short(body, 200)}"
+        return f"{line}  [{self.target.name}: {', '.join(map(repr, self.mutations)) or 'no mutation'}]"
+
+
+def _apply(body, where, value):
+    if not where:
+        return value
+    parent = body
+    for part in where[:-1]:
+        try:
+            parent = parent[part]
+        except (KeyError, IndexError, TypeError):
+            return body  # 앞선 변형으로 경로가 사라진 경우
+    last = where[-1]
+    try:
+        if value is _DROP:
+            del parent[last]
+        else:
+            parent[last] = value
+    except (KeyError, IndexError, TypeError):
+        pass
+    return body
+
+
+def generate_case(seed, index, targets=TARGETS):
+    """케이스 index를 (seed, index)만으로 결정적으로 생성"""
+    rng = random.Random(seed * 1_000_003 + index)
+    target = targets[rng.randrange(len(targets))]
+    params = {name: rng.choice(list(values)) for name, values in target.params.items()}
+    body = target.payload() if target.payload is not None else None
+    mutations = []
+    fields = _field_paths(body) if body is not None else []
+    for _ in range(rng.randint(1, 3)):
+        roll = rng.random()
+        if params and (body is None or roll < 0.25):
+            mutations.append(Mutation(("param", rng.choice(sorted(params))), rng.choice(INTERESTING_PARAMS)))
+        elif body is None:
+            continue
+        elif roll < 0.35:
+            mutations.append(Mutation(("body",), rng.choice(ROOT_VALUES)))
+        elif roll < 0.55 and fields:
+            mutations.append(Mutation(rng.choice(fields), _DROP))
+        elif roll < 0.65 and isinstance(body, dict):
+            mutations.append(Mutation(("body", rng.choice(("id", "__proto__", "extra", ""))),
+                                      rng.choice(INTERESTING_VALUES)))
+        elif fields:
+            mutations.append(Mutation(rng.choice(fields), rng.choice(INTERESTING_VALUES)))
+    return FuzzCase(index, target, params, body, mutations)
+
+
+def check_response(case, response):
+    """기본 속성 검사 - 위반 시 "종류: 상세" 메시지, 통과 시 None"""
+    if response.status_code >= 500:
+        return f"server error: HTTP {response.status_code}"
+    content_type = response.headers.get("Content-Type", "")
+    if "json" in content_type and response.content:
+        try:
+            response.json()
+        except ValueError as error:
+            return f"invalid JSON body: {error}"
+    return None
+
+
+class FuzzFailure:
+    def __init__(self, case, message, minimal=None, occurrences=1):
+        self.case = case
+        self.message = message
+        self.minimal = minimal or case
+        self.occurrences = occurrences
+
+    @property
+    def kind(self):
+        return _kind(self.message)
+
+    def format(self):
+        return (f"{self.case.target.name}: {self.message} (x{self.occurrences}, case #{self.case.index})\n"
+                f"    minimal: {self.minimal.describe()}")
+
+
+def _kind(message):
+    return message.split(":", 1)[0]
+
+
+class FuzzReport:
+    def __init__(self, seed, cases, elapsed, failures, shrink_steps):
+        self.seed = seed
+        self.cases = cases
+        self.elapsed = elapsed
+        self.failures = failures
+        self.shrink_steps = shrink_steps
+
+    @property
+    def ok(self):
+        return not self.failures
+
+    @property
+    def throughput(self):
+        return self.cases / self.elapsed if self.elapsed else 0.0
+
+    def format(self):
+        lines = [f"fuzz seed={self.seed} cases={self.cases} elapsed={self.elapsed:.2f}s "
+                 f"throughput={self.throughput:.0f} req/s failures={len(self.failures)} "
+                 f"shrink_steps={self.shrink_steps}"]
+        lines.extend(failure.format() for failure in self.failures)
+        return "\n".join(lines)
+
+
+class Fuzzer:
+    """
+    seed / budget(초) / max_cases 안에서 케이스를 생성해 concurrency개씩 동시 실행
+    properties: 추가 속성 검사 함수 목록 (case, response) -> 위반 메시지 또는 None
+    """
+
+    def __init__(self, targets=TARGETS, seed=None, budget=None, concurrency=None, max_cases=None,
+                 properties=(), client=None):
+        settings = Config.FUZZ
+        self.targets = tuple(targets)
+        self.seed = settings["seed"] if seed is None else seed
+        self.budget = settings["budget"] if budget is None else budget
+        self.concurrency = concurrency or settings["concurrency"]
+        self.max_cases = max_cases if max_cases is not None else settings["max_cases"]
+        self.shrink_budget = settings["shrink_budget"]
+        self.properties = (check_response,) + tuple(properties)
+        self._owns_client = client is None
+        # 퍼징은 실제 응답을 검사해야 하므로 재시도 / 카세트 없이 요청
+        self.client = client or AsyncAPIClient(concurrency=self.concurrency, cassette=False, resilience=False)
+        self.shrink_steps = 0
+
+    async def _execute(self, case):
+        """케이스 1건 실행 -> 위반 메시지 또는 None"""
+        method, path, body = case.build()
+        try:
+            response = await self.client.request(method, path, json=body)
+        except asyncio.TimeoutError:
+            return "timeout: no response"
+        except Exception as error:  # 커넥션 reset 등
+            return f"exception: {type(error).__name__}: {error}"
+        for prop in self.properties:
+            message = prop(case, response)
+            if message:
+                return message
+        return None
+
+    async def _run(self):
+        deadline = time.perf_counter() + self.budget
+        counter = iter(range(self.max_cases)) if self.max_cases else itertools.count()
+        failures = {}  # (target, 실패 종류) -> FuzzFailure
+        executed = 0
+
+        async def worker():
+            nonlocal executed
+            for index in counter:
+                if time.perf_counter() >= deadline:
+                    return
+                case = generate_case(self.seed, index, self.targets)
+                message = await self._execute(case)
+                executed += 1
+                if message is None:
+                    continue
+                key = (case.target.name, _kind(message))
+                failure = failures.get(key)
+                if failure is None:
+                    failures[key] = FuzzFailure(case, message)
+                    continue
+                failure.occurrences += 1
+                # 완료 순서는 동시 실행에 따라 달라지므로 index가 가장 작은 케이스를 남겨 같은 seed면 같은 케이스를 축소
+                if case.index < failure.case.index:
+                    failure.case, failure.minimal, failure.message = case, case, message
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - started
+        # 같은 대상 / 같은 종류의 실패는 첫 케이스만 축소
+        shrink_deadline = time.perf_counter() + self.shrink_budget
+        ordered = sorted(failures.values(), key=lambda f: f.case.index)
+        for failure in ordered:
+            failure.minimal = await self._shrink(failure.case, failure.kind, shrink_deadline)
+        return FuzzReport(self.seed, executed, elapsed, ordered, self.shrink_steps)
+
+    async def _still_fails(self, case, kind):
+        self.shrink_steps += 1
+        message = await self._execute(case)
+        return message is not None and _kind(message) == kind
+
+    async def _shrink(self, case, kind, deadline):
+        """같은 종류의 실패가 재현되는 동안 변형 제거 -> payload 필드 제거 -> 값 단순화 순서로 축소"""
+        # 1. 필요 없는 변형 제거
+        mutations = list(case.mutations)
+        index = 0
+        while index < len(mutations) and time.perf_counter() < deadline:
+            candidate = case.with_mutations(mutations[:index] + mutations[index + 1:])
+            if await self._still_fails(candidate, kind):
+                mutations.pop(index)
+            else:
+                index += 1
+        case = case.with_mutations(mutations)
+
+        # 2. 변형과 관계없는 payload 필드 제거 (본문 전체를 바꾸는 변형이 있으면 원래 payload는 쓰이지 않음)
+        if case.body is not None and not any(m.where == ("body",) for m in mutations):
+            for where in reversed(_field_paths(case.body)):
+                if time.perf_counter() >= deadline:
+                    break
+                if any(m.where[:len(where)] == where or where[:len(m.where)] == m.where for m in mutations):
+                    continue
+                reduced = _apply(copy.deepcopy(case.body), where[1:], _DROP)
+                candidate = case.with_mutations(mutations, body=reduced)
+                if await self._still_fails(candidate, kind):
+                    case = candidate
+
+        # 3. 변형 값 단순화 (긴 문자열 / 목록은 절반씩 줄임)
+        for position, mutation in enumerate(mutations):
+            value = mutation.value
+            while isinstance(value, (str, list)) and len(value) > 1 and time.perf_counter() < deadline:
+                shorter = value[:len(value) // 2]
+                trial = mutations[:position] + [Mutation(mutation.where, shorter)] + mutations[position + 1:]
+                candidate = case.with_mutations(trial)
+                if not await self._still_fails(candidate, kind):
+                    break
+                mutations, value, case = trial, shorter, candidate
+        return case
+
+    def run(self):
+        try:
+            return self.client.run(self._run())
+        finally:
+            if self._owns_client:
+                self.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Property-based REST contract fuzzer")
+    parser.add_argument("--seed", type=int, default=Config.FUZZ["seed"])
+    parser.add_argument("--budget", type=float, default=Config.FUZZ["budget"], help="실행 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=Config.FUZZ["concurrency"])
+    parser.add_argument("--max-cases", type=int, default=Config.FUZZ["max_cases"])
+    parser.add_argument("--base-url", default=None, help="기본값: Config.BASE_URL")
+    args = parser.parse_args()
+
+    if args.base_url:
+        Config.BASE_URL = args.base_url
+    report = Fuzzer(seed=args.seed, budget=args.budget, concurrency=args.concurrency,
+                    max_cases=args.max_cases).run()
+    print(report.format())
+    raise SystemExit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
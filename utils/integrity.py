@@ -0,0 +1,112 @@
+# utils/integrity.py
+"""
+참조 무결성 검증
+- 관련 컬렉션(/carts, /products, /users)을 각각 한 번만 조회하고 id 인덱스(dict) 생성
+- 모든 외래 키(cart.userId -> users, cart.products[].productId -> products)를 한 번의 선형 탐색으로 확인
+  (장바구니 상품마다 /products/{id}를 조회하는 N+1 요청 대신 컬렉션 수만큼만 요청)
+- 결과: 끊어진 참조(dangling reference) 목록을 담은 IntegrityReport
+
+    report = IntegrityChecker(client).run()
+    assert report.ok, report.format()
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ForeignKey:
+    """source 컬렉션의 field 값이 target 컬렉션의 id를 참조 ("products[].productId"는 목록 원소의 필드)"""
+
+    def __init__(self, source, field, target):
+        self.source = source
+        self.field = field
+        self.target = target
+        list_field, _, item_field = field.partition("[].")
+        self._list_field = list_field if item_field else None
+        self._item_field = item_field or field
+
+    def references(self, record):
+        """레코드의 (필드 경로, 참조 값) 목록"""
+        if self._list_field is None:
+            return [(self.field, record.get(self.field))]
+        items = record.get(self._list_field) or []
+        return [(f"{self._list_field}[{index}].{self._item_field}", item.get(self._item_field))
+                for index, item in enumerate(items)]
+
+    def __repr__(self):
+        return f"{self.source}.{self.field} -> {self.target}"
+
+
+RELATIONS = (
+    ForeignKey("carts", "userId", "users"),
+    ForeignKey("carts", "products[].productId", "products"),
+)
+
+
+class IntegrityReport:
+    def __init__(self):
+        self.counts = {}     # 컬렉션 -> 레코드 수
+        self.checked = {}    # 관계 -> 확인한 참조 수
+        self.dangling = []   # 끊어진 참조 dict 목록
+
+    @property
+    def ok(self):
+        return not self.dangling
+
+    def to_dict(self):
+        return {"counts": self.counts, "checked": self.checked, "dangling": self.dangling}
+
+    def format(self, limit=20):
+        lines = [f"{len(self.dangling)} dangling reference(s) in "
+                 f"{sum(self.checked.values())} checked ({', '.join(f'{k}={v}' for k, v in self.counts.items())})"]
+        for ref in self.dangling[:limit]:
+            lines.append(f"  {ref['source']}[id={ref['source_id']}].{ref['path']} = {ref['value']!r} "
+                         f"-> missing in {ref['target']}")
+        if len(self.dangling) > limit:
+            lines.append(f"  ... (+{len(self.dangling) - limit})")
+        return "\n".join(lines)
+
+
+class IntegrityChecker:
+    def __init__(self, client, relations=RELATIONS, load=None):
+        """
+        client: APIClient (컬렉션 조회용, 여러 스레드에서 공유 가능)
+        load: 컬렉션 이름 -> 레코드 목록을 반환하는 함수 (기본값: GET /{name} 1회)
+        """
+        self.client = client
+        self.relations = relations
+        self.load = load or self._load
+        self.indexes = {}    # 컬렉션 -> {id: 레코드} (run() 이후 참조 대상 조회용)
+
+    def _load(self, name):
+        response = self.client.get(f"/{name}")
+        response.raise_for_status()
+        return response.json()
+
+    def run(self):
+        names = sorted({r.source for r in self.relations} | {r.target for r in self.relations})
+        # 컬렉션끼리는 서로 독립적이므로 동시에 조회
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            collections = dict(zip(names, executor.map(self.load, names)))
+
+        report = IntegrityReport()
+        report.counts = {name: len(records) for name, records in collections.items()}
+        self.indexes = {name: {record.get("id"): record for record in records}
+                        for name, records in collections.items()}
+
+        for relation in self.relations:
+            target_ids = self.indexes[relation.target]
+            checked = 0
+            for record in collections[relation.source]:
+                for path, value in relation.references(record):
+                    checked += 1
+                    # dict/list 같은 값은 id가 될 수 없으므로 해시하지 않고 바로 끊어진 참조로 처리
+                    if not isinstance(value, (int, str)) or value not in target_ids:
+                        report.dangling.append({
+                            "source": relation.source,
+                            "source_id": record.get("id"),
+                            "path": path,
+                            "value": value,
+                            "target": relation.target,
+                        })
+            report.checked[repr(relation)] = checked
+        return report
@@ -0,0 +1,205 @@
+# utils/load_generator.py
+"""
+Open-loop 고정 도착률(constant arrival rate) 부하 생성기
+- 응답 속도와 무관하게 정해진 rps로 요청을 발생 (예: 500 rps x 60초)
+- 지연 시간은 "요청이 예정된 시각"부터 측정하여 coordinated omission 보정
+  (워커가 밀려 늦게 보낸 요청도 대기 시간이 지연 시간에 포함됨)
+- 엔드포인트별 처리량, 에러율, p50/p90/p99/p99.9 보고
+
+실행:
+    python -m utils.load_generator --rate 500 --duration 60 --endpoint "GET /products" --endpoint "GET /carts"
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import Config
+from utils.api_client import APIClient
+from utils.histogram import Histogram
+from utils.timing import TimingAdapter
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def parse_endpoint(spec):
+    """"GET /products" 또는 ("GET", "/products") -> ("GET", "/products")"""
+    if isinstance(spec, str):
+        method, _, path = spec.strip().partition(" ")
+        if not path:
+            method, path = "GET", method
+        return method.upper(), path.strip()
+    method, path = spec
+    return method.upper(), path
+
+
+class EndpointStats:
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.latencies = Histogram()      # 예정 시각 기준 (coordinated omission 보정), ns
+        self.service_times = Histogram()  # 실제 요청 시작 기준, ns
+        self.errors = 0
+        self.status_codes = {}
+
+    @property
+    def count(self):
+        return self.latencies.count
+
+    @property
+    def error_rate(self):
+        return self.errors / self.count if self.count else 0.0
+
+    def summary(self, elapsed):
+        return {
+            "endpoint": self.endpoint,
+            "requests": self.count,
+            "throughput": self.count / elapsed if elapsed else 0.0,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "status_codes": dict(self.status_codes),
+            "latency": {f"p{p}": self.latencies.percentile(p) / 1e9 for p in PERCENTILES},
+            "service_time": {f"p{p}": self.service_times.percentile(p) / 1e9 for p in PERCENTILES},
+            "max": self.latencies.max / 1e9,
+        }
+
+
+class LoadReport:
+    def __init__(self, target_rate, duration, elapsed, stats):
+        self.target_rate = target_rate
+        self.duration = duration
+        self.elapsed = elapsed
+        self.endpoints = {name: s.summary(elapsed) for name, s in stats.items()}
+
+    @property
+    def total_requests(self):
+        return sum(e["requests"] for e in self.endpoints.values())
+
+    @property
+    def error_rate(self):
+        total = self.total_requests
+        return sum(e["errors"] for e in self.endpoints.values()) / total if total else 0.0
+
+    @property
+    def throughput(self):
+        return self.total_requests / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self):
+        return {
+            "target_rate": self.target_rate,
+            "duration": self.duration,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+            "endpoints": self.endpoints,
+        }
+
+    def format(self):
+        lines = [
+            f"target {self.target_rate} rps x {self.duration}s -> "
+            f"{self.throughput:.1f} rps, {self.total_requests} requests, "
+            f"error rate {self.error_rate:.2%}",
+            f"{'endpoint':<30}{'rps':>9}{'err%':>8}" + "".join(f"{'p' + str(p):>10}" for p in PERCENTILES),
+        ]
+        for name, e in self.endpoints.items():
+            row = f"{name:<30}{e['throughput']:>9.1f}{e['error_rate'] * 100:>8.2f}"
+            row += "".join(f"{e['latency'][f'p{p}'] * 1000:>8.1f}ms" for p in PERCENTILES)
+            lines.append(row)
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """
+    rate(rps)로 duration(초) 동안 endpoints를 순서대로 돌아가며 요청
+    요청은 스레드 풀에서 APIClient.measure_response_time으로 실행
+    payloads: POST/PUT 요청 본문 iterator (dict 또는 utils/data_factory.py 레코드, 보낼 때 to_dict()로 직렬화)
+    client를 넘기면 그 세션의 adapter(커넥션 풀 크기 포함)는 바꾸지 않고, run()이 끝나도 닫지 않음
+    """
+
+    def __init__(self, endpoints, rate=None, duration=None, max_workers=None, client=None, payloads=None):
+        settings = Config.LOAD
+        self.endpoints = [parse_endpoint(e) for e in endpoints]
+        if not self.endpoints:
+            raise ValueError("At least one endpoint is required")
+        self.rate = rate or settings["rate"]
+        self.duration = duration or settings["duration"]
+        self.max_workers = max_workers or settings["max_workers"]
+        self.payloads = iter(payloads) if payloads is not None else None
+        self._owns_client = client is None
+        if self._owns_client:
+            # 부하 측정은 캐시/카세트/재시도 없이 실제 요청만 보내고, 커넥션 풀은 워커 수에 맞춤
+            self.client = APIClient(cache=False, cassette=False, resilience=False)
+            adapter = TimingAdapter(pool_connections=len(self.endpoints), pool_maxsize=self.max_workers)
+            self.client.session.mount("http://", adapter)
+            self.client.session.mount("https://", adapter)
+        else:
+            self.client = client
+        self._lock = threading.Lock()
+
+    def _fire(self, method, path, intended, stats, payload=None):
+        status, error = None, False
+        started = time.perf_counter_ns()
+        try:
+            if hasattr(payload, "to_dict"):
+                payload = payload.to_dict()
+            response, _ = self.client.measure_response_time(method, path, json=payload)
+            status = response.status_code
+            error = status >= 400
+        except Exception:
+            error = True
+        finished = time.perf_counter_ns()
+        with self._lock:
+            stats.latencies.record(finished - intended)
+            stats.service_times.record(finished - started)
+            if error:
+                stats.errors += 1
+            key = status if status is not None else "exception"
+            stats.status_codes[key] = stats.status_codes.get(key, 0) + 1
+
+    def run(self):
+        stats = {f"{m} {p}": EndpointStats(f"{m} {p}") for m, p in self.endpoints}
+        total = int(self.rate * self.duration)
+        interval_ns = 1e9 / self.rate
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="load") as pool:
+                start = time.perf_counter_ns()
+                for i in range(total):
+                    intended = start + int(i * interval_ns)
+                    delay = intended - time.perf_counter_ns()
+                    if delay > 0:
+                        time.sleep(delay / 1e9)
+                    method, path = self.endpoints[i % len(self.endpoints)]
+                    # payload는 요청 직전에 하나씩 꺼내므로 요청 수와 관계없이 메모리 사용량이 일정
+                    payload = next(self.payloads) if self.payloads is not None and method in ("POST", "PUT") else None
+                    pool.submit(self._fire, method, path, intended, stats[f"{method} {path}"], payload)
+            elapsed = (time.perf_counter_ns() - start) / 1e9
+        finally:
+            if self._owns_client:
+                self.client.close()
+        return LoadReport(self.rate, self.duration, elapsed, stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop constant arrival rate load generator")
+    parser.add_argument("--endpoint", action="append", required=True,
+                        help='"METHOD /path" (여러 번 지정 가능)')
+    parser.add_argument("--rate", type=float, default=Config.LOAD["rate"], help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=Config.LOAD["duration"], help="실행 시간 (초)")
+    parser.add_argument("--workers", type=int, default=Config.LOAD["max_workers"])
+    parser.add_argument("--base-url", default=None, help="기본값: Config.BASE_URL")
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    if args.base_url:
+        Config.BASE_URL = args.base_url
+    report = LoadGenerator(args.endpoint, rate=args.rate, duration=args.duration,
+                           max_workers=args.workers).run()
+    print(report.format())
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
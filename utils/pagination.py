@@ -0,0 +1,68 @@
+# utils/pagination.py
+"""
+limit / offset 페이지 단위 목록 조회 (APIClient.iter_collection)
+- 원소를 하나씩 yield하면서 다음 prefetch개 페이지를 백그라운드 스레드에서 동시에 요청
+- 요청 중이거나 받아둔 페이지는 최대 prefetch개 (소비자가 원소를 가져가야 다음 페이지를 요청하는 backpressure)
+- page_size보다 짧은 페이지(빈 페이지 포함)를 받으면 종료하고 남은 요청은 취소
+- 서버가 offset을 무시하면 같은 페이지가 반복되므로, 직전 페이지와 같은 페이지를 받으면 PaginationError
+
+    for product in client.iter_collection("/products", page_size=50):
+        ...
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import Config
+
+
+class PaginationError(ValueError):
+    """페이지 응답이 목록이 아니거나 같은 페이지가 반복되는 경우"""
+
+
+def page_path(path, offset, limit):
+    """기존 쿼리(sort 등)를 유지하고 limit / offset 추가: /products?sort=desc&limit=50&offset=100"""
+    settings = Config.PAGINATION
+    separator = "&" if "?" in path else "?"
+    return f"{path}{separator}{settings['limit_param']}={limit}&{settings['offset_param']}={offset}"
+
+
+def iter_pages(fetch_page, page_size, prefetch):
+    """
+    fetch_page(offset, limit) -> 원소 list 를 호출해 원소를 순서대로 yield
+    fetch_page는 prefetch개 스레드에서 동시에 호출됨
+    """
+    if page_size < 1 or prefetch < 1:
+        raise ValueError("page_size and prefetch must be at least 1")
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="page-prefetch")
+    pending = deque()
+    next_offset = 0
+
+    def submit():
+        nonlocal next_offset
+        pending.append((next_offset, executor.submit(fetch_page, next_offset, page_size)))
+        next_offset += page_size
+
+    try:
+        for _ in range(prefetch):
+            submit()
+        previous = None
+        while pending:
+            offset, future = pending.popleft()
+            page = future.result()
+            if not isinstance(page, list):
+                raise PaginationError(f"page at offset {offset} is not a JSON array: {type(page).__name__}")
+            if page and page == previous:
+                raise PaginationError(
+                    f"page at offset {offset} repeats the previous page (server ignores "
+                    f"'{Config.PAGINATION['offset_param']}'?)")
+            if len(page) < page_size:
+                yield from page
+                return
+            # 현재 페이지를 소비하는 동안 다음 페이지 요청 (요청 중 + 받아둔 페이지 <= prefetch)
+            submit()
+            previous = page
+            yield from page
+    finally:
+        # 끝까지 읽지 않고 닫은 경우(break, 검증 실패) 아직 시작하지 않은 요청 취소
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,265 @@
+# utils/profiler.py
+"""
+클라이언트 오버헤드 프로파일러 (API_PROFILE=1, plugins/profiler.py)
+테스트가 느릴 때 시간이 네트워크에서 쓰이는지 프레임워크 코드에서 쓰이는지 구분
+
+테스트(call 단계)마다 측정하는 값 (초):
+- wall:       테스트 실행 시간
+- network:    APIClient 요청 중 CPU를 쓰지 않고 기다린 시간 (요청 wall - 요청 CPU)
+- request:    requests / urllib3가 쓴 CPU 시간 (요청 준비, 헤더 / 본문 처리)
+- decode:     response.json() 디코딩 CPU 시간
+- validation: 테스트 스레드의 나머지 CPU 시간 (스키마 / 값 범위 검증, 테스트 파일의 Python 루프)
+CPU 시간은 time.thread_time() 기준이므로 같은 프로세스에서 도는 stand-in 서버 스레드는 포함되지 않음
+
+샘플링 스택 수집:
+- 백그라운드 스레드가 interval초마다 테스트 스레드의 스택(sys._current_frames)을 기록
+- 스택은 "test;file:function;..." 형태의 folded 형식으로 합산
+  flamegraph.pl / speedscope에서 바로 열 수 있음
+
+    profiler = ClientProfiler()
+    profiler.begin("tests/test_products.py::test_x")
+    with profiler.measure("decode"):
+        response.json()
+    profile = profiler.end()
+"""
+
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from config.config import Config
+
+CATEGORIES = ("network", "request", "decode", "validation")
+
+_STDLIB = sysconfig.get_paths()["stdlib"]
+
+
+class CallProfile:
+    """테스트 1개의 시간 분해"""
+
+    def __init__(self, nodeid, thread_id):
+        self.nodeid = nodeid
+        self.thread_id = thread_id
+        self.wall = 0.0
+        self.cpu = 0.0       # 테스트 스레드 CPU 시간
+        self.requests = 0
+        self.network = 0.0
+        self.request = 0.0
+        self.decode = 0.0
+        self.samples = 0
+        # 테스트 스레드에서 측정한 request / decode CPU (validation 계산용)
+        self._own_cpu = 0.0
+        self._started = time.perf_counter()
+        self._started_cpu = time.thread_time()
+
+    def finish(self):
+        self.wall = time.perf_counter() - self._started
+        self.cpu = time.thread_time() - self._started_cpu
+
+    @property
+    def validation(self):
+        return max(0.0, self.cpu - self._own_cpu)
+
+    def to_dict(self):
+        return {
+            "nodeid": self.nodeid,
+            "wall": self.wall,
+            "requests": self.requests,
+            "network": self.network,
+            "request": self.request,
+            "decode": self.decode,
+            "validation": self.validation,
+            "samples": self.samples,
+        }
+
+
+class StackSampler:
+    """대상 스레드의 스택을 주기적으로 수집해 folded 스택별 샘플 수로 합산"""
+
+    def __init__(self, interval=None, max_depth=None):
+        settings = Config.PROFILE
+        self.interval = interval or settings["sample_interval"]
+        self.max_depth = max_depth or settings["max_depth"]
+        self.stacks = Counter()
+        self.taken = 0  # 현재 대상에서 수집한 샘플 수
+        # 생략할 테스트 실행기(pytest / pluggy) 경로 접두사 (plugins/profiler.py가 설정)
+        self.harness = ()
+        self._target = None
+        self._root = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def attach(self, thread_id, root):
+        with self._lock:
+            self._target, self._root = thread_id, root
+            self.taken = 0
+
+    def detach(self):
+        with self._lock:
+            self._target = self._root = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                target, root = self._target, self._root
+            if target is None:
+                continue
+            frame = sys._current_frames().get(target)
+            if frame is not None:
+                self.sample(frame, root)
+
+    def sample(self, frame, root):
+        names = []
+        in_test = False
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            harness = bool(self.harness) and code.co_filename.startswith(self.harness)
+            # 테스트 코드 아래의 pytest / pluggy 호출 프레임은 모든 샘플에 공통이므로 생략
+            if harness and in_test:
+                break
+            in_test = in_test or not harness
+            names.append(f"{_short_path(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        names.append(root)
+        names.reverse()
+        # folded 형식에서 ";"는 프레임 구분자, 공백은 샘플 수 구분자
+        stack = ";".join(name.replace(";", ":").replace(" ", "_") for name in names)
+        with self._lock:
+            self.stacks[stack] += 1
+            self.taken += 1
+
+    def hottest(self, n=10):
+        return hottest_frames(self.stacks, n)
+
+
+def _short_path(filename):
+    """라이브러리는 site-packages / 표준 라이브러리 기준 경로, 프로젝트 파일은 상대 경로"""
+    index = filename.rfind("site-packages" + os.sep)
+    if index != -1:
+        return filename[index + len("site-packages") + 1:]
+    if filename.startswith(_STDLIB):
+        return filename[len(_STDLIB):].lstrip(os.sep)
+    try:
+        return os.path.relpath(filename)
+    except ValueError:
+        return filename
+
+
+class ClientProfiler:
+    def __init__(self, sampling=None):
+        settings = Config.PROFILE
+        self.sampler = StackSampler() if (settings["sampling"] if sampling is None else sampling) else None
+        self.profiles = []
+        self.current = None
+        self._lock = threading.Lock()
+        if self.sampler is not None:
+            self.sampler.start()
+
+    def begin(self, nodeid):
+        thread_id = threading.get_ident()
+        self.current = CallProfile(nodeid, thread_id)
+        if self.sampler is not None:
+            self.sampler.attach(thread_id, nodeid)
+        return self.current
+
+    def end(self):
+        profile, self.current = self.current, None
+        if profile is None:
+            return None
+        if self.sampler is not None:
+            self.sampler.detach()
+            profile.samples = self.sampler.taken
+        profile.finish()
+        self.profiles.append(profile)
+        return profile
+
+    @contextmanager
+    def measure(self, category):
+        """
+        category("request" / "decode") 구간의 wall / CPU 시간을 실행 중인 테스트에 기록
+        request 구간은 wall - CPU를 network 대기 시간으로 기록
+        """
+        profile = self.current
+        if profile is None:
+            yield
+            return
+        started, started_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            cpu = time.thread_time() - started_cpu
+            wall = time.perf_counter() - started
+            with self._lock:
+                if category == "request":
+                    profile.requests += 1
+                    profile.network += max(0.0, wall - cpu)
+                setattr(profile, category, getattr(profile, category) + cpu)
+                if threading.get_ident() == profile.thread_id:
+                    profile._own_cpu += cpu
+
+    def close(self):
+        if self.sampler is not None:
+            self.sampler.stop()
+
+    def write_folded(self, path, stacks=None):
+        """flamegraph.pl / speedscope용 folded 스택 파일 ("frame;frame;frame 샘플수")"""
+        stacks = self.sampler.stacks if stacks is None else stacks
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+def hottest_frames(stacks, n=10):
+    """self time 기준(스택의 leaf 프레임) 샘플 수 상위 프레임 [(frame, samples)]"""
+    leaves = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    return leaves.most_common(n)
+
+
+def format_profiles(profiles, top=None):
+    """wall 시간이 긴 테스트부터 시간 분해 표 (profiles: to_dict() 목록)"""
+    top = top or Config.PROFILE["top"]
+    rows = sorted(profiles, key=lambda p: p["wall"], reverse=True)[:top]
+    lines = [f"{'wall':>8} {'network':>8} {'request':>8} {'decode':>8} {'valid.':>8} {'reqs':>5}  test (ms)"]
+    for p in rows:
+        lines.append(f"{p['wall'] * 1e3:8.1f} {p['network'] * 1e3:8.1f} {p['request'] * 1e3:8.1f} "
+                     f"{p['decode'] * 1e3:8.1f} {p['validation'] * 1e3:8.1f} {p['requests']:5d}  {p['nodeid']}")
+    totals = {key: sum(p[key] for p in profiles) for key in ("wall",) + CATEGORIES}
+    if totals["wall"]:
+        lines.append("total: " + " ".join(
+            f"{key}={totals[key]:.3f}s ({totals[key] / totals['wall']:.0%})" for key in ("wall",) + CATEGORIES))
+    return "\n".join(lines)
+
+
+_shared_profiler = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_profiler():
+    """Config.PROFILE['enabled']면 프로세스 공유 ClientProfiler, 아니면 None"""
+    global _shared_profiler
+    if not Config.PROFILE["enabled"]:
+        return None
+    with _shared_lock:
+        if _shared_profiler is None:
+            _shared_profiler = ClientProfiler()
+        return _shared_profiler
@@ -0,0 +1,247 @@
+# utils/report_builder.py
+"""
+결과 JSONL(utils/result_sink.py)을 한 번 스트리밍으로 읽어 요약 HTML 생성
+
+    python -m utils.report_builder reports/results.jsonl -o reports/summary.html
+
+- 파일을 한 줄씩 읽으며 집계하므로 메모리 사용량은 레코드 수가 아니라 엔드포인트 / 구간 수에 비례
+  - 엔드포인트별 지연 시간은 Histogram(utils/histogram.py), 느린 테스트는 크기 제한 heap으로 유지
+  - 지연 시간 추이는 최대 trend_buckets개 구간으로 집계하고, 실행이 길어지면 인접 구간을 합쳐 폭을 2배로 늘림
+- 실행 시작 시각은 "run" 레코드 기준 (없으면 첫 레코드 기준)
+"""
+
+import argparse
+import heapq
+import html
+import json
+import os
+
+from config.config import Config
+from utils.histogram import Histogram
+
+_FAILED_LIMIT = 50
+
+
+class TrendSeries:
+    """실행 시작 후 경과 시간 구간별 지연 시간 히스토그램 / 에러 수 (구간 수 제한)"""
+
+    def __init__(self, max_buckets=None, width=1.0):
+        self.max_buckets = max_buckets or Config.RESULTS["trend_buckets"]
+        self.width = width   # 구간 폭 (초)
+        self.buckets = {}    # 구간 번호 -> [Histogram, 에러 수]
+
+    def add(self, offset, value_ns, error=False):
+        index = int(max(offset, 0) / self.width)
+        while index >= self.max_buckets:
+            self._widen()
+            index //= 2
+        bucket = self.buckets.get(index)
+        if bucket is None:
+            bucket = self.buckets[index] = [Histogram(), 0]
+        bucket[0].record(value_ns)
+        bucket[1] += error
+
+    def _widen(self):
+        self.width *= 2
+        merged = {}
+        for index, (histogram, errors) in self.buckets.items():
+            target = merged.get(index // 2)
+            if target is None:
+                merged[index // 2] = [histogram, errors]
+            else:
+                target[0].merge(histogram)
+                target[1] += errors
+        self.buckets = merged
+
+    def points(self):
+        """[(구간 시작 초, count, p50 ms, p99 ms, error 수)]"""
+        return [
+            (index * self.width, histogram.count, histogram.percentile(50) / 1e6,
+             histogram.percentile(99) / 1e6, errors)
+            for index, (histogram, errors) in sorted(self.buckets.items())
+        ]
+
+
+class ReportBuilder:
+    def __init__(self, trend_buckets=None, slowest=10):
+        self.started = None
+        self.outcomes = {}
+        self.test_time = 0.0
+        self.slowest_limit = slowest
+        self.slowest = []  # (duration, nodeid) min-heap
+        self.failed = []
+        self.endpoints = {}  # endpoint -> {"latency": Histogram, "errors": n, "status": {code: n}}
+        self.requests = 0
+        self.trend = TrendSeries(trend_buckets)
+        self.invalid_lines = 0
+
+    def feed(self, lines):
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 실행 도중(또는 비정상 종료 후) 읽으면 마지막 줄이 잘려 있을 수 있음
+                self.invalid_lines += 1
+                continue
+            self.add(record)
+        return self
+
+    def add(self, record):
+        kind = record.get("type")
+        if kind == "run":
+            self.started = record["ts"]
+            return
+        if self.started is None:
+            self.started = record.get("ts", 0)
+        if kind == "test":
+            self._add_test(record)
+        elif kind == "request":
+            self._add_request(record)
+
+    def _add_test(self, record):
+        outcome = record["outcome"]
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if record.get("when", "call") != "call":
+            if outcome == "failed" and len(self.failed) < _FAILED_LIMIT:
+                self.failed.append(f"{record['nodeid']} ({record['when']})")
+            return
+        self.test_time += record["duration"]
+        if outcome == "failed" and len(self.failed) < _FAILED_LIMIT:
+            self.failed.append(record["nodeid"])
+        entry = (record["duration"], record["nodeid"])
+        if len(self.slowest) < self.slowest_limit:
+            heapq.heappush(self.slowest, entry)
+        elif entry > self.slowest[0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def _add_request(self, record):
+        total_ns = int(record["phases"].get("total", record["phases"].get("ttfb", 0)) * 1e6)
+        status = record["status"]
+        error = status >= 400
+        stats = self.endpoints.get(record["endpoint"])
+        if stats is None:
+            stats = self.endpoints[record["endpoint"]] = {"latency": Histogram(), "errors": 0, "status": {}}
+        stats["latency"].record(total_ns)
+        stats["errors"] += error
+        stats["status"][status] = stats["status"].get(status, 0) + 1
+        self.requests += 1
+        self.trend.add(record["ts"] - self.started, total_ns, error)
+
+    def to_dict(self):
+        return {
+            "tests": dict(self.outcomes),
+            "test_time": self.test_time,
+            "requests": self.requests,
+            "slowest": [{"nodeid": n, "duration": d} for d, n in sorted(self.slowest, reverse=True)],
+            "failed": list(self.failed),
+            "endpoints": {
+                endpoint: {
+                    "count": stats["latency"].count,
+                    "errors": stats["errors"],
+                    "p50_ms": stats["latency"].percentile(50) / 1e6,
+                    "p99_ms": stats["latency"].percentile(99) / 1e6,
+                    "status": {str(code): n for code, n in sorted(stats["status"].items())},
+                }
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+            "trend": [
+                {"offset": offset, "count": count, "p50_ms": p50, "p99_ms": p99, "errors": errors}
+                for offset, count, p50, p99, errors in self.trend.points()
+            ],
+        }
+
+    def render_html(self):
+        summary = self.to_dict()
+        parts = [
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>API Test Summary</title>",
+            "<style>body{font-family:sans-serif;margin:24px}table{border-collapse:collapse;margin:12px 0}"
+            "td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}td:first-child{text-align:left}"
+            ".failed{color:#c00}</style></head><body>",
+            "<h1>API Test Summary</h1>",
+            "<h2>Tests</h2><table><tr>",
+            "".join(f"<th>{html.escape(outcome)}</th>" for outcome in sorted(summary["tests"])),
+            "<th>total time</th></tr><tr>",
+            "".join(f"<td>{summary['tests'][outcome]}</td>" for outcome in sorted(summary["tests"])),
+            f"<td>{summary['test_time']:.2f}s</td></tr></table>",
+        ]
+        if summary["failed"]:
+            parts.append("<h3>Failed</h3><ul>")
+            parts.extend(f"<li class='failed'>{html.escape(nodeid)}</li>" for nodeid in summary["failed"])
+            parts.append("</ul>")
+        if summary["slowest"]:
+            parts.append("<h3>Slowest tests</h3><table><tr><th>test</th><th>duration</th></tr>")
+            parts.extend(f"<tr><td>{html.escape(t['nodeid'])}</td><td>{t['duration']:.3f}s</td></tr>"
+                         for t in summary["slowest"])
+            parts.append("</table>")
+
+        parts.append(f"<h2>Requests ({summary['requests']})</h2>")
+        parts.append("<table><tr><th>endpoint</th><th>count</th><th>errors</th><th>p50</th><th>p99</th>"
+                     "<th>status</th></tr>")
+        for endpoint, stats in summary["endpoints"].items():
+            codes = " ".join(f"{code}:{n}" for code, n in stats["status"].items())
+            parts.append(
+                f"<tr><td>{html.escape(endpoint)}</td><td>{stats['count']}</td><td>{stats['errors']}</td>"
+                f"<td>{stats['p50_ms']:.1f}ms</td><td>{stats['p99_ms']:.1f}ms</td><td>{codes}</td></tr>")
+        parts.append("</table>")
+        if summary["trend"]:
+            parts.append(f"<h2>Latency trend ({self.trend.width:g}s buckets)</h2>")
+            parts.append(self._trend_svg(summary["trend"]))
+        parts.append("</body></html>")
+        return "".join(parts)
+
+    @staticmethod
+    def _trend_svg(points, width=720, height=220):
+        span = max(p["offset"] for p in points) or 1.0
+        peak = max(p["p99_ms"] for p in points) or 1.0
+
+        def polyline(key, color):
+            coords = " ".join(
+                f"{40 + p['offset'] / span * (width - 60):.1f},{height - 20 - p[key] / peak * (height - 40):.1f}"
+                for p in points)
+            return f"<polyline fill='none' stroke='{color}' stroke-width='1.5' points='{coords}'/>"
+
+        return (
+            f"<svg width='{width}' height='{height}' xmlns='http://www.w3.org/2000/svg'>"
+            f"<text x='0' y='14' font-size='11'>{peak:.1f}ms</text>"
+            f"<text x='{width - 60}' y='{height - 4}' font-size='11'>{span:.0f}s</text>"
+            f"{polyline('p50_ms', '#1f77b4')}{polyline('p99_ms', '#d62728')}"
+            f"<text x='50' y='14' font-size='11' fill='#1f77b4'>p50</text>"
+            f"<text x='80' y='14' font-size='11' fill='#d62728'>p99</text></svg>"
+        )
+
+
+def build_report(results_path=None, output_path=None):
+    """results_path의 JSONL을 읽어 output_path에 요약 HTML 저장, ReportBuilder 반환"""
+    results_path = results_path or Config.RESULTS["path"]
+    output_path = output_path or Config.RESULTS["summary_path"]
+    builder = ReportBuilder()
+    with open(results_path) as f:
+        builder.feed(f)
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output_path, "w") as f:
+        f.write(builder.render_html())
+    return builder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a summary HTML report from results JSONL")
+    parser.add_argument("results", nargs="?", default=Config.RESULTS["path"])
+    parser.add_argument("-o", "--output", default=Config.RESULTS["summary_path"])
+    parser.add_argument("--json", dest="json_path", help="요약을 JSON 파일로도 저장")
+    args = parser.parse_args()
+
+    builder = build_report(args.results, args.output)
+    summary = builder.to_dict()
+    print(f"tests={summary['tests']} requests={summary['requests']} -> {args.output}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
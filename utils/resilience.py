@@ -0,0 +1,296 @@
+# utils/resilience.py
+"""
+APIClient 재시도 / 동시성 제어
+- AIMDLimiter: 동시 요청 수를 성공 시 조금씩 늘리고(additive increase), 429/503/타임아웃 시 절반으로 줄임(multiplicative decrease)
+- RetryBudget: 전체 요청 대비 재시도 비율을 제한해 재시도 폭주 방지
+- Retry-After 헤더 우선, 없으면 jitter가 적용된 지수 백오프
+- CircuitBreaker: 엔드포인트별로 연속 실패가 쌓이면 일정 시간 요청 차단
+
+xdist 워커마다 독립적으로 동작하지만, AIMD 특성상 같은 upstream을 공유하는 워커들이 각자 수렴함
+"""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from config.config import Config
+from utils.timing import endpoint_key
+
+THROTTLE_STATUSES = (429, 503)
+RETRYABLE_STATUSES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE", "OPTIONS")
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """서킷이 열려 있어 요청을 보내지 않은 경우"""
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP-date) -> 대기 초, 해석 불가면 None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt, base, cap, rng=random):
+    """full jitter 지수 백오프: 0 ~ min(cap, base * 2^attempt)"""
+    return rng.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class AIMDLimiter:
+    def __init__(self, initial, min_limit, max_limit, decrease_factor=0.5, decrease_cooldown=0.1):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, congested):
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if congested:
+                # 같은 혼잡 구간에서 여러 번 줄이지 않도록 cooldown 적용
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                    self._last_decrease = now
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class RetryBudget:
+    """요청마다 ratio만큼 토큰 적립, 재시도 1회당 토큰 1개 소모 (초당 min_per_second는 항상 허용)"""
+
+    def __init__(self, ratio, min_per_second):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self._tokens = 0.0
+        self._window_start = time.monotonic()
+        self._window_retries = 0
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, 1000.0)
+
+    def withdraw(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_retries = 0
+            if self._window_retries < self.min_per_second:
+                self._window_retries += 1
+                return True
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self, endpoint):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"Circuit open for {endpoint}")
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN:
+                # half-open 상태에서는 시험 요청 1건만 허용
+                if self._trial_in_flight:
+                    raise CircuitOpenError(f"Circuit half-open for {endpoint}")
+                self._trial_in_flight = True
+
+    def record(self, success):
+        with self._lock:
+            self._trial_in_flight = False
+            if success:
+                self.state = self.CLOSED
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class ResiliencePolicy:
+    """AIMD 동시성 제한 + 재시도 예산 + 백오프 + 엔드포인트별 서킷 브레이커"""
+
+    def __init__(self, settings=None, rng=None):
+        settings = settings or Config.RESILIENCE
+        self.settings = settings
+        self.limiter = AIMDLimiter(settings["initial_limit"], settings["min_limit"], settings["max_limit"])
+        self.budget = RetryBudget(settings["retry_budget_ratio"], settings["retry_budget_min_per_second"])
+        self.rng = rng or random.Random()
+        self.breakers = {}
+        self.stats = dict.fromkeys(("requests", "retries", "throttled", "budget_exhausted", "circuit_rejected"), 0)
+        self._lock = threading.Lock()
+
+    def breaker_for(self, endpoint):
+        with self._lock:
+            breaker = self.breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.settings["breaker_failure_threshold"],
+                                         self.settings["breaker_reset_timeout"])
+                self.breakers[endpoint] = breaker
+            return breaker
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _begin(self, method, path):
+        endpoint = endpoint_key(method, path)
+        breaker = self.breaker_for(endpoint)
+        try:
+            breaker.before_request(endpoint)
+        except CircuitOpenError:
+            self._count("circuit_rejected")
+            raise
+        self._count("requests")
+        self.budget.deposit()
+        return breaker
+
+    def _next_delay(self, method, response, error, attempt, breaker):
+        """시도 결과를 반영하고 재시도 대기 시간 반환 (재시도하지 않으면 서킷에 결과 기록 후 None)"""
+        status = response.status_code if response is not None else None
+        if status in THROTTLE_STATUSES:
+            self._count("throttled")
+        delay = self._retry_delay(method, response, error, attempt)
+        if delay is not None and not self.budget.withdraw():
+            self._count("budget_exhausted")
+            delay = None
+        if delay is None:
+            # 5xx와 커넥션 에러만 서킷 실패로 집계 (429/4xx는 엔드포인트 장애가 아님)
+            breaker.record(error is None and status < 500)
+        else:
+            self._count("retries")
+        return delay
+
+    def execute(self, method, path, send):
+        """send()를 정책에 따라 실행하고 최종 응답 반환 (재시도 불가한 예외는 그대로 전달)"""
+        breaker = self._begin(method, path)
+        attempt = 0
+        try:
+            while True:
+                response, error = None, None
+                self.limiter.acquire()
+                try:
+                    response = send()
+                except (requests.ConnectionError, requests.Timeout) as exc:
+                    error = exc
+                finally:
+                    status = response.status_code if response is not None else None
+                    self.limiter.release(status in THROTTLE_STATUSES or isinstance(error, requests.Timeout))
+
+                delay = self._next_delay(method, response, error, attempt, breaker)
+                if delay is None:
+                    break
+                time.sleep(delay)
+                attempt += 1
+        except BaseException:
+            # 그 밖의 예외(ChunkedEncodingError, KeyboardInterrupt 등)도 실패로 기록
+            # (기록하지 않으면 half-open 시험 요청이 끝나지 않아 이후 요청이 계속 거부됨)
+            breaker.record(False)
+            raise
+        if error is not None:
+            raise error
+        return response
+
+    async def execute_async(self, method, path, send, retryable_errors=()):
+        """
+        비동기 버전 (AsyncAPIClient) - 동시 실행 개수는 호출 측 semaphore가 제한하므로 limiter는 사용하지 않음
+        send: 응답을 반환하는 코루틴 함수, retryable_errors: 커넥션 에러로 취급할 예외 타입
+        """
+        breaker = self._begin(method, path)
+        attempt = 0
+        try:
+            while True:
+                response, error = None, None
+                try:
+                    response = await send()
+                except retryable_errors as exc:
+                    error = exc
+                delay = self._next_delay(method, response, error, attempt, breaker)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+                attempt += 1
+        except BaseException:
+            # retryable_errors 밖의 예외 / 작업 취소(CancelledError)도 실패로 기록
+            breaker.record(False)
+            raise
+        if error is not None:
+            raise error
+        return response
+
+    def _retry_delay(self, method, response, error, attempt):
+        """재시도 대기 시간(초), 재시도하지 않으면 None"""
+        if attempt >= self.settings["max_retries"]:
+            return None
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if error is not None:
+            retryable = idempotent
+        else:
+            status = response.status_code
+            # 429/503은 서버가 요청을 처리하지 않았으므로 POST도 재시도
+            retryable = status in THROTTLE_STATUSES or (status in RETRYABLE_STATUSES and idempotent)
+        if not retryable:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            if retry_after > self.settings["max_retry_after"]:
+                return None
+            return retry_after
+        return backoff_delay(attempt, self.settings["backoff_base"], self.settings["backoff_cap"], self.rng)
+
+
+_shared_policy = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_policy():
+    """프로세스 전체에서 공유하는 정책 (Config.RESILIENCE['enabled']가 False면 None)"""
+    global _shared_policy
+    if not Config.RESILIENCE["enabled"]:
+        return None
+    with _shared_lock:
+        if _shared_policy is None:
+            _shared_policy = ResiliencePolicy()
+        return _shared_policy
@@ -0,0 +1,150 @@
+# utils/response_cache.py
+"""
+APIClient GET 응답 캐시
+- LRU + 크기(엔트리 수, 바이트) 제한
+- TTL이 지난 엔트리는 ETag / Last-Modified로 조건부 재검증 (304면 본문 재사용)
+- 같은 리소스 경로에 POST/PUT/PATCH/DELETE가 발생하면 자동 무효화
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from config.config import Config
+
+
+class CacheEntry:
+    __slots__ = ("response", "size", "expires_at", "etag", "last_modified")
+
+    def __init__(self, response, ttl):
+        self.response = response
+        self.size = len(response.content or b"")
+        self.expires_at = time.monotonic() + ttl
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    def is_fresh(self):
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def resource_root(path):
+    """/carts/1?x=y -> /carts (쓰기 요청 시 무효화 범위)"""
+    path = path.split("?", 1)[0]
+    parts = [p for p in path.split("/") if p]
+    return "/" + parts[0] if parts else "/"
+
+
+class ResponseCache:
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None):
+        settings = Config.CACHE
+        self.max_entries = max_entries or settings["max_entries"]
+        self.max_bytes = max_bytes or settings["max_bytes"]
+        self.ttl = settings["ttl"] if ttl is None else ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "revalidated", "stores", "evictions", "invalidations", "bytes_saved"), 0)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, path):
+        """
+        (신선한 응답, 재검증 헤더) 반환
+        - 신선한 엔트리: (response, None)
+        - 만료됐지만 검증자가 있는 엔트리: (None, 조건부 헤더)
+        - 없음: (None, None)
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None, None
+            self._entries.move_to_end(path)
+            if entry.is_fresh():
+                self._stats["hits"] += 1
+                self._stats["bytes_saved"] += entry.size
+                return entry.response, None
+            headers = entry.conditional_headers()
+            if not headers:
+                self._remove(path)
+            self._stats["misses"] += 1
+            return None, headers or None
+
+    def revalidate(self, path):
+        """304 Not Modified 수신 시 기존 본문을 재사용하고 만료 시간 갱신"""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl
+            self._stats["revalidated"] += 1
+            self._stats["bytes_saved"] += entry.size
+            return entry.response
+
+    def store(self, path, response):
+        if response.status_code != 200:
+            return
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        entry = CacheEntry(response, self.ttl)
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if path in self._entries:
+                self._remove(path)
+            self._entries[path] = entry
+            self._bytes += entry.size
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, path):
+        """path와 같은 리소스(/carts, /carts/1, /carts/user/1 ...)의 캐시 엔트리 제거"""
+        root = resource_root(path)
+        with self._lock:
+            for key in [k for k in self._entries if resource_root(k) == root]:
+                self._remove(key)
+                self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = (stats["hits"] + stats["revalidated"]) / lookups if lookups else 0.0
+        return stats
+
+    def _remove(self, path):
+        entry = self._entries.pop(path)
+        self._bytes -= entry.size
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache():
+    """프로세스 전체에서 공유하는 캐시 (테스트 클래스 간 /products 등 재사용)"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
@@ -0,0 +1,117 @@
+# utils/result_sink.py
+"""
+테스트 / 요청 결과를 JSONL 파일에 실시간으로 추가 (append)
+- 레코드는 메모리 버퍼에 모았다가 flush_every개마다 파일 락(flock) 안에서 한 번에 append
+  pytest-xdist 워커가 동시에 써도 줄이 섞이지 않음
+- 보관하는 레코드는 버퍼 크기까지만이므로 요청이 수십만 건이어도 메모리 사용량이 일정
+- 요약 HTML은 utils/report_builder.py가 파일을 한 번 스트리밍으로 읽어 생성
+
+레코드 형식 (한 줄에 JSON 하나):
+    {"type": "run", "ts": ...}                                     실행 시작 (컨트롤러)
+    {"type": "test", "ts": ..., "nodeid": ..., "outcome": ..., "duration": ...}
+    {"type": "request", "ts": ..., "worker": ..., "test": ..., "endpoint": "GET /products/{id}",
+     "status": 200, "phases": {"ttfb": 1.2, ..., "total": 1.5}}     (phases 단위: ms)
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+from config.config import Config
+from utils.file_lock import FileLock
+
+
+class ResultSink:
+    def __init__(self, path, flush_every=None):
+        self.path = path
+        self.flush_every = flush_every or Config.RESULTS["flush_every"]
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.current_test = None  # 요청 레코드에 기록할 실행 중인 테스트 (plugins/results.py가 설정)
+        self._buffer = []
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) < self.flush_every:
+                return
+            lines, self._buffer = self._buffer, []
+        self._append(lines)
+
+    def request(self, endpoint, status, phases):
+        """phases: RequestTiming.phases (ns) -> ms로 기록"""
+        self.write({
+            "type": "request",
+            "ts": time.time(),
+            "worker": self.worker,
+            "test": self.current_test,
+            "endpoint": endpoint,
+            "status": status,
+            "phases": {phase: round(ns / 1e6, 3) for phase, ns in phases.items()},
+        })
+
+    def test(self, nodeid, outcome, duration, when="call"):
+        self.write({
+            "type": "test",
+            "ts": time.time(),
+            "worker": self.worker,
+            "nodeid": nodeid,
+            "when": when,
+            "outcome": outcome,
+            "duration": round(duration, 6),
+        })
+
+    def flush(self):
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if lines:
+            self._append(lines)
+
+    def truncate(self):
+        """새 실행 시작: 이전 실행 결과 삭제"""
+        with self._lock:
+            self._buffer = []
+        with FileLock(self.path + ".lock"):
+            open(self.path, "w").close()
+
+    def _append(self, lines):
+        data = ("\n".join(lines) + "\n").encode()
+        with FileLock(self.path + ".lock"):
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+    close = flush
+
+
+_shared_sink = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_sink():
+    """Config.RESULTS 설정에 따른 프로세스 공유 sink (비활성화 시 None)"""
+    global _shared_sink
+    settings = Config.RESULTS
+    if not settings["enabled"]:
+        return None
+    with _shared_lock:
+        if _shared_sink is None:
+            _shared_sink = ResultSink(settings["path"])
+        return _shared_sink
+
+
+@atexit.register
+def close_shared_sink():
+    with _shared_lock:
+        if _shared_sink is not None:
+            _shared_sink.flush()
@@ -0,0 +1,366 @@
+# utils/scenario.py
+"""
+가상 사용자(virtual user) 시나리오 부하 엔진
+- Scenario: 요청 단계(step)의 순서, 단계 사이 think time, 단계 간 데이터 전달(ctx)을 선언
+- ScenarioRunner: asyncio 태스크 하나가 가상 사용자 1명이며, 시나리오를 처음부터 끝까지 반복
+  Stage(users, duration) 목록을 따라 가상 사용자 수를 선형으로 늘리고(ramp up) 줄임(ramp down)
+  줄일 때는 진행 중인 시나리오를 끝낸 가상 사용자부터 종료
+- ScenarioReport: 단계별 / 전체 여정(e2e) 지연 시간 히스토그램과 에러율
+  e2e 지연 시간은 think time을 제외한 시나리오 1회 소요 시간
+
+    journey = (Scenario("purchase")
+               .step("login", "POST", "/auth/login", json=TestData.LOGIN_USER,
+                     extract=lambda body, ctx: ctx.update(token=body["token"]))
+               .step("products", "GET", "/products", headers={"Authorization": "Bearer {token}"},
+                     extract=lambda body, ctx: ctx.update(product_id=body[0]["id"]))
+               .step("cart", "POST", "/carts", json=lambda ctx: {"userId": 1, "products": [...]},
+                     headers={"Authorization": "Bearer {token}"}))
+    report = ScenarioRunner(journey, [Stage(1000, 30), Stage(1000, 60), Stage(0, 10)]).run()
+
+CLI (구매 여정):
+    python -m utils.scenario --users 1000 --ramp-up 30 --hold 60 --ramp-down 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from config.config import Config
+from utils.async_client import AsyncAPIClient
+from utils.histogram import Histogram
+from utils.load_generator import PERCENTILES
+from utils.test_data import TestData
+
+
+class ScenarioError(AssertionError):
+    def __init__(self, step, message):
+        super().__init__(f"{step}: {message}")
+        self.step = step
+
+
+class Step:
+    """
+    path: "/users/{user_id}" (ctx 값으로 format) 또는 callable(ctx)
+    json: payload 또는 callable(ctx)
+    headers: {"Authorization": "Bearer {token}"} (값을 ctx 값으로 format) 또는 callable(ctx)
+    extract(body, ctx): 응답 JSON에서 다음 단계에 필요한 값을 ctx에 저장
+    check(body, ctx): 응답 검증 (AssertionError 발생 시 단계 실패)
+    think: 단계 후 대기 시간 (초) 또는 (최소, 최대)
+    """
+
+    def __init__(self, name, method, path, json=None, headers=None, expect=(200, 201), extract=None, check=None,
+                 think=None):
+        self.name = name
+        self.method = method.upper()
+        self.path = path
+        self.json = json
+        self.headers = headers
+        self.expect = expect
+        self.extract = extract
+        self.check = check
+        self.think = think
+
+    def build(self, ctx):
+        path = self.path(ctx) if callable(self.path) else self.path.format(**ctx)
+        payload = self.json(ctx) if callable(self.json) else self.json
+        if callable(self.headers):
+            headers = self.headers(ctx)
+        elif self.headers is not None:
+            headers = {name: value.format(**ctx) for name, value in self.headers.items()}
+        else:
+            headers = None
+        return path, payload, headers
+
+
+class Scenario:
+    def __init__(self, name, setup=None, think=None):
+        """
+        setup(ctx, rng): 시나리오 시작 시 ctx 초기값 설정 (가상 사용자별 데이터 선택 등)
+        think: 단계 기본 think time (초) 또는 (최소, 최대), 기본값은 Config.SCENARIO['think_time']
+        """
+        self.name = name
+        self.setup = setup
+        self.think = Config.SCENARIO["think_time"] if think is None else think
+        self.steps = []
+
+    def step(self, name, method, path, **options):
+        self.steps.append(Step(name, method, path, **options))
+        return self
+
+    def think_time(self, step, rng):
+        think = self.think if step.think is None else step.think
+        if isinstance(think, (tuple, list)):
+            return rng.uniform(*think)
+        return think
+
+
+class Stage:
+    """duration(초) 동안 가상 사용자 수를 이전 단계의 목표에서 users까지 선형으로 변경"""
+
+    def __init__(self, users, duration):
+        self.users = users
+        self.duration = duration
+
+
+class StepStats:
+    def __init__(self, name):
+        self.name = name
+        self.latencies = Histogram()  # ns
+        self.errors = 0
+        self.error_messages = {}
+
+    @property
+    def count(self):
+        return self.latencies.count
+
+    def record(self, elapsed_ns, error=None):
+        self.latencies.record(elapsed_ns)
+        if error is not None:
+            self.errors += 1
+            self.error_messages[error] = self.error_messages.get(error, 0) + 1
+
+    def summary(self):
+        return {
+            "requests": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "latency": {f"p{p}": self.latencies.percentile(p) / 1e9 for p in PERCENTILES},
+            "top_errors": dict(sorted(self.error_messages.items(), key=lambda kv: -kv[1])[:5]),
+        }
+
+
+class ScenarioReport:
+    def __init__(self, scenario, elapsed, steps, e2e, iterations, failed, peak_users):
+        self.scenario = scenario
+        self.elapsed = elapsed
+        self.steps = {name: stats.summary() for name, stats in steps.items()}
+        self.e2e = e2e.summary()
+        self.iterations = iterations
+        self.failed = failed
+        self.peak_users = peak_users
+
+    @property
+    def error_rate(self):
+        """실패한 시나리오 비율"""
+        return self.failed / self.iterations if self.iterations else 0.0
+
+    @property
+    def throughput(self):
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self):
+        return {
+            "scenario": self.scenario,
+            "elapsed": self.elapsed,
+            "iterations": self.iterations,
+            "failed": self.failed,
+            "error_rate": self.error_rate,
+            "peak_users": self.peak_users,
+            "steps": self.steps,
+            "e2e": self.e2e,
+        }
+
+    def format(self):
+        lines = [
+            f"scenario {self.scenario}: {self.iterations} iterations ({self.throughput:.1f}/s), "
+            f"failed {self.error_rate:.2%}, peak users {self.peak_users}, {self.elapsed:.1f}s",
+            f"{'step':<20}{'requests':>10}{'err%':>8}" + "".join(f"{'p' + str(p):>10}" for p in PERCENTILES),
+        ]
+        for name, s in list(self.steps.items()) + [("(e2e)", self.e2e)]:
+            row = f"{name:<20}{s['requests']:>10}{s['error_rate'] * 100:>8.2f}"
+            row += "".join(f"{s['latency'][f'p{p}'] * 1000:>8.1f}ms" for p in PERCENTILES)
+            lines.append(row)
+        for name, s in self.steps.items():
+            for message, count in s["top_errors"].items():
+                lines.append(f"  {name}: {message} (x{count})")
+        return "\n".join(lines)
+
+
+def _target_users(stages, elapsed):
+    """시작 후 elapsed초 시점의 목표 가상 사용자 수 (None이면 모든 단계 종료)"""
+    previous = 0
+    for stage in stages:
+        if elapsed < stage.duration:
+            return round(previous + (stage.users - previous) * elapsed / stage.duration)
+        elapsed -= stage.duration
+        previous = stage.users
+    return None
+
+
+class ScenarioRunner:
+    def __init__(self, scenario, stages, client=None, seed=None, max_iterations=None):
+        settings = Config.SCENARIO
+        self.scenario = scenario
+        self.stages = list(stages)
+        self.seed = settings["seed"] if seed is None else seed
+        self.max_iterations = max_iterations
+        peak = max((stage.users for stage in self.stages), default=1)
+        self._owns_client = client is None
+        # 가상 사용자 수만큼 커넥션을 열 수 있도록 동시성 제한을 최대 사용자 수로 설정
+        self.client = client or AsyncAPIClient(concurrency=max(peak, 1), cassette=False, resilience=False)
+        self.step_stats = {step.name: StepStats(step.name) for step in scenario.steps}
+        self.e2e = StepStats("e2e")
+        self.iterations = 0
+        self.failed = 0
+        self.peak_users = 0
+
+    async def _run_step(self, step, ctx):
+        path, payload, headers = step.build(ctx)
+        started = time.perf_counter_ns()
+        try:
+            response = await self.client.request(step.method, path, json=payload, headers=headers)
+            if response.status_code not in step.expect:
+                raise ScenarioError(step.name, f"HTTP {response.status_code}")
+            if step.extract is not None or step.check is not None:
+                body = response.json()
+                if step.check is not None:
+                    step.check(body, ctx)
+                if step.extract is not None:
+                    step.extract(body, ctx)
+        except ScenarioError as error:
+            self.step_stats[step.name].record(time.perf_counter_ns() - started, str(error).split(": ", 1)[1])
+            raise
+        except AssertionError as error:
+            self.step_stats[step.name].record(time.perf_counter_ns() - started, f"check failed: {error}")
+            raise ScenarioError(step.name, "check failed") from error
+        except Exception as error:  # 커넥션 오류 / 타임아웃 / 잘못된 응답 본문
+            self.step_stats[step.name].record(time.perf_counter_ns() - started, type(error).__name__)
+            raise ScenarioError(step.name, type(error).__name__) from error
+        self.step_stats[step.name].record(time.perf_counter_ns() - started)
+
+    async def _iteration(self, vu, rng):
+        ctx = {"vu": vu, "iteration": self.iterations}
+        if self.scenario.setup is not None:
+            self.scenario.setup(ctx, rng)
+        started = time.perf_counter_ns()
+        thought = 0.0
+        error = None
+        try:
+            for index, step in enumerate(self.scenario.steps):
+                await self._run_step(step, ctx)
+                if index < len(self.scenario.steps) - 1:
+                    pause = self.scenario.think_time(step, rng)
+                    if pause > 0:
+                        await asyncio.sleep(pause)
+                        thought += pause
+        except ScenarioError as failure:
+            error = failure.step
+        self.iterations += 1
+        self.failed += error is not None
+        self.e2e.record(time.perf_counter_ns() - started - int(thought * 1e9),
+                        None if error is None else f"failed at {error}")
+
+    async def _virtual_user(self, vu, stop):
+        rng = random.Random(self.seed * 1_000_003 + vu)
+        while not stop.is_set():
+            if self.max_iterations is not None and self.iterations >= self.max_iterations:
+                return
+            await self._iteration(vu, rng)
+
+    async def _run(self):
+        tick = Config.SCENARIO["tick"]
+        users = []  # [(task, stop event)]
+        next_vu = 0
+        started = time.perf_counter()
+        while True:
+            target = _target_users(self.stages, time.perf_counter() - started)
+            users = [(task, stop) for task, stop in users if not task.done()]
+            if target is None or (self.max_iterations is not None and self.iterations >= self.max_iterations):
+                break
+            active = [(task, stop) for task, stop in users if not stop.is_set()]
+            if len(active) < target:
+                for _ in range(target - len(active)):
+                    stop = asyncio.Event()
+                    users.append((asyncio.ensure_future(self._virtual_user(next_vu, stop)), stop))
+                    next_vu += 1
+            elif len(active) > target:
+                # 가장 최근에 시작한 사용자부터 현재 시나리오가 끝나면 종료
+                for _, stop in active[target:]:
+                    stop.set()
+            self.peak_users = max(self.peak_users, sum(1 for _, stop in users if not stop.is_set()))
+            await asyncio.sleep(tick)
+
+        for _, stop in users:
+            stop.set()
+        if users:
+            _, pending = await asyncio.wait([task for task, _ in users], timeout=Config.SCENARIO["grace_period"])
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        elapsed = time.perf_counter() - started
+        return ScenarioReport(self.scenario.name, elapsed, self.step_stats, self.e2e,
+                              self.iterations, self.failed, self.peak_users)
+
+    def run(self):
+        try:
+            return self.client.run(self._run())
+        finally:
+            if self._owns_client:
+                self.client.close()
+
+
+def _assert_equal(actual, expected, what):
+    assert actual == expected, f"{what} {actual} != {expected}"
+
+
+def _check_cart(body, ctx):
+    assert body.get("userId") == ctx["user_id"], f"userId {body.get('userId')} != {ctx['user_id']}"
+    assert [line["productId"] for line in body.get("products", [])] == [ctx["product_id"]]
+
+
+# 로그인 단계에서 꺼낸 토큰으로 이후 단계 인증
+_BEARER = {"Authorization": "Bearer {token}"}
+
+
+def purchase_journey(think=None):
+    """
+    TC-E2E-01 구매 흐름 + 로그인: 로그인 -> 사용자 확인 -> 상품 목록 -> 장바구니 생성 -> 장바구니 검증
+    로그인 이후 단계는 로그인 응답의 토큰을 Authorization: Bearer 헤더로 전송
+    """
+
+    def setup(ctx, rng):
+        ctx["user_id"] = rng.randint(1, 10)
+        ctx["rng"] = rng
+
+    return (
+        Scenario("purchase", setup=setup, think=think)
+        .step("login", "POST", "/auth/login", json=TestData.LOGIN_USER,
+              extract=lambda body, ctx: ctx.update(token=body["token"]))
+        .step("user", "GET", "/users/{user_id}", headers=_BEARER, expect=(200,),
+              check=lambda body, ctx: _assert_equal(body.get("id"), ctx["user_id"], "user id"))
+        .step("products", "GET", "/products", headers=_BEARER, expect=(200,),
+              extract=lambda body, ctx: ctx.update(product_id=ctx["rng"].choice(body)["id"]))
+        .step("create_cart", "POST", "/carts",
+              json=lambda ctx: {"userId": ctx["user_id"], "date": "2026-01-13",
+                                "products": [{"productId": ctx["product_id"], "quantity": 1}]},
+              headers=_BEARER, check=_check_cart)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Virtual-user purchase journey load test")
+    parser.add_argument("--users", type=int, default=100, help="최대 가상 사용자 수")
+    parser.add_argument("--ramp-up", type=float, default=10, help="초")
+    parser.add_argument("--hold", type=float, default=30, help="초")
+    parser.add_argument("--ramp-down", type=float, default=5, help="초")
+    parser.add_argument("--think", type=float, nargs=2, default=None, metavar=("MIN", "MAX"),
+                        help="단계 사이 think time 범위 (초)")
+    parser.add_argument("--base-url", default=None, help="기본값: Config.BASE_URL")
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    if args.base_url:
+        Config.BASE_URL = args.base_url
+    stages = [Stage(args.users, args.ramp_up), Stage(args.users, args.hold), Stage(0, args.ramp_down)]
+    report = ScenarioRunner(purchase_journey(think=tuple(args.think) if args.think else None), stages).run()
+    print(report.format())
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
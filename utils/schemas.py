@@ -0,0 +1,178 @@
+# utils/schemas.py
+"""
+응답 스키마 선언 / 검증 함수 컴파일
+- 스키마는 dict로 한 번만 선언 (필드 -> 타입, 중첩 dict, [원소 스키마], Optional(...))
+- Schema 생성 시 스키마를 해석해 전용 Python 검증 함수 소스를 만들고 compile
+  (원소마다 스키마를 해석하지 않으므로 대용량 목록에서도 원소당 비용이 작음)
+- 오류는 예외 없이 경로와 함께 모두 수집: "$[3].rating.rate: expected number, got str"
+
+    errors = PRODUCT.check_many(response.json())
+    assert not errors, "\\n".join(errors)
+
+Schema 인스턴스는 validator로 바로 쓸 수 있음: client.validate_stream("/products", PRODUCT)
+"""
+
+NUMBER = (int, float)
+
+_TYPE_NAMES = {int: "integer", float: "float", str: "string", bool: "boolean", NUMBER: "number"}
+
+
+class Optional:
+    """없어도 되는 필드 (있으면 spec으로 검증)"""
+
+    def __init__(self, spec):
+        self.spec = spec
+
+
+class SchemaError(AssertionError):
+    def __init__(self, name, errors):
+        super().__init__(f"{name} schema violations:\n" + "\n".join(errors))
+        self.errors = errors
+
+
+def _type_name(value):
+    if value is None:
+        return "null"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+class _Compiler:
+    """스키마 -> 검증 함수 소스 코드"""
+
+    def __init__(self):
+        self.lines = []
+        self.namespace = {"_MISSING": object(), "_type_name": _type_name}
+        self._counter = 0
+
+    def _name(self, prefix):
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _emit(self, depth, line):
+        self.lines.append("    " * depth + line)
+
+    def _error(self, depth, path, message):
+        # 경로 문자열은 오류가 났을 때만 만들어짐
+        self._emit(depth, f"errors.append({path} + {message!r})")
+
+    def compile(self, name, spec):
+        self._emit(0, f"def validate_{name}(value, path, errors):")
+        self.value(1, "value", "path", spec)
+        source = "\n".join(self.lines) + "\n"
+        exec(compile(source, f"<schema {name}>", "exec"), self.namespace)
+        return self.namespace[f"validate_{name}"], source
+
+    def value(self, depth, var, path, spec):
+        if isinstance(spec, dict):
+            self._emit(depth, f"if type({var}) is not dict:")
+            self._emit(depth + 1, f"errors.append({path} + ': expected object, got ' + _type_name({var}))")
+            self._emit(depth, "else:")
+            self.fields(depth + 1, var, path, spec)
+        elif isinstance(spec, list):
+            if len(spec) != 1:
+                raise ValueError("List schema must have exactly one item schema")
+            index, item = self._name("i"), self._name("v")
+            self._emit(depth, f"if type({var}) is not list:")
+            self._emit(depth + 1, f"errors.append({path} + ': expected array, got ' + _type_name({var}))")
+            self._emit(depth, "else:")
+            self._emit(depth + 1, f"for {index}, {item} in enumerate({var}):")
+            self.value(depth + 2, item, f"{path} + '[' + str({index}) + ']'", spec[0])
+        elif isinstance(spec, tuple) or isinstance(spec, type):
+            types = spec if isinstance(spec, tuple) else (spec,)
+            # JSON 디코딩 결과는 정확한 타입이므로 isinstance 대신 type() 비교 (bool이 int로 통과하지 않도록)
+            check = " and ".join(f"type({var}) is not {self._bind(t)}" for t in types)
+            expected = _TYPE_NAMES.get(spec, " or ".join(t.__name__ for t in types))
+            self._emit(depth, f"if {check}:")
+            self._emit(depth + 1, f"errors.append({path} + ': expected {expected}, got ' + _type_name({var}))")
+        else:
+            raise TypeError(f"Unsupported schema spec: {spec!r}")
+
+    def fields(self, depth, var, path, spec):
+        for field, field_spec in spec.items():
+            required = not isinstance(field_spec, Optional)
+            if not required:
+                field_spec = field_spec.spec
+            item = self._name("v")
+            field_path = f"{path} + {'.' + field!r}"
+            self._emit(depth, f"{item} = {var}.get({field!r}, _MISSING)")
+            self._emit(depth, f"if {item} is _MISSING:")
+            if required:
+                self._error(depth + 1, field_path, ": missing required field")
+            else:
+                self._emit(depth + 1, "pass")
+            self._emit(depth, "else:")
+            self.value(depth + 1, item, field_path, field_spec)
+
+    def _bind(self, type_):
+        name = self._name("T")
+        self.namespace[name] = type_
+        return name
+
+
+class Schema:
+    def __init__(self, name, spec):
+        self.name = name
+        self.spec = spec
+        self._validate, self.source = _Compiler().compile(name.lower(), spec)
+
+    def check(self, value, path="$"):
+        """오류 메시지 목록 (유효하면 빈 리스트)"""
+        errors = []
+        self._validate(value, path, errors)
+        return errors
+
+    def check_many(self, items, path="$"):
+        """목록의 원소마다 검증, 오류 경로에 원소 인덱스 포함"""
+        errors = []
+        validate = self._validate
+        for index, item in enumerate(items):
+            validate(item, f"{path}[{index}]", errors)
+        return errors
+
+    def validate(self, value):
+        errors = self.check(value)
+        if errors:
+            raise SchemaError(self.name, errors)
+
+    __call__ = validate
+
+    def __repr__(self):
+        return f"<Schema {self.name}>"
+
+
+PRODUCT = Schema("Product", {
+    "id": int,
+    "title": str,
+    "price": NUMBER,
+    "description": str,
+    "category": str,
+    "image": str,
+    "rating": {"rate": NUMBER, "count": int},
+})
+
+CART = Schema("Cart", {
+    "id": int,
+    "userId": int,
+    "date": str,
+    "products": [{"productId": int, "quantity": int}],
+})
+
+USER = Schema("User", {
+    "id": int,
+    "email": str,
+    "username": str,
+    "password": str,
+    "name": {"firstname": str, "lastname": str},
+    "address": {
+        "city": str,
+        "street": str,
+        "number": int,
+        "zipcode": str,
+        "geolocation": {"lat": str, "long": str},
+    },
+    "phone": str,
+})
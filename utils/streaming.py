@@ -0,0 +1,125 @@
+# utils/streaming.py
+"""
+대용량 JSON 배열 응답 스트리밍 파싱 / 검증
+- 바이트 청크가 도착하는 대로 배열 원소를 하나씩 디코딩 (전체 본문을 메모리에 올리지 않음)
+- 원소마다 validator 실행, fail_fast면 첫 번째 잘못된 원소에서 즉시 실패
+"""
+
+import codecs
+import json
+import re
+
+from config.config import Config
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_END = frozenset(" \t\n\r,]")
+_decoder = json.JSONDecoder()
+
+
+class StreamValidationError(AssertionError):
+    """스트리밍 검증 중 잘못된 원소를 발견한 경우 (pytest에서 일반 assert 실패처럼 표시)"""
+
+    def __init__(self, index, item, message):
+        super().__init__(f"item[{index}]: {message}")
+        self.index = index
+        self.item = item
+
+
+def iter_json_array(chunks, max_item_bytes=None):
+    """
+    바이트 청크 iterable에서 최상위 JSON 배열의 원소를 순서대로 yield
+    원소 하나가 max_item_bytes보다 커지면 ValueError (잘못된 JSON으로 버퍼가 무한히 커지는 것 방지)
+    크기는 디코딩한 문자 수가 아니라 UTF-8 바이트 수 (멀티바이트 문자는 한 글자가 2~4바이트)
+    """
+    max_item_bytes = max_item_bytes or Config.STREAMING["max_item_bytes"]
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer, pos, state = "", 0, "start"
+    pending = 0  # 아직 처리하지 않은 부분(버퍼 + 디코더에 남은 불완전한 문자)의 바이트 수
+    eof = False
+    chunks = iter(chunks)
+    while not eof:
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buffer += text.decode(b"", final=True)
+        else:
+            buffer += text.decode(chunk)
+            pending += len(chunk)
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            if state == "start":
+                if char != "[":
+                    raise ValueError("Response body is not a JSON array")
+                pos, state = pos + 1, "first"
+            elif state == "first" and char == "]":
+                pos, state = pos + 1, "done"
+            elif state in ("first", "value"):
+                try:
+                    item, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    break  # 원소가 아직 다 도착하지 않음
+                # 숫자는 다음 청크에서 이어질 수 있으므로("109." + "9") 뒤에 구분자가 올 때까지 대기
+                if type(item) in (int, float) and not eof and (
+                        end == len(buffer) or buffer[end] not in _NUMBER_END):
+                    break
+                yield item
+                pos, state = end, "separator"
+            elif state == "separator":
+                if char == ",":
+                    pos, state = pos + 1, "value"
+                elif char == "]":
+                    pos, state = pos + 1, "done"
+                else:
+                    raise ValueError(f"Expected ',' or ']' at offset {pos}")
+            else:
+                raise ValueError("Unexpected data after JSON array")
+
+        # 처리한 부분은 버려서 버퍼 크기를 원소 하나 수준으로 유지
+        if pos:
+            # 처리한 부분의 바이트 수만 세므로 원소 하나가 여러 청크에 걸쳐도 버퍼 전체를 다시 인코딩하지 않음
+            done = buffer[:pos]
+            pending -= len(done) if done.isascii() else len(done.encode("utf-8"))
+            buffer, pos = buffer[pos:], 0
+        if pending > max_item_bytes:
+            raise ValueError(f"JSON array item exceeds {max_item_bytes} bytes")
+
+    if state != "done":
+        raise ValueError("Unexpected end of JSON array")
+
+
+class StreamReport:
+    def __init__(self):
+        self.count = 0
+        self.errors = []  # (index, message)
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __repr__(self):
+        return f"<StreamReport count={self.count} errors={len(self.errors)}>"
+
+
+def validate_items(items, *validators, fail_fast=True):
+    """
+    원소마다 validator(item)를 실행 (validator는 assert로 검증)
+    fail_fast=True면 첫 실패에서 StreamValidationError, False면 모든 실패를 모아 StreamReport로 반환
+    """
+    report = StreamReport()
+    for index, item in enumerate(items):
+        report.count += 1
+        for validator in validators:
+            try:
+                validator(item)
+            except AssertionError as error:
+                message = str(error) or f"{getattr(validator, '__name__', 'validator')} failed"
+                if fail_fast:
+                    raise StreamValidationError(index, item, message) from error
+                report.errors.append((index, message))
+    return report
@@ -1,4 +1,5 @@
 # utils/test_data.py
+import copy
 
 class TestData:
     #상품 관련 테스트 데이터
@@ -80,6 +81,19 @@ class TestData:
     }
 
 
+    # 요청 payload용 사본 (중첩된 name/address/products까지 복사하므로 수정해도 원본이 바뀌지 않음)
+    @classmethod
+    def valid_product(cls):
+        return copy.deepcopy(cls.VALID_PRODUCT)
+
+    @classmethod
+    def valid_cart(cls):
+        return copy.deepcopy(cls.VALID_CART)
+
+    @classmethod
+    def valid_user(cls):
+        return copy.deepcopy(cls.VALID_USER)
+
     @classmethod
     def get_test_user(cls, username):
         """username으로 사용자 조회"""
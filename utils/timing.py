@@ -0,0 +1,291 @@
+# utils/timing.py
+"""
+APIClient 요청 단계별(phase) 지연 시간 측정
+- time.perf_counter_ns() 기반 단조(monotonic) 나노초 측정
+- 단계: dns / connect / tls / ttfb / download / decode / total
+  (재사용된 커넥션은 dns/connect/tls 단계가 기록되지 않음)
+- 엔드포인트별 단계 히스토그램으로 집계 (utils/histogram.py)
+- 새 커넥션은 DNS 캐시 / TLS 세션 재개를 사용 (utils/connection_cache.py)
+"""
+
+import re
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError
+from urllib3.util.ssl_ import resolve_cert_reqs
+
+from config.config import Config
+from utils.connection_cache import dns_cache, get_ssl_context, tls_sessions
+from utils.histogram import Histogram
+
+PHASES = ("dns", "connect", "tls", "ttfb", "download", "decode", "total")
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_local = threading.local()
+
+
+def endpoint_key(method, path):
+    """GET /products/3?limit=5 -> GET /products/{id}"""
+    path = path.split("?", 1)[0]
+    return f"{method.upper()} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+def current_timing():
+    return getattr(_local, "timing", None)
+
+
+class RequestTiming:
+    """요청 1건의 단계별 소요 시간 (ns)"""
+
+    def __init__(self):
+        self.phases = {}
+        self.started = time.perf_counter_ns()
+        self.dns_cached = False
+        self.tls_resumed = False
+        self._headers_at = None
+
+    @contextmanager
+    def activate(self):
+        # 같은 스레드에서 열리는 커넥션이 dns/connect/tls 시간을 기록할 수 있도록 등록
+        previous = current_timing()
+        _local.timing = self
+        try:
+            yield self
+        finally:
+            _local.timing = previous
+
+    def add(self, phase, elapsed_ns):
+        self.phases[phase] = self.phases.get(phase, 0) + elapsed_ns
+
+    def headers_received(self):
+        self._headers_at = time.perf_counter_ns()
+        handshake = sum(self.phases.get(p, 0) for p in ("dns", "connect", "tls"))
+        self.phases["ttfb"] = self._headers_at - self.started - handshake
+
+    def body_received(self):
+        now = time.perf_counter_ns()
+        self.phases["download"] = now - self._headers_at
+        self.phases["total"] = now - self.started
+
+    def as_seconds(self):
+        return {phase: ns / 1e9 for phase, ns in self.phases.items()}
+
+
+class _TimedConnectionMixin:
+    """
+    urllib3 커넥션의 DNS 조회와 TCP 연결을 분리해서 측정
+    조회한 주소를 순서대로 시도하므로 urllib3 기본 동작(IPv6/IPv4 fallback)과 동일
+    """
+
+    def _new_conn(self):
+        timing = current_timing()
+        host = self._dns_host
+        started = time.perf_counter_ns()
+        addresses, cached = dns_cache.resolve(host, self.port, self._resolve)
+        resolved = time.perf_counter_ns()
+        self._dns_ns = resolved - started
+        last_error = None
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except ConnectTimeoutError as error:  # NewConnectionError 포함
+                    last_error = error
+            else:
+                raise last_error
+        finally:
+            self._dns_host = host
+        self._connect_ns = time.perf_counter_ns() - resolved
+        if timing is not None:
+            timing.add("dns", self._dns_ns)
+            timing.add("connect", self._connect_ns)
+            timing.dns_cached = cached
+        return sock
+
+    def _resolve(self, host, port):
+        try:
+            infos = socket.getaddrinfo(host.strip("[]"), port, 0, socket.SOCK_STREAM)
+        except socket.gaierror as error:
+            raise NameResolutionError(host, self, error) from error
+        addresses = []
+        for info in infos:
+            address = info[4][0]
+            if address not in addresses:
+                addresses.append(address)
+        return addresses or [host]
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    _shared_context = False  # ssl_context를 get_ssl_context()에서 가져왔는지 (직접 전달한 context는 그대로 사용)
+
+    def connect(self):
+        if self.ssl_context is None or self._shared_context:
+            # 이 커넥션의 검증 설정(verify / CA 번들 / 클라이언트 인증서)에 맞는 공유 context
+            context = get_ssl_context(
+                resolve_cert_reqs(self.cert_reqs),
+                not (self.assert_fingerprint or self.assert_hostname or self.assert_hostname is False),
+                self.ca_certs, self.ca_cert_dir, self.ca_cert_data,
+                self.cert_file, self.key_file, self.key_password,
+            )
+            if context is not None:
+                self.ssl_context = context
+                self._shared_context = True
+        timing = current_timing()
+        started = time.perf_counter_ns()
+        self._dns_ns = self._connect_ns = 0
+        super().connect()
+        # TLS 핸드셰이크 = 전체 connect 시간 - (DNS + TCP 연결)
+        tls_ns = time.perf_counter_ns() - started - self._dns_ns - self._connect_ns
+        if timing is not None:
+            timing.add("tls", tls_ns)
+            timing.tls_resumed = self.sock.session_reused
+
+    def getresponse(self):
+        response = super().getresponse()
+        # TLS 1.3 세션 티켓은 handshake 이후에 도착하므로 응답을 받은 뒤 세션을 저장
+        if Config.CONNECTION_CACHE["tls_resumption"] and self.sock is not None:
+            tls_sessions.save_from(self.sock)
+        return response
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """단계별 측정 커넥션 + 세션 재개 SSLContext를 사용하는 HTTPAdapter"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class LatencyRecorder:
+    """엔드포인트 -> 단계 -> Histogram (스레드 안전, merge 가능)"""
+
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, phases):
+        with self._lock:
+            histograms = self.endpoints.setdefault(endpoint, {})
+            for phase, elapsed_ns in phases.items():
+                histograms.setdefault(phase, Histogram()).record(elapsed_ns)
+
+    def merge(self, other):
+        with self._lock:
+            for endpoint, phases in other.endpoints.items():
+                histograms = self.endpoints.setdefault(endpoint, {})
+                for phase, histogram in phases.items():
+                    histograms.setdefault(phase, Histogram(histogram.precision_bits)).merge(histogram)
+        return self
+
+    def clear(self):
+        with self._lock:
+            self.endpoints.clear()
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                endpoint: {phase: h.to_dict() for phase, h in phases.items()}
+                for endpoint, phases in self.endpoints.items()
+            }
+
+    @classmethod
+    def from_dict(cls, data):
+        recorder = cls()
+        for endpoint, phases in data.items():
+            recorder.endpoints[endpoint] = {phase: Histogram.from_dict(h) for phase, h in phases.items()}
+        return recorder
+
+    def format(self):
+        """엔드포인트별 total p50/p99와 단계별 평균(ms)"""
+        header = f"{'endpoint':<36}{'count':>7}{'p50':>9}{'p99':>9}" + "".join(
+            f"{phase:>10}" for phase in PHASES if phase != "total")
+        lines = [header]
+        for endpoint in sorted(self.endpoints):
+            phases = self.endpoints[endpoint]
+            total = phases.get("total", Histogram())
+            row = (f"{endpoint:<36}{total.count:>7}{total.percentile(50) / 1e6:>7.1f}ms"
+                   f"{total.percentile(99) / 1e6:>7.1f}ms")
+            for phase in PHASES:
+                if phase == "total":
+                    continue
+                histogram = phases.get(phase)
+                row += f"{histogram.mean / 1e6:>8.2f}ms" if histogram else f"{'-':>10}"
+            lines.append(row)
+        return "\n".join(lines)
+
+
+class ConnectionStats:
+    """
+    커넥션 재사용 통계 (스레드 안전)
+    요청 중 connect 단계가 기록되면 새 커넥션, 아니면 keep-alive로 재사용된 커넥션
+    새 커넥션은 DNS 캐시 사용 여부 / TLS 세션 재개(짧은 handshake) 여부도 집계
+    """
+
+    FIELDS = ("requests", "new_connections", "reused", "tls_handshakes", "tls_resumed",
+              "dns_cached", "handshake_ns")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def record(self, phases, tls_resumed=False, dns_cached=False):
+        with self._lock:
+            self._counts["requests"] += 1
+            if "connect" in phases:
+                self._counts["new_connections"] += 1
+                self._counts["handshake_ns"] += phases["connect"] + phases.get("tls", 0)
+                self._counts["dns_cached"] += bool(dns_cached)
+                if "tls" in phases:
+                    self._counts["tls_handshakes"] += 1
+                    self._counts["tls_resumed"] += bool(tls_resumed)
+            else:
+                self._counts["reused"] += 1
+
+    def merge(self, counts):
+        with self._lock:
+            for field in self.FIELDS:
+                self._counts[field] += counts.get(field, 0)
+        return self
+
+    def to_dict(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def summary(self):
+        counts = self.to_dict()
+        new = counts["new_connections"]
+        mean_handshake_ns = counts["handshake_ns"] / new if new else 0
+        counts["handshakes_avoided"] = counts["reused"]
+        counts["tls_full"] = counts["tls_handshakes"] - counts["tls_resumed"]
+        counts["reuse_ratio"] = counts["reused"] / counts["requests"] if counts["requests"] else 0.0
+        # 재사용된 요청마다 평균 handshake(TCP connect + TLS) 비용을 절약한 것으로 추정
+        counts["estimated_saved_ms"] = counts["reused"] * mean_handshake_ns / 1e6
+        return counts
+
+
+# 프로세스 전체에서 사용하는 기본 recorder / 커넥션 통계
+recorder = LatencyRecorder()
+connection_stats = ConnectionStats()